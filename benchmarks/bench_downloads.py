@@ -0,0 +1,77 @@
+"""
+Benchmark: a 10k-filing document.xml run through DownloadManager against a simulated server.
+
+The server answers from memory after a fixed latency, so the numbers show
+the manager's own overhead, concurrency and store layout rather than DART's
+speed. About 5% of the receipts share content with another receipt, and 2%
+have no document.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_downloads.py [--filings 10000] [--concurrency 8] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+
+import httpx
+
+from dart_client import DartAPIClient
+from dart_client.downloads import DownloadManager
+from dart_client.store import ContentStore
+
+MISSING = '<?xml version="1.0" encoding="UTF-8"?><result><status>014</status><message>-</message></result>'
+
+
+def synthetic_archives(filings: int, min_kib: int, max_kib: int, seed: int = 0) -> dict[str, bytes | None]:
+    rng = random.Random(seed)
+    archives: dict[str, bytes | None] = {}
+    previous = b""
+    for i in range(filings):
+        rcept_no = f"2024{i // 400 + 1:04d}{i:06d}"
+        roll = rng.random()
+        if roll < 0.02:
+            archives[rcept_no] = None
+        elif roll < 0.07 and previous:
+            archives[rcept_no] = previous  # e.g. a report and its exchange copy
+        else:
+            previous = b"PK\x03\x04" + rng.randbytes(rng.randint(min_kib, max_kib) * 1024)
+            archives[rcept_no] = previous
+    return archives
+
+
+async def run(args: argparse.Namespace) -> None:
+    archives = synthetic_archives(args.filings, args.min_kib, args.max_kib)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(args.latency)
+        body = archives[request.url.params["rcept_no"]]
+        if body is None:
+            return httpx.Response(200, content=MISSING.encode(), headers={"content-type": "application/xml"})
+        return httpx.Response(200, content=body, headers={"content-type": "application/zip"})
+
+    with tempfile.TemporaryDirectory() as root:
+        client = DartAPIClient(api_key="benchmark", requests_per_minute=10**9)
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            manager = DownloadManager(client, ContentStore(root), concurrency=args.concurrency)
+            manager.add(archives)
+            first = await manager.run()
+            print("first run: ", first.summary())
+            manager.add(archives)
+            second = await manager.run()
+            print("second run:", second.summary())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filings", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated server latency in seconds")
+    parser.add_argument("--min-kib", type=int, default=4)
+    parser.add_argument("--max-kib", type=int, default=40)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: event-loop lag while get_corp_code() parses a synthetic corpCode.xml ZIP.
+
+A ticker task sleeps in short intervals and records how late it wakes up;
+its worst wake-up delay is how long any other coroutine (a websocket, a
+health check, other requests) would have been stalled. The same ZIP is
+parsed inline, in a thread pool and in a process pool.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_event_loop_lag.py [--companies 100000] [--tick 0.005]
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import time
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+import httpx
+
+from dart_client import DartAPIClient
+
+
+def synthetic_corp_code_zip(companies: int) -> bytes:
+    rows = []
+    for i in range(companies):
+        stock_code = f"{i:06d}" if i % 8 == 0 else " "
+        rows.append(
+            f"<list><corp_code>{i:08d}</corp_code><corp_name>회사{i}</corp_name>"
+            f"<stock_code>{stock_code}</stock_code><modify_date>20240101</modify_date></list>"
+        )
+    xml = '<?xml version="1.0" encoding="UTF-8"?>\n<result>' + "".join(rows) + "</result>"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("CORPCODE.xml", xml.encode("utf-8"))
+    return buffer.getvalue()
+
+
+async def measure(
+    body: bytes, tick: float, executor: Optional[Executor], threshold: Optional[int]
+) -> tuple[float, list[float], int]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"content-type": "application/zip"})
+
+    client = DartAPIClient(api_key="benchmark", executor=executor, offload_threshold=threshold)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            lags.append(time.perf_counter() - start - tick)
+
+    async with client:
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(tick * 4)
+        start = time.perf_counter()
+        corp_codes = await client.get_corp_code()
+        elapsed = time.perf_counter() - start
+        done.set()
+        await task
+    return elapsed, lags, len(corp_codes)
+
+
+def report(name: str, elapsed: float, lags: list[float], count: int) -> None:
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[min(int(len(lags_ms) * 0.99), len(lags_ms) - 1)]
+    print(
+        f"{name:<8} {count} companies in {elapsed:6.2f}s | loop lag: max {lags_ms[-1]:8.1f} ms, "
+        f"p99 {p99:7.1f} ms, median {statistics.median(lags_ms):5.1f} ms, {len(lags_ms)} ticks"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    body = synthetic_corp_code_zip(args.companies)
+    print(f"corpCode ZIP: {len(body) / 2**20:.1f} MiB, {args.companies} companies, tick {args.tick * 1000:.0f} ms")
+
+    report("inline", *await measure(body, args.tick, None, None))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        report("thread", *await measure(body, args.tick, pool, 0))
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        # Start the worker first so its startup is not counted
+        await asyncio.get_running_loop().run_in_executor(pool, int)
+        report("process", *await measure(body, args.tick, pool, 0))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=100_000)
+    parser.add_argument("--tick", type=float, default=0.005, help="Ticker interval in seconds")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
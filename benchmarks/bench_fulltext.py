@@ -0,0 +1,97 @@
+"""
+Benchmark: FilingIndex build and query times over several years of synthetic filings.
+
+Sections are filler text of random Hangul words, with disclosure terms
+mixed in at a low rate so that each query term matches a few percent of
+the chunks, roughly as in real filings.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_fulltext.py [--filings 10000] [--sections 5] [--words 150]
+"""
+import argparse
+import io
+import random
+import statistics
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from dart_client.fulltext import FilingIndex
+from dart_client.models.disclosure import Disclosure
+
+VOCABULARY = (
+    "당사는 회사의 최대주주 변경 전환사채 신주인수권부사채 유상증자 무상증자 감자 합병 분할 자기주식 취득 처분 "
+    "이사회 결의 주주총회 소집 공시 정정 투자 종속회사 지배회사 연결재무제표 매출액 영업이익 당기순이익 "
+    "배당 결정 타법인 주식 양수 양도 소송 제기 횡령 배임 혐의 발생 단일판매 공급계약 체결 해지 "
+    "사채권자 만기 이자율 전환가액 조정 발행 목적 운영자금 시설자금 채무상환 자금 조달 기준일 예정일"
+).split()
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주"
+
+
+def filler_words(rng: random.Random, count: int) -> list[str]:
+    return ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(count)]
+
+
+TITLES = ("1. 발행 개요", "2. 주요 내용", "3. 이사회 결의", "4. 기타 투자판단에 참고할 사항", "5. 변경 내역")
+
+
+def synthetic_filing(rng: random.Random, fillers: list[str], sections: int, words: int) -> bytes:
+    parts = []
+    for s in range(sections):
+        text = [rng.choice(VOCABULARY) if rng.random() < 0.002 else rng.choice(fillers) for _ in range(words)]
+        parts.append(f"<SECTION-1><TITLE>{TITLES[s % len(TITLES)]}</TITLE><P>{' '.join(text)}</P></SECTION-1>")
+    body = "".join(parts)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("document.xml", f"<DOCUMENT><BODY>{body}</BODY></DOCUMENT>".encode())
+    return buffer.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filings", type=int, default=10_000)
+    parser.add_argument("--sections", type=int, default=5)
+    parser.add_argument("--words", type=int, default=150)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    fillers = filler_words(rng, 50_000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "fulltext.sqlite"
+        index = FilingIndex(path)
+        disclosures = []
+        start = time.perf_counter()
+        for i in range(args.filings):
+            # Spread over five years
+            rcept_dt = f"{2020 + i * 5 // args.filings}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+            rcept_no = f"{rcept_dt}{i:06d}"
+            disclosures.append(Disclosure(
+                corp_code=f"{rng.randrange(2500):08d}", corp_name="회사", stock_code=None, corp_cls="Y",
+                report_nm="주요사항보고서", rcept_no=rcept_no, flr_nm="-", rcept_dt=rcept_dt, rm="",
+            ))
+            index.index_archive(rcept_no, synthetic_filing(rng, fillers, args.sections, args.words), commit=False)
+        index.add_disclosures(disclosures)
+        build = time.perf_counter() - start
+        stats = index.stats()
+        print(f"indexed {stats['filings']:,} filings / {stats['chunks']:,} chunks in {build:.1f}s "
+              f"({stats['filings'] / build:.0f} filings/s), {path.stat().st_size / 2**20:.0f} MiB on disk")
+
+        for query, filters in (
+            ("전환사채", {}),
+            ("최대주주 변경", {}),
+            ("유상증자", {"bgn_de": "20230101", "end_de": "20231231"}),
+            ("횡령", {"corp_code": "00000042"}),
+        ):
+            timings = []
+            for _ in range(20):
+                start = time.perf_counter()
+                hits = index.search(query, limit=20, **filters)
+                timings.append(time.perf_counter() - start)
+            print(f"{query!r:<18} {str(filters):<48} {len(hits):>2} hits  "
+                  f"median {statistics.median(timings) * 1000:6.2f} ms")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
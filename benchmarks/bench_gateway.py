@@ -0,0 +1,135 @@
+"""
+Benchmark: heavy fan-in of many services through one DartGateway vs. each service calling the API directly.
+
+A local threaded HTTP server stands in for opendart (fixed latency, counts
+the calls it receives). Every service is a DartAPIClient issuing requests
+over a skewed set of companies (a few hot ones, a long tail), as many
+internal services looking at the same market do. Directly, each service
+has its own limiter, so together they send up to services x budget to the
+key. Through the gateway, the calls share one cache, one limiter and
+coalescing of identical requests in flight.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_gateway.py [--services 20] [--requests 100] [--companies 500] [--rate 50]
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from dart_client import DartAPIClient
+from dart_client.gateway import DartGateway
+
+
+def start_upstream(latency: float) -> tuple[ThreadingHTTPServer, list[float]]:
+    hits: list[float] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            hits.append(time.monotonic())
+            time.sleep(latency)
+            corp_code = self.path.partition("corp_code=")[2][:8]
+            body = json.dumps({"status": "000", "message": "정상", "corp_code": corp_code}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, hits
+
+
+def workload(args: argparse.Namespace) -> list[list[str]]:
+    """Corp codes requested by each service; Zipf-like popularity."""
+    rng = random.Random(42)
+    companies = [f"{i:08d}" for i in range(args.companies)]
+    weights = [1 / (rank + 1) for rank in range(args.companies)]
+    return [rng.choices(companies, weights, k=args.requests) for _ in range(args.services)]
+
+
+async def run_services(
+    base_url: str, api_key: Optional[str], services: list[list[str]], rate: float, concurrency: int
+) -> list[float]:
+    latencies: list[float] = []
+
+    async def service(corp_codes: list[str]) -> None:
+        limiter_kwargs = {"requests_per_minute": int(rate * 60)}
+        async with DartAPIClient(api_key=api_key, base_url=base_url, **limiter_kwargs) as client:
+            queue = list(corp_codes)
+
+            async def worker() -> None:
+                while queue:
+                    corp_code = queue.pop()
+                    start = time.perf_counter()
+                    await client.get_company(corp_code=corp_code)
+                    latencies.append(time.perf_counter() - start)
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    await asyncio.gather(*(service(corp_codes) for corp_codes in services))
+    return latencies
+
+
+def report(name: str, total: int, elapsed: float, latencies: list[float], hits: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    span = hits[-1] - hits[0] if len(hits) > 1 else 0.0
+    print(
+        f"{name:<8} {total} requests in {elapsed:6.2f}s ({total / elapsed:7.1f}/s), "
+        f"p50 {quantiles[49] * 1000:6.1f} ms, p99 {quantiles[98] * 1000:7.1f} ms; "
+        f"upstream {len(hits)} calls at {len(hits) / span if span else 0:6.1f}/s"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    upstream, hits = start_upstream(args.latency)
+    upstream_url = f"http://127.0.0.1:{upstream.server_address[1]}/api"
+    services = workload(args)
+    total = args.services * args.requests
+    distinct = len({c for corp_codes in services for c in corp_codes})
+    print(f"{args.services} services x {args.requests} requests, {distinct} distinct companies, budget {args.rate}/s")
+
+    # Direct: every service has its own key budget, all hitting the same API
+    hits.clear()
+    start = time.perf_counter()
+    latencies = await run_services(upstream_url, "benchmark", services, args.rate, args.concurrency)
+    report("direct", total, time.perf_counter() - start, latencies, hits)
+
+    # Through one gateway with one budget
+    hits.clear()
+    gateway = DartGateway(api_key="benchmark", requests_per_minute=int(args.rate * 60), upstream_url=upstream_url)
+    await gateway.start(port=0)
+    start = time.perf_counter()
+    latencies = await run_services(gateway.url, None, services, 10**6, args.concurrency)
+    report("gateway", total, time.perf_counter() - start, latencies, hits)
+    print(f"         {gateway.stats.summary()}")
+    await gateway.close()
+    upstream.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--services", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=100, help="Requests per service")
+    parser.add_argument("--companies", type=int, default=500, help="Size of the company universe")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight per service")
+    parser.add_argument("--rate", type=float, default=50, help="Request budget per second of one key")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated API latency in seconds")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
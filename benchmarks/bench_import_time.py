@@ -0,0 +1,84 @@
+"""
+Benchmark: cold import time of dart_client entry points, measured with `python -X importtime`.
+
+Each statement runs in fresh interpreters (--runs times) and the median
+cumulative import time of the dart_client modules is compared against a
+budget. The script exits with status 1 when a budget is exceeded, so it can
+guard against regressions such as an eager import of pydantic or the
+generated API.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_import_time.py [--runs 7] [--scale 1.0]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# statement -> (budget in ms, modules that must not be imported)
+BUDGETS = {
+    "import dart_client": (15, ("httpx", "pydantic", "xmltodict", "aiolimiter")),
+    "from dart_client import DartNoDataError": (15, ("httpx", "pydantic")),
+    "from dart_client import DartAPIClient": (150, ("pydantic", "xmltodict")),
+    "from dart_client import SyncDartAPIClient": (150, ("pydantic", "xmltodict")),
+}
+
+
+def import_time(statement: str) -> tuple[float, set[str]]:
+    """
+    Import time of a statement in ms: the cumulative time of every top-level
+    import from the first dart_client module on (the interpreter's own startup
+    imports are excluded). Also returns the names of all imported modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}, check=True,
+    )
+    total_us = 0
+    modules = set()
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        modules.add(name.strip())
+        if name.startswith("  "):
+            continue  # nested, already part of its parent's cumulative time
+        started = started or name.strip().split(".")[0] == "dart_client"
+        if started:
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply the budgets, e.g. for slow CI machines")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so that compilation is not measured
+    subprocess.run([sys.executable, "-c", "import dart_client.client, dart_client.sync_client"], check=True)
+
+    failed = False
+    for statement, (budget, forbidden) in BUDGETS.items():
+        times = []
+        modules: set[str] = set()
+        for _ in range(args.runs):
+            elapsed, modules = import_time(statement)
+            times.append(elapsed)
+        median = statistics.median(times)
+        leaked = sorted(m for m in forbidden if m in modules)
+        ok = median <= budget * args.scale and not leaked
+        failed |= not ok
+        print(
+            f"{'ok  ' if ok else 'FAIL'} {statement:<44} median {median:7.1f} ms (min {min(times):6.1f}), "
+            f"budget {budget * args.scale:5.0f} ms" + (f", imports {', '.join(leaked)}" if leaked else "")
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
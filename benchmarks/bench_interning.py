@@ -0,0 +1,78 @@
+"""
+Benchmark: memory held by a multi-company fnlttSinglAcntAll backfill, with and without StringPool.
+
+Synthetic responses shaped like fnlttSinglAcntAll (one per company and
+period) are decoded and all kept in memory, as a backfill collecting results
+would. Memory is measured with tracemalloc.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_interning.py [--companies 300] [--periods 8] [--accounts 150]
+"""
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from dart_client.interning import StringPool
+
+REPRT_CODES = ("11013", "11012", "11014", "11011")
+STATEMENTS = (("BS", "재무상태표"), ("IS", "손익계산서"), ("CIS", "포괄손익계산서"), ("CF", "현금흐름표"))
+
+
+def synthetic_payloads(companies: int, periods: int, accounts: int, seed: int = 0) -> list[bytes]:
+    rng = random.Random(seed)
+    payloads = []
+    for c in range(companies):
+        corp_code = f"{c:08d}"
+        for p in range(periods):
+            bsns_year, reprt_code = str(2022 + p // 4), REPRT_CODES[p % 4]
+            rcept_no = f"{bsns_year}0{p % 4 + 3}15{c:06d}"
+            rows = []
+            for a in range(accounts):
+                sj_div, sj_nm = STATEMENTS[a % len(STATEMENTS)]
+                rows.append({
+                    "rcept_no": rcept_no, "reprt_code": reprt_code, "bsns_year": bsns_year,
+                    "corp_code": corp_code, "sj_div": sj_div, "sj_nm": sj_nm,
+                    "account_id": f"ifrs-full_Account{a}", "account_nm": f"계정과목{a}",
+                    "account_detail": "-", "thstrm_nm": f"제 {p + 50} 기", "thstrm_amount": str(rng.randrange(10**12)),
+                    "frmtrm_nm": f"제 {p + 49} 기", "frmtrm_amount": str(rng.randrange(10**12)),
+                    "ord": str(a + 1), "currency": "KRW",
+                })
+            payloads.append(json.dumps({"status": "000", "message": "정상", "list": rows}).encode())
+    return payloads
+
+
+def measure(label: str, decode, payloads: list[bytes]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = [decode(payload) for payload in payloads]
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rows = sum(len(data["list"]) for data in kept)
+    print(f"{label:<12} rows={rows:,}  held={current / 2**20:7.1f} MiB  peak={peak / 2**20:7.1f} MiB  "
+          f"decode={elapsed:5.2f}s")
+    del kept
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=300)
+    parser.add_argument("--periods", type=int, default=8)
+    parser.add_argument("--accounts", type=int, default=150)
+    args = parser.parse_args()
+
+    payloads = synthetic_payloads(args.companies, args.periods, args.accounts)
+    print(f"{len(payloads):,} responses, {sum(map(len, payloads)) / 2**20:.0f} MiB of JSON")
+
+    measure("json.loads", json.loads, payloads)
+    pool = StringPool()
+    measure("StringPool", pool.loads, payloads)
+    print(f"pool: {len(pool):,} distinct values, {pool.hits:,} shared")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: build a 2,500 companies × 20 quarters panel from fnlttSinglAcntAll-shaped responses.
+
+Compares build_panel() with a per-row Python loop over the same synthetic rows.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_panel.py [--companies 2500] [--quarters 20] [--accounts 60]
+"""
+import argparse
+import random
+import time
+
+from dart_client.panel import build_panel
+from dart_client.utils import parse_amount
+
+REPRT_CODES = ("11013", "11012", "11014", "11011")
+SJ_DIVS = ("BS", "IS", "CF")
+
+
+def synthetic_responses(companies: int, quarters: int, accounts: int, seed: int = 0):
+    rng = random.Random(seed)
+    account_ids = [(SJ_DIVS[i % len(SJ_DIVS)], f"ifrs-full_Account{i}") for i in range(accounts)]
+    for c in range(companies):
+        corp_code = f"{c:08d}"
+        for q in range(quarters):
+            bsns_year, reprt_code = str(2020 + q // 4), REPRT_CODES[q % 4]
+            rows = []
+            for sj_div, account_id in account_ids:
+                amount = rng.randrange(-10**12, 10**14)
+                rows.append({
+                    "corp_code": corp_code, "bsns_year": bsns_year, "reprt_code": reprt_code,
+                    "sj_div": sj_div, "account_id": account_id, "account_nm": account_id,
+                    # Roughly 5% placeholders, as in real filings
+                    "thstrm_amount": "-" if rng.random() < 0.05 else f"{amount:,}",
+                })
+            yield {"status": "000", "list": rows}
+
+
+def naive_panel(responses):
+    panel = {}
+    for response in responses:
+        for row in response["list"]:
+            key = (row["corp_code"], (row["bsns_year"], row["reprt_code"]), (row["sj_div"], row["account_id"]))
+            panel[key] = parse_amount(row["thstrm_amount"])
+    return panel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=2500)
+    parser.add_argument("--quarters", type=int, default=20)
+    parser.add_argument("--accounts", type=int, default=60)
+    args = parser.parse_args()
+
+    responses = list(synthetic_responses(args.companies, args.quarters, args.accounts))
+    rows = sum(len(r["list"]) for r in responses)
+    print(f"{args.companies} companies × {args.quarters} quarters × {args.accounts} accounts = {rows:,} rows")
+
+    start = time.perf_counter()
+    naive = naive_panel(responses)
+    naive_s = time.perf_counter() - start
+    print(f"per-row loop (dict of parsed ints): {naive_s:6.2f}s")
+
+    start = time.perf_counter()
+    panel = build_panel(responses)
+    panel_s = time.perf_counter() - start
+    print(f"build_panel (int64 cube + mask):    {panel_s:6.2f}s  shape={panel.shape} "
+          f"present={panel.present.mean():.1%} size={(panel.values.nbytes + panel.present.nbytes) / 2**20:.0f} MiB")
+
+    assert len(naive) == int(panel.present.size)
+
+
+if __name__ == "__main__":
+    main()
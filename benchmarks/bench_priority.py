@@ -0,0 +1,103 @@
+"""
+Benchmark: latency of interactive lookups while a backfill saturates the limiter, with and without PriorityScheduler.
+
+The API is simulated in-process (httpx.MockTransport with a fixed latency),
+so only the limiter and the scheduler decide who waits. A backfill keeps
+--backfill requests queued at Priority.BACKGROUND for the whole run while an
+interactive lookup is made every --interval seconds.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_priority.py [--rate 20] [--backfill 50] [--duration 8]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Optional
+
+import httpx
+from aiolimiter import AsyncLimiter
+
+from dart_client import DartAPIClient
+from dart_client.scheduler import Priority, PriorityScheduler, request_priority
+
+
+def make_client(args: argparse.Namespace, mode: Optional[str]) -> DartAPIClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(args.latency)
+        return httpx.Response(200, json={"status": "000", "message": "정상", "corp_code": "00126380"})
+
+    # A small bucket, so that the backfill saturates the limiter right away
+    limiter = AsyncLimiter(max_rate=args.rate / 10, time_period=0.1)
+    scheduler = PriorityScheduler(limiter, mode=mode) if mode else None
+    client = DartAPIClient(api_key="benchmark", limiter=limiter, scheduler=scheduler)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def run(args: argparse.Namespace, mode: Optional[str], backfill: int) -> tuple[list[float], int]:
+    client = make_client(args, mode)
+    deadline = time.perf_counter() + args.duration
+    background_done = 0
+
+    async def backfill_worker() -> None:
+        nonlocal background_done
+        with request_priority(Priority.BACKGROUND):
+            while time.perf_counter() < deadline:
+                await client.get_alot_matter(corp_code="00126380", bsns_year="2023", reprt_code="11011")
+                background_done += 1
+
+    async def interactive() -> list[float]:
+        latencies = []
+        with request_priority(Priority.INTERACTIVE):
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                await client.get_company(corp_code="00126380")
+                latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(args.interval)
+        return latencies
+
+    async with client:
+        workers = [asyncio.ensure_future(backfill_worker()) for _ in range(backfill)]
+        await asyncio.sleep(0.5 if backfill else 0)  # let the backfill fill the queue
+        latencies = await interactive()
+        await asyncio.gather(*workers)
+    return latencies, background_done
+
+
+def report(name: str, latencies: list[float], background: int, duration: float) -> None:
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100, method="inclusive")[98] if len(latencies) > 1 else p50
+    print(
+        f"{name:<22} interactive p50 {p50 * 1000:7.1f} ms, p99 {p99 * 1000:7.1f} ms, "
+        f"max {max(latencies) * 1000:7.1f} ms; backfill {background / duration:5.1f} req/s"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    print(
+        f"limiter {args.rate:.0f} req/s, {args.backfill} backfill requests in flight, "
+        f"API latency {args.latency * 1000:.0f} ms"
+    )
+    for name, mode, backfill in (
+        ("idle, no scheduler", None, 0),
+        ("backfill, no scheduler", None, args.backfill),
+        ("backfill, strict", "strict", args.backfill),
+        ("backfill, weighted", "weighted", args.backfill),
+    ):
+        latencies, background = await run(args, mode, backfill)
+        report(name, latencies, background, args.duration)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rate", type=float, default=20, help="Limiter rate in requests/s")
+    parser.add_argument("--backfill", type=int, default=50, help="Backfill requests in flight")
+    parser.add_argument("--interval", type=float, default=0.2, help="Seconds between interactive lookups")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated API latency in seconds")
+    parser.add_argument("--duration", type=float, default=8, help="Seconds per scenario")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: blocking calls through SyncDartAPIClient vs. asyncio.run() around a new DartAPIClient per call.
+
+Requests go to a local threaded HTTP server with a fixed latency, over real
+sockets, so the cost of rebuilding the connection pool and the event loop
+per call is visible. The limiter is set high enough not to interfere.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_sync_client.py [--calls 300] [--latency 0.01] [--workers 8]
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dart_client import DartAPIClient, SyncDartAPIClient
+
+BODY = json.dumps({"status": "000", "message": "정상", "corp_code": "00126380", "corp_name": "삼성전자"}).encode()
+
+
+def start_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, as opendart.fss.or.kr
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def report(name: str, calls: int, elapsed: float) -> None:
+    print(f"{name:<34} {calls} calls in {elapsed:6.2f}s  {calls / elapsed:8.1f} calls/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated server latency in seconds")
+    parser.add_argument("--workers", type=int, default=8, help="Threads for the fan-out runs")
+    args = parser.parse_args()
+
+    server = start_server(args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+    corp_codes = [f"{i:08d}" for i in range(args.calls)]
+
+    # The README's former recipe: a fresh event loop and client per call
+    def get_company_asyncio_run(corp_code: str):
+        async def _fetch():
+            async with DartAPIClient(api_key="benchmark", requests_per_minute=10**9) as client:
+                client.BASE_URL = base_url
+                return await client.get_company(corp_code=corp_code)
+        return asyncio.run(_fetch())
+
+    start = time.perf_counter()
+    for corp_code in corp_codes:
+        get_company_asyncio_run(corp_code)
+    report("asyncio.run per call", args.calls, time.perf_counter() - start)
+
+    with SyncDartAPIClient(api_key="benchmark", requests_per_minute=10**9) as client:
+        client.BASE_URL = base_url
+
+        start = time.perf_counter()
+        for corp_code in corp_codes:
+            client.get_company(corp_code=corp_code)
+        report("SyncDartAPIClient, sequential", args.calls, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        client.map("get_company", [{"corp_code": c} for c in corp_codes], max_workers=args.workers)
+        report(f"SyncDartAPIClient.map, {args.workers} threads", args.calls, time.perf_counter() - start)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
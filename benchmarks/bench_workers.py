@@ -0,0 +1,129 @@
+"""
+Benchmark: BackfillJob throughput with 1..N worker processes sharing one sqlite journal and one rate budget.
+
+A local threaded HTTP server answers every call after a fixed latency.
+Each worker process runs BackfillJob.run() on the same journal with its own
+client and a fixed number of calls in flight, so one process is bound by
+latency x concurrency; on a multi-core host, large responses (--rows 2000)
+make each process bound by its CPU for decoding instead. All clients share
+a SharedRateLimiter file. The last run sets a global budget below the
+capacity of the workers and reports the observed request rate against it.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_workers.py [--items 1200] [--workers 1 2 4] [--rows 50] [--budget 100]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from dart_client import DartAPIClient
+from dart_client.jobs import BackfillJob
+from dart_client.limiter import SharedRateLimiter
+
+
+def start_server(body: bytes, latency: float) -> tuple[ThreadingHTTPServer, list[float]]:
+    hits: list[float] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            hits.append(time.monotonic())
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, hits
+
+
+def worker(base_url: str, journal: str, budget_path: str, rate: float, concurrency: int) -> None:
+    async def main() -> None:
+        limiter = SharedRateLimiter(budget_path, max_rate=rate, time_period=1)
+        async with DartAPIClient(api_key="benchmark", limiter=limiter, base_url=base_url) as client:
+            job = BackfillJob(client, journal, concurrency=concurrency, store_results=False)
+            await job.run()
+            job.close()
+
+    asyncio.run(main())
+
+
+def run(args: argparse.Namespace, base_url: str, workers: int, rate: float, hits: list[float]) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = str(Path(tmp) / "journal.db")
+        budget = str(Path(tmp) / "budget.db")
+        job = BackfillJob(None, journal)
+        job.add_matrix([f"{i:08d}" for i in range(args.items // 4)], [2023], methods=["get_alot_matter"])
+        job.close()
+
+        hits.clear()
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=worker, args=(base_url, journal, budget, rate, args.concurrency))
+            for _ in range(workers)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        job = BackfillJob(None, journal)
+        progress = job.progress()
+        job.close()
+        assert progress.pending == 0 and progress.data == progress.total, progress.summary()
+        return progress.total / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1200, help="Journal size (calls)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Process counts to compare")
+    parser.add_argument("--concurrency", type=int, default=4, help="Calls in flight per worker")
+    parser.add_argument("--rows", type=int, default=50, help="Rows per response (response size)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated server latency in seconds")
+    parser.add_argument("--budget", type=float, default=None, help="Global calls/s for the last run")
+    args = parser.parse_args()
+
+    row = {"rcept_no": "20240312000001", "corp_cls": "Y", "corp_code": "00126380", "corp_name": "삼성전자",
+           "se": "주당 현금배당금(원)", "stock_knd": "보통주", "thstrm": "1,444", "frmtrm": "1,444", "lwfr": "1,444"}
+    body = json.dumps({"status": "000", "message": "정상", "list": [row] * args.rows}, ensure_ascii=False).encode()
+    print(f"response size {len(body) / 1024:.0f} KiB, {args.items} calls")
+
+    server, hits = start_server(body, args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+
+    baseline = None
+    for workers in args.workers:
+        throughput = run(args, base_url, workers, 10**6, hits)
+        baseline = baseline or throughput
+        print(f"{workers} worker(s): {throughput:7.1f} calls/s  ({throughput / baseline:.2f}x)")
+
+    workers = max(args.workers)
+    budget = args.budget or round(baseline * 1.5)
+    run(args, base_url, workers, budget, hits)
+    # Steady-state rate, without the initial burst the bucket allows
+    steady = [t for t in hits if t >= hits[0] + 1.0]
+    observed = (len(steady) - 1) / (steady[-1] - steady[0]) if len(steady) > 1 else float("nan")
+    print(f"{workers} worker(s), global budget {budget:.0f} calls/s: observed {observed:7.1f} calls/s")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import yaml
 import re
+import unicodedata
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -9,6 +10,67 @@ CONFIG_DIR = SCRIPT_DIR.parent.parent / "configs" / "dart"
 OUTPUT_DIR = SCRIPT_DIR.parent / "src" / "dart_client" / "generated"
 MODELS_FILE = OUTPUT_DIR / "models.py"
 API_FILE = OUTPUT_DIR / "api.py"
+SYNC_API_FILE = OUTPUT_DIR / "sync_api.py"
+FIELDS_FILE = OUTPUT_DIR / "fields.py"
+REGISTRY_FILE = OUTPUT_DIR / "registry.py"
+
+# Response field name patterns -> column type, first match wins.
+# DART returns every value as a string, so these decide how a field is converted.
+FIELD_TYPE_RULES = [
+    (r"(_rt|_rate|^stkrt|_stkrt)(_irds)?$", "float"),
+    (r"(_co|_qy|_cnt|_amount|_am|_totamt|_totqy|^stkqy|_stkqy|^nmpr|^sm)(_irds)?$", "int"),
+    (r"(_dt|_de|^change_on)$", "date"),
+]
+
+# Endpoints whose JSON response is wrapped in a model ("module.Class" under dart_client.models)
+MODEL_RETURNS = {
+    "list.json": "disclosure.DisclosureList",
+    "company.json": "company.Company",
+}
+
+# Parameter tuples named in dart_client.endpoints, used to keep registry rows short
+NAMED_PARAMS = {
+    ("corp_code", "bsns_year", "reprt_code"): "PERIODIC_PARAMS",
+    ("corp_code", "bgn_de", "end_de"): "DATE_RANGE_PARAMS",
+}
+
+# Names the generated files may import; each file imports the ones it uses
+REGISTRY_NAMES = ("DATE_RANGE_PARAMS", "FILE", "MULTI_CORP", "PAGINATED", "PERIODIC_PARAMS")
+TYPING_NAMES = ("TYPE_CHECKING", "Optional", "Any", "Dict", "Union", "List")
+
+LINE_LENGTH = 120  # ruff line-length of the repo; longer generated lines are wrapped
+
+def display_width(text: str) -> int:
+    """Width of a line as ruff measures it: wide (e.g. Hangul) characters count twice."""
+    return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+def used_names(names: tuple, source: str) -> List[str]:
+    return [name for name in names if re.search(rf"\b{name}\b", source)]
+
+def wrap_call(head: str, items: List[str], tail: str, indent: str) -> List[str]:
+    """`head` + items + `tail` on one line, or one item per line when that is too long."""
+    line = f"{indent}{head}{', '.join(items)}{tail}"
+    if not items or display_width(line) <= LINE_LENGTH:
+        return [line]
+    return [f"{indent}{head}", *(f"{indent}    {item}," for item in items), f"{indent}{tail}"]
+
+def wrap_text(line: str, indent: str) -> List[str]:
+    """Word-wrap a docstring line; continuation lines of an indented line (an Args entry) are indented further."""
+    if display_width(indent + line) <= LINE_LENGTH:
+        return [line]
+    lead = line[: len(line) - len(line.lstrip())]
+    follow = lead + "    " if lead else ""
+    wrapped: List[str] = []
+    current = lead
+    for word in line.split():
+        candidate = f"{current} {word}" if current.strip() else current + word
+        if current.strip() and display_width(indent + candidate) > LINE_LENGTH:
+            wrapped.append(current)
+            current = follow + word
+        else:
+            current = candidate
+    wrapped.append(current)
+    return wrapped
 
 def to_camel_case(snake_str: str) -> str:
     components = snake_str.split('_')
@@ -29,8 +91,8 @@ def load_specs() -> Dict[str, List[Dict[str, Any]]]:
 
 def generate_models(specs: Dict[str, List[Dict[str, Any]]]):
     lines = [
-        "from pydantic import BaseModel, Field",
-        "from typing import Optional, List, Any, Dict",
+        "from pydantic import BaseModel",
+        "from typing import List, Any, Dict",
         "",
         "class DartResponse(BaseModel):",
         "    status: str",
@@ -46,6 +108,178 @@ def generate_models(specs: Dict[str, List[Dict[str, Any]]]):
         f.write("\n".join(lines))
     print(f"Generated {MODELS_FILE}")
 
+def infer_field_type(name: str) -> str:
+    for pattern, field_type in FIELD_TYPE_RULES:
+        if re.search(pattern, name):
+            return field_type
+    return "str"
+
+def response_field_types(api: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Non-string response fields of an API.
+
+    `response.fields` in the YAML is a list of field names, each optionally
+    given as a one-item mapping {name: type} to override the inferred type.
+    """
+    types = {}
+    for field in (api.get("response") or {}).get("fields") or []:
+        if isinstance(field, dict):
+            ((name, field_type),) = field.items()
+        else:
+            name, field_type = field, infer_field_type(field)
+        if field_type != "str":
+            types[name] = field_type
+    return types
+
+def generate_fields(specs: Dict[str, List[Dict[str, Any]]]):
+    lines = [
+        '"""',
+        "Response field types per endpoint, generated from the YAML specifications.",
+        "",
+        "Only non-string fields are listed. FIELD_TYPE_RULES is what the generator",
+        "infers types from, for endpoints or fields not listed here.",
+        '"""',
+        "",
+        "FIELD_TYPE_RULES = (",
+    ]
+    for pattern, field_type in FIELD_TYPE_RULES:
+        lines.append(f"    (r\"{pattern}\", \"{field_type}\"),")
+    lines.append(")")
+    lines.append("")
+    lines.append("FIELD_TYPES = {")
+    for group, apis in specs.items():
+        group_lines = []
+        for api in apis:
+            types = response_field_types(api)
+            if not types:
+                continue
+            endpoint = api["endpoint"].lstrip("/")
+            if endpoint.startswith("api/"):
+                endpoint = endpoint[4:]
+            group_lines.append(f'    "{endpoint}": {{')
+            for name, field_type in types.items():
+                group_lines.append(f'        "{name}": "{field_type}",')
+            group_lines.append("    },")
+        if group_lines:
+            lines.append(f"    # --- Group {group.upper()} ---")
+            lines.extend(group_lines)
+    lines.append("}")
+    lines.append("")
+
+    with open(FIELDS_FILE, "w") as f:
+        f.write("\n".join(lines))
+    print(f"Generated {FIELDS_FILE}")
+
+def endpoint_path(api: Dict[str, Any]) -> str:
+    # Remove /api/ prefix if present, then strip leading slash
+    endpoint = api["endpoint"].lstrip("/")
+    if endpoint.startswith("api/"):
+        endpoint = endpoint[4:]
+    return endpoint
+
+def method_name(api: Dict[str, Any]) -> str:
+    api_id = api["id"]
+    return f"get_{api_id}" if not api_id.startswith("get_") else api_id
+
+def registry_entry(group: str, api: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Registry row of an API. Traits come from the YAML where given (`multi_corp`,
+    `format: zip`) and are inferred otherwise.
+    """
+    params = api.get("params", {})
+    required = list((params.get("required", {}) or {}).keys())
+    optional = list((params.get("optional", {}) or {}).keys())
+    path = endpoint_path(api)
+    notes = api.get("notes") or ""
+    flags = []
+    if "page_no" in required + optional:
+        flags.append("PAGINATED")
+    if api.get("multi_corp", "복수조회" in notes):
+        flags.append("MULTI_CORP")
+    if api.get("format") == "zip" or path.endswith(".xml"):
+        flags.append("FILE")
+    return {
+        "method": method_name(api),
+        "path": path,
+        "group": group.upper(),
+        "name": api["name"],
+        "required": required,
+        "optional": optional,
+        "flags": flags,
+        "model": MODEL_RETURNS.get(path),
+    }
+
+def render_params(params: List[str]) -> str:
+    if tuple(params) in NAMED_PARAMS:
+        return NAMED_PARAMS[tuple(params)]
+    quoted = ", ".join(f'"{p}"' for p in params)
+    return f"({quoted},)" if len(params) == 1 else f"({quoted})"
+
+def render_registry(entries: List[Dict[str, Any]]) -> str:
+    rows = []
+    group = None
+    for entry in entries:
+        if entry["group"] != group:
+            group = entry["group"]
+            rows.append(f"    # --- Group {group} ---")
+        fields = [f'"{entry["method"]}"', f'"{entry["path"]}"', f'"{entry["group"]}"', f'"{entry["name"]}"']
+        if entry["required"] or entry["optional"] or entry["flags"] or entry["model"]:
+            fields.append(render_params(entry["required"]))
+        if entry["optional"]:
+            fields.append(f"optional={render_params(entry['optional'])}")
+        if entry["flags"]:
+            fields.append(f"flags={' | '.join(entry['flags'])}")
+        if entry["model"]:
+            fields.append(f'model="{entry["model"]}"')
+        for line in wrap_call("Endpoint(", fields, "),", "    "):
+            if display_width(line) > LINE_LENGTH:
+                # A parameter tuple too long for one line even on its own: one name per line
+                indent, field = line[: len(line) - len(line.lstrip())], line.strip()
+                head, _, values = field.partition("(")
+                rows.extend(wrap_call(head + "(", values.removesuffix("),").split(", "), "),", indent))
+            else:
+                rows.append(line)
+    names = ", ".join([*used_names(REGISTRY_NAMES, "\n".join(rows)), "Endpoint"])
+    lines = [
+        '"""',
+        "Endpoint registry, generated from the YAML specifications.",
+        "",
+        "Endpoint(method, path, group, name, required, optional, flags, model) per API,",
+        "in specification order. Look entries up through dart_client.endpoints.",
+        '"""',
+        f"from ..endpoints import {names}",
+        "",
+        "ENDPOINTS: dict[str, Endpoint] = {e.method: e for e in (",
+        *rows,
+        ")}",
+        "",
+    ]
+    return "\n".join(lines)
+
+def generate_registry(specs: Dict[str, List[Dict[str, Any]]]):
+    entries = [registry_entry(group, api) for group, apis in specs.items() for api in apis]
+    with open(REGISTRY_FILE, "w", encoding="utf-8") as f:
+        f.write(render_registry(entries))
+    print(f"Generated {REGISTRY_FILE}")
+
+def dispatch_lines(method: str, params: List[str]) -> List[str]:
+    """Body of a generated method: hand the arguments to the shared dispatcher."""
+    items = [f'"{method}"', *(f"{p}={p}" for p in params)]
+    return wrap_call("return await self._call(", items, ")", "        ")
+
+def render_method(
+    method: str, args: List[str], returns: str, docstring_parts: List[str], params: List[str]
+) -> List[str]:
+    """Source lines of a generated method, wrapped to LINE_LENGTH."""
+    lines = wrap_call(f"async def {method}(", args, f") -> {returns}:", "    ")
+    docstring = [
+        wrapped for part in docstring_parts for line in part.split("\n") for wrapped in wrap_text(line, "        ")
+    ]
+    lines.append("        " + "\n        ".join(docstring))
+    lines.extend(dispatch_lines(method, params))
+    lines.append("")
+    return lines
+
 def generate_api(specs: Dict[str, List[Dict[str, Any]]]):
     # Common parameter descriptions
     PARAM_DESCRIPTIONS = {
@@ -69,17 +303,39 @@ def generate_api(specs: Dict[str, List[Dict[str, Any]]]):
     }
     
     lines = [
-        "from typing import Optional, Any, Dict, Union",
-        "from ..models.corp_code import CorpCode",
-        "from ..models.disclosure import DisclosureList",
+        "",
+        "from .registry import ENDPOINTS",
+        "",
+        "# Response models are imported where they are used, so that importing the client does not load pydantic",
+        "if TYPE_CHECKING:",
+        "    from ..models.corp_code import CorpCode",
+        "    from ..models.disclosure import DisclosureList",
+        "    from ..models.company import Company",
         "",
         "class GeneratedDartAPIMixin:",
         "    \"\"\"",
         "    Auto-generated API methods from YAML specifications.",
+        "",
+        "    Each method is a typed wrapper over _call(), which looks the endpoint up",
+        "    in the registry (generated/registry.py).",
         "    \"\"\"",
+        "    async def get_corp_codes(self) -> \"List[CorpCode]\":",
+        "        \"\"\"",
+        "        Helper to get corporation codes as a list of CorpCode objects.",
+        "        This is a wrapper around get_corp_code() which handles the XML/ZIP logic internally.",
+        "        \"\"\"",
+        "        return await self.get_corp_code()",
+        "",
+        "    # --- Generated Methods Below ---",
         "    async def request(self, endpoint: str, params: Dict[str, Any] | None = None) -> Any:",
         "        raise NotImplementedError(\"Mixin expects 'request' method to be implemented by host class\")",
-        ""
+        "",
+        "    async def _call(self, method: str, **params: Any) -> Any:",
+        "        \"\"\"Shared body of the generated methods: drop None arguments, request, "
+        "build the response model.\"\"\"",
+        "        endpoint = ENDPOINTS[method]",
+        "        return endpoint.wrap(await self.request(endpoint.path, endpoint.build_params(params)))",
+        "",
     ]
 
     for group, apis in specs.items():
@@ -88,12 +344,9 @@ def generate_api(specs: Dict[str, List[Dict[str, Any]]]):
         for api in apis:
             api_id = api["id"]
             name = api["name"]
-            # Remove /api/ prefix if present, then strip leading slash
-            endpoint = api["endpoint"].lstrip("/")
-            if endpoint.startswith("api/"):
-                endpoint = endpoint[4:]  # Remove 'api/' prefix
+            endpoint = endpoint_path(api)
             dataset = api.get("dataset", api_id)
-            method_name = f"get_{api_id}" if not api_id.startswith("get_") else api_id
+            method = method_name(api)
             
             # Special case naming for some known IDs to be friendlier?
             # For now, use ID as is (snake_case from YAML)
@@ -104,7 +357,7 @@ def generate_api(specs: Dict[str, List[Dict[str, Any]]]):
             
             # Build enhanced docstring
             docstring_parts = [
-                f'"""',
+                '"""',
                 f"{name}",
                 "",
             ]
@@ -128,9 +381,6 @@ def generate_api(specs: Dict[str, List[Dict[str, Any]]]):
             
             docstring_parts.append('"""')
             
-            # Indent docstring properly
-            docstring = "\n        ".join(docstring_parts)
-
             # Build arguments
             args = ["self"]
             
@@ -152,29 +402,41 @@ def generate_api(specs: Dict[str, List[Dict[str, Any]]]):
                     default = "1" if param == "page_no" else "100"
                 args.append(f"{param}: {py_type} = {default}")
 
-            args_str = ", ".join(args)
-            
             # Method body
-            lines.append(f"    async def {method_name}({args_str}) -> Dict[str, Any]:")
-            lines.append(f"        {docstring}")
-            lines.append(f"        params = {{")
-            
-            for param in all_params_list:
-                lines.append(f'            "{param}": {param},')
-            lines.append(f"        }}")
-            lines.append(f"        # Filter None values")
-            lines.append(f"        params = {{k: v for k, v in params.items() if v is not None}}")
-            lines.append(f'        return await self.request("{endpoint}", params)')
-            lines.append("")
+            model = MODEL_RETURNS.get(endpoint)
+            returns = f'"{model.split(".")[1]}"' if model else "Dict[str, Any]"
+            lines.extend(render_method(method, args, returns, docstring_parts, all_params_list))
 
+    lines.insert(0, f"from typing import {', '.join(used_names(TYPING_NAMES, chr(10).join(lines)))}")
     with open(API_FILE, "w") as f:
         f.write("\n".join(lines))
     print(f"Generated {API_FILE}")
 
+def generate_sync_api():
+    """
+    Blocking twin of the generated API: the same methods, signatures and
+    docstrings, derived from api.py so that the two can never drift apart.
+    """
+    source = API_FILE.read_text(encoding="utf-8")
+    source = source.replace("class GeneratedDartAPIMixin:", "class GeneratedSyncDartAPIMixin:")
+    source = source.replace(
+        "Auto-generated API methods from YAML specifications.",
+        "Auto-generated blocking API methods from YAML specifications.",
+    )
+    source = re.sub(r"\basync def\b", "def", source)
+    source = re.sub(r"\bawait\s+", "", source)
+
+    with open(SYNC_API_FILE, "w", encoding="utf-8") as f:
+        f.write(source)
+    print(f"Generated {SYNC_API_FILE}")
+
 def main():
     specs = load_specs()
     generate_models(specs)
+    generate_registry(specs)
     generate_api(specs)
+    generate_sync_api()
+    generate_fields(specs)
 
 if __name__ == "__main__":
     main()
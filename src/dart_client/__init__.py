@@ -1,11 +1,42 @@
-from .client import DartAPIClient
-from .errors import DartAPIError, DartAuthError, DartLimitError
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .errors import DartAPIError, DartAuthError, DartLimitError, DartNoDataError, DartQuotaError
+
+if TYPE_CHECKING:
+    from .client import DartAPIClient
+    from .feed import DisclosureFeed
+    from .sync_client import SyncDartAPIClient
 
 __version__ = "1.0.6"
 
+# Imported on first access, so that `import dart_client` (e.g. for the
+# exceptions, or a CLI that only parses arguments) does not load httpx and pydantic
+_LAZY = {
+    "DartAPIClient": ".client",
+    "DisclosureFeed": ".feed",
+    "SyncDartAPIClient": ".sync_client",
+}
+
 __all__ = [
     "DartAPIClient",
     "DartAPIError",
     "DartAuthError",
     "DartLimitError",
+    "DartNoDataError",
+    "DartQuotaError",
+    "DisclosureFeed",
+    "SyncDartAPIClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1,27 +1,178 @@
+import asyncio
 import os
+import time
 import httpx
 import io
+import json
 import zipfile
-import xmltodict
 from aiolimiter import AsyncLimiter
-from typing import Any, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
-from .errors import DartAPIError, DartAuthError, DartLimitError
-from .models.corp_code import CorpCode
-from .models.disclosure import Disclosure, DisclosureList
-from .generated import GeneratedDartAPIMixin
+from .errors import DartAPIError, DartAuthError, DartLimitError, DartNoDataError
+from .generated.api import GeneratedDartAPIMixin
+from .fs_div import FsDivResolver
+from .interning import StringPool
 
-class DartAPIClient(GeneratedDartAPIMixin):
+# xmltodict and the pydantic models are imported where they are used, which keeps them out of the import time
+if TYPE_CHECKING:
+    from .coverage import CoverageIndex
+    from .models.corp_code import CorpCode
+    from .models.disclosure import DisclosureList
+    from .scheduler import PriorityScheduler
+
+T = TypeVar("T")
+
+# Responses at least this large are decoded off the event loop
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+
+
+def _parse_status_document(body: bytes) -> tuple[str, str]:
+    """(status, message) of a JSON or XML error document."""
+    try:
+        result = json.loads(body)
+    except ValueError:
+        import xmltodict
+
+        try:
+            result = xmltodict.parse(body).get("result", {})
+        except Exception:
+            return "INVALID_RESPONSE", "Unreadable response body"
+    if not isinstance(result, dict):
+        return "INVALID_RESPONSE", "Unreadable response body"
+    return result.get("status") or "INVALID_RESPONSE", result.get("message", "")
+
+
+def _parse_corp_codes(content: bytes) -> "list[CorpCode]":
     """
-    Async client for the DART API.
+    Unzip and parse a corpCode.xml response. Module-level so that it can run
+    in a process pool.
+    """
+    import xmltodict
+    from .models.corp_code import CorpCode
+
+    # Errors come back as an XML status document instead of the ZIP
+    if content.startswith(b'<?xml'):
+        parsed = xmltodict.parse(content)
+        result = parsed.get("result", {})
+        status = result.get("status")
+        message = result.get("message", "Unknown error")
+
+        if status == "020":
+            raise DartLimitError(status, message)
+        elif status and status != "000":
+            raise DartAPIError(status, message)
+
+    with zipfile.ZipFile(io.BytesIO(content)) as zf:
+        xml_filename = zf.namelist()[0]  # Usually CORPCODE.xml
+        xml_data = zf.read(xml_filename)
+
+    parsed = xmltodict.parse(xml_data)
+    result = parsed.get("result", {})
+    items = result.get("list", [])
+
+    if isinstance(items, dict):
+        items = [items]
+
+    return [CorpCode(**item) for item in items]
+
+
+class DartClientBase:
+    """
+    Request preparation and response handling shared by the async and sync clients.
     """
     BASE_URL = "https://opendart.fss.or.kr/api"
 
+    def _init_base(
+        self,
+        api_key: Optional[str],
+        fs_div_resolver: Optional[FsDivResolver],
+        coverage: Optional["CoverageIndex"],
+        string_pool: Optional[StringPool],
+        base_url: Optional[str] = None,
+    ) -> None:
+        self.api_key = api_key or os.getenv("DART_API_KEY")
+        base_url = base_url or os.getenv("DART_BASE_URL")
+        if base_url:
+            # A gateway (dart_client.gateway) holds the key itself
+            self.BASE_URL = base_url.rstrip("/")
+        elif not self.api_key:
+            raise ValueError("DART_API_KEY is required")
+
+        self.fs_div_resolver = fs_div_resolver or FsDivResolver()
+        self.coverage = coverage
+        self.string_pool = string_pool
+
+    def _prepare(self, endpoint: str, params: dict[str, Any] | None) -> tuple[str, dict[str, Any]]:
+        """URL and query parameters of a request; raises DartNoDataError for requests known to be empty."""
+        params = params or {}
+
+        if self.coverage is not None and self.coverage.is_known_empty(endpoint, params):
+            raise DartNoDataError("013", "조회된 데이타가 없습니다. (coverage index)")
+
+        if self.api_key:
+            params["crtfc_key"] = self.api_key
+        return f"{self.BASE_URL}/{endpoint}", params
+
+    @staticmethod
+    def _is_file_response(response: httpx.Response) -> bool:
+        content_type = response.headers.get("content-type", "")
+        return "application/zip" in content_type or "application/octet-stream" in content_type
+
+    def _decode(self, content: bytes) -> Any:
+        return json.loads(content) if self.string_pool is None else self.string_pool.loads(content)
+
+    def _check_response(self, endpoint: str, params: dict[str, Any], data: Any) -> Any:
+        """Validate a decoded JSON response and raise for DART error codes."""
+        if not isinstance(data, dict):
+            # Should not happen for DART's JSON endpoints, but safe guard
+            return data
+
+        # Check status code
+        status = data.get("status")
+        if status is None:
+            # If JSON but no status, it might be a different API structure or error
+            raise DartAPIError("INVALID_RESPONSE", "Response JSON missing 'status' field")
+
+        self._check_status(endpoint, params, status, data.get("message", ""))
+        return data
+
+    def _check_status(self, endpoint: str, params: dict[str, Any], status: str, message: str) -> None:
+        """Raise the exception for a DART status code, and record the outcome in the coverage index."""
+        if status != "000":
+            if status == "010":
+                raise DartAuthError(status, message)
+            elif status == "020":
+                raise DartLimitError(status, message)
+            elif status == "013":
+                if self.coverage is not None:
+                    self.coverage.record(endpoint, params, has_data=False)
+                raise DartNoDataError(status, message)
+            else:
+                raise DartAPIError(status, message)
+
+        if self.coverage is not None:
+            self.coverage.record(endpoint, params, has_data=True)
+
+
+class DartAPIClient(DartClientBase, GeneratedDartAPIMixin):
+    """
+    Async client for the DART API.
+    """
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         requests_per_minute: int = 100,
         limiter: Optional[AsyncLimiter] = None,
+        fs_div_resolver: Optional[FsDivResolver] = None,
+        coverage: Optional["CoverageIndex"] = None,
+        string_pool: Optional[StringPool] = None,
+        executor: Optional[Executor] = None,
+        offload_threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+        base_url: Optional[str] = None,
+        scheduler: Optional["PriorityScheduler"] = None,
     ):
         """
         Initialize DartAPIClient.
@@ -29,20 +180,43 @@ class DartAPIClient(GeneratedDartAPIMixin):
         Args:
             api_key: DART API Key. If None, tries to read from DART_API_KEY env var.
             requests_per_minute: Max requests per minute (default: 100).
-            limiter: Optional external AsyncLimiter instance (e.g. for sharing across tasks).
+            limiter: Optional external AsyncLimiter instance (e.g. for sharing across tasks), or a
+                     ThreadSafeLimiter to share one budget across event loops and threads.
                      If provided, requests_per_minute is ignored.
+            fs_div_resolver: Optional FsDivResolver used by get_fnltt_singl_acnt_all(fs_div="AUTO").
+                             Pass one with a path to persist the learned CFS/OFS map.
+            coverage: Optional CoverageIndex. Requests known to return no data (status 013)
+                      raise DartNoDataError without calling the API, and every answer is recorded.
+            string_pool: Optional StringPool. JSON responses are decoded through it so that repeated
+                         values (corp_name, account_nm, rcept_no, ...) share one string object.
+                         Useful when holding many responses in memory; decoding is somewhat slower.
+            executor: Executor for decoding large responses (JSON decoding, the corpCode ZIP) off the
+                      event loop. Default: the loop's default thread pool. A ProcessPoolExecutor keeps
+                      the work from holding the GIL, but results are pickled back and string_pool
+                      interning then runs on the event loop after decoding.
+            offload_threshold: Responses smaller than this many bytes are decoded inline, where a
+                               round trip to the executor would cost more than it saves.
+                               None decodes everything inline.
+            base_url: API base URL, e.g. of a DartGateway (default: DART_BASE_URL env var, else opendart).
+                      With a base_url the API key is optional, since the gateway holds it.
+            scheduler: Optional PriorityScheduler. Requests then queue by their request_priority()
+                       class and request_tag() in front of the scheduler's limiter, which replaces
+                       `limiter` and requests_per_minute, and are counted per tag.
         """
-        self.api_key = api_key or os.getenv("DART_API_KEY")
-        if not self.api_key:
-            raise ValueError("DART_API_KEY is required")
-            
+        self._init_base(api_key, fs_div_resolver, coverage, string_pool, base_url)
         self.client = httpx.AsyncClient(timeout=30.0)
         
         # Use provided limiter or create new one
-        if limiter:
+        if scheduler is not None:
+            self.limiter = scheduler.limiter
+        elif limiter:
             self.limiter = limiter
         else:
             self.limiter = AsyncLimiter(max_rate=requests_per_minute, time_period=60)
+        self.scheduler = scheduler
+
+        self.executor = executor
+        self.offload_threshold = offload_threshold
 
     def __del__(self):
         if hasattr(self, "client") and not self.client.is_closed:
@@ -62,93 +236,114 @@ class DartAPIClient(GeneratedDartAPIMixin):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
+    async def _run_cpu(self, size: int, func: Callable[..., T], *args: Any) -> T:
+        """Run func(*args) inline for small inputs, otherwise in the executor."""
+        if self.offload_threshold is None or size < self.offload_threshold:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def _decode_offloaded(self, content: bytes) -> Any:
+        """Decode a JSON response, off the event loop when it is large."""
+        if not isinstance(self.executor, ProcessPoolExecutor):
+            return await self._run_cpu(len(content), self._decode, content)
+        # Only module-level functions cross into a process (a bound method would pickle the client),
+        # and interning has to happen here, where the pool lives
+        data = await self._run_cpu(len(content), json.loads, content)
+        return data if self.string_pool is None else self.string_pool.intern_values(data)
+
     async def request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | bytes:
         """
         Make a request to the DART API.
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        params = params or {}
-        params["crtfc_key"] = self.api_key
+        url, params = self._prepare(endpoint, params)
 
-        async with self.limiter:
+        async with self.scheduler or self.limiter:
+            started = time.perf_counter()
             response = await self.client.get(url, params=params)
-        
+        if self.scheduler is not None:
+            self.scheduler.record(len(response.content), time.perf_counter() - started)
+
         # Check HTTP status first
         response.raise_for_status()
 
         # DART returns JSON for most endpoints, but ZIP/XML for some
-        content_type = response.headers.get("content-type", "")
-        if "application/zip" in content_type or "application/octet-stream" in content_type:
-             return response.content
+        if self._is_file_response(response):
+            return response.content
 
         try:
-            data = response.json()
-        except Exception:
-             # Fallback for non-JSON responses (e.g. XML string if not zipped)
-             return response.content
+            data = await self._decode_offloaded(response.content)
+        except ValueError:  # JSONDecodeError, UnicodeDecodeError
+            # Fallback for non-JSON responses (e.g. XML string if not zipped)
+            return response.content
 
-        # Check DART specific error codes
-        if not isinstance(data, dict):
-            # Should not happen if response.json() succeeded, but safe guard
-            return data
+        return self._check_response(endpoint, params, data)
 
-        # Check status code
-        status = data.get("status")
-        if status is None:
-            # If JSON but no status, it might be a different API structure or error
-            raise DartAPIError("INVALID_RESPONSE", "Response JSON missing 'status' field")
+    async def download(self, endpoint: str, params: dict[str, Any], path: str | Path, offset: int = 0) -> int:
+        """
+        Stream a file endpoint (e.g. document.xml) to disk without holding it in memory.
 
-        message = data.get("message", "")
-        
-        if status != "000":
-            if status == "010":
-                raise DartAuthError(status, message)
-            elif status == "020":
-                raise DartLimitError(status, message)
-            else:
-                raise DartAPIError(status, message)
-                
-        return data
+        Args:
+            endpoint: File endpoint.
+            params: Request parameters.
+            path: Destination file.
+            offset: Resume a partial file of this size with an HTTP Range request.
+                    If the server ignores the range, the file is rewritten from the start.
+
+        Returns:
+            Number of bytes written by this call.
+        """
+        url, params = self._prepare(endpoint, dict(params))
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        async with self.scheduler or self.limiter:
+            started = time.perf_counter()
+            async with self.client.stream("GET", url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "")
+                if "zip" not in content_type and "octet-stream" not in content_type:
+                    # Errors come back as a small JSON or XML status document instead of the file
+                    body = await response.aread()
+                    self._check_status(endpoint, params, *_parse_status_document(body))
+                    raise DartAPIError("INVALID_RESPONSE", f"Unexpected {content_type or 'untyped'} response")
+
+                resumed = offset and response.status_code == 206
+                written = 0
+                with open(path, "ab" if resumed else "wb") as f:
+                    async for chunk in response.aiter_bytes():
+                        f.write(chunk)
+                        written += len(chunk)
+        if self.scheduler is not None:
+            self.scheduler.record(written, time.perf_counter() - started)
 
-    async def get_corp_code(self) -> list[CorpCode]:
+        if self.coverage is not None:
+            self.coverage.record(endpoint, params, has_data=True)
+        return written
+
+    async def get_corp_code(self) -> "list[CorpCode]":
         """
         Fetch the list of unique corporation codes.
         Returns a list of CorpCode models.
         """
-        # 1. Download ZIP (or error XML)
         content = await self.request("corpCode.xml")
         if not isinstance(content, bytes):
             raise DartAPIError("INVALID_RESPONSE", "Expected bytes response for corpCode.xml")
+        return await self._run_cpu(len(content), _parse_corp_codes, content)
 
-        # 2. Check if response is error XML (starts with <?xml)
-        if content.startswith(b'<?xml'):
-            # Parse error response
-            parsed = xmltodict.parse(content)
-            result = parsed.get("result", {})
-            status = result.get("status")
-            message = result.get("message", "Unknown error")
-            
-            if status == "020":
-                raise DartLimitError(status, message)
-            elif status and status != "000":
-                raise DartAPIError(status, message)
-
-        # 3. Extract XML from ZIP
-        with zipfile.ZipFile(io.BytesIO(content)) as zf:
-            xml_filename = zf.namelist()[0]  # Usually CORPCODE.xml
-            xml_data = zf.read(xml_filename)
+    async def get_fnltt_singl_acnt_all(
+        self, corp_code: str, bsns_year: str, reprt_code: str, fs_div: str = "AUTO"
+    ) -> dict[str, Any]:
+        """
+        단일회사 전체 재무제표
 
-        # 4. Parse XML
-        parsed = xmltodict.parse(xml_data)
-        
-        # 5. Extract list
-        result = parsed.get("result", {})
-        items = result.get("list", [])
-        
-        if isinstance(items, dict):
-            items = [items]
-            
-        return [CorpCode(**item) for item in items]
+        Same as the generated method, plus fs_div="AUTO" (the default): CFS
+        is requested first, falling back to OFS on status 013, and a period
+        known to have no CFS goes straight to OFS.
+        """
+        if fs_div == "AUTO":
+            return await self.fs_div_resolver.fetch(self, corp_code, bsns_year, reprt_code)
+        return await super().get_fnltt_singl_acnt_all(
+            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code, fs_div=fs_div
+        )
 
     async def search_disclosure(
         self, 
@@ -159,7 +354,7 @@ class DartAPIClient(GeneratedDartAPIMixin):
         last_reprt_at: Optional[str] = None,
         page_no: int = 1,
         page_count: int = 10
-    ) -> DisclosureList:
+    ) -> "DisclosureList":
         """
         Search for disclosures.
         """
@@ -179,4 +374,5 @@ class DartAPIClient(GeneratedDartAPIMixin):
         if isinstance(data, bytes):
              raise DartAPIError("INVALID_RESPONSE", "Expected JSON response for list.json")
              
+        from .models.disclosure import DisclosureList
         return DisclosureList(**data)
@@ -0,0 +1,223 @@
+"""
+Bulk conversion of DART's string-typed response rows into typed numpy columns.
+
+Requires numpy: pip install "dart-api-client[analysis]"
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "dart_client.columns requires numpy. Install it with: pip install 'dart-api-client[analysis]'"
+    ) from e
+
+from .generated.fields import FIELD_TYPE_RULES, FIELD_TYPES
+
+_MAX_DIGITS = 18  # every 18-digit number fits in int64
+_DIGIT_LO, _DIGIT_HI = ord("0"), ord("9")
+_MINUS, _DOT, _COMMA, _SPACE, _PERCENT = (ord(c) for c in "-., %")
+_MISSING_TEXT = ("", "-")
+_MONTH_DAYS = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+_COMPILED_RULES = tuple((re.compile(pattern), field_type) for pattern, field_type in FIELD_TYPE_RULES)
+
+
+def infer_field_type(name: str) -> str:
+    """Column type ("int", "float", "date" or "str") the generator would infer from a field name."""
+    for pattern, field_type in _COMPILED_RULES:
+        if pattern.search(name):
+            return field_type
+    return "str"
+
+
+def field_types(endpoint: str, fields: Iterable[str]) -> dict[str, str]:
+    """
+    Types of `fields` for an endpoint: the generated metadata where the endpoint
+    is known, name-based inference otherwise.
+    """
+    known = FIELD_TYPES.get(endpoint)
+    if known is not None:
+        return {name: known.get(name, "str") for name in fields}
+    return {name: infer_field_type(name) for name in fields}
+
+
+def _as_bytes(values: Sequence[Optional[str]]) -> "np.ndarray":
+    try:
+        return np.array(["" if v is None else v for v in values], dtype=bytes)
+    except UnicodeEncodeError:
+        # Non-ASCII text can never be a number or date; "?" makes it fail validation
+        return np.array([v.encode("ascii", "replace") if v else b"" for v in values], dtype=bytes)
+
+
+def _char_columns(raw: "np.ndarray") -> "np.ndarray":
+    """(width, n) uint8 view of a fixed-width bytes array, one row per character position."""
+    return raw.view(np.uint8).reshape(len(raw), raw.itemsize).T
+
+
+def _scan_number(chars: "np.ndarray", allow_dot: bool) -> tuple["np.ndarray", ...]:
+    # Validate an optional leading sign, digits with separators and at most one decimal point,
+    # accumulating the digits as an integer on the way
+    n = chars.shape[1]
+    accumulated = np.zeros(n, dtype=np.int64)
+    digits = np.zeros(n, dtype=np.int64)
+    negative = np.zeros(n, dtype=bool)
+    dots = np.zeros(n, dtype=np.int64)
+    bad = np.zeros(n, dtype=bool)
+    for c in chars:
+        is_digit = (c >= _DIGIT_LO) & (c <= _DIGIT_HI)
+        is_minus = c == _MINUS
+        is_dot = c == _DOT
+        bad |= is_minus & ((digits > 0) | negative | (dots > 0))
+        allowed = is_digit | is_minus | (c == _COMMA) | (c == _SPACE) | (c == 0)
+        if allow_dot:
+            allowed |= is_dot | (c == _PERCENT)
+        bad |= ~allowed
+        negative |= is_minus
+        dots += is_dot
+        digits += is_digit
+        accumulated = np.where(is_digit, accumulated * 10 + (c.astype(np.int64) - _DIGIT_LO), accumulated)
+    present = ~bad & (digits > 0) & (dots <= 1)
+    return present, negative, digits, accumulated
+
+
+def parse_amounts(values: Sequence[Optional[str]]) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parse DART integer strings ("195,936,557,000,000", "-1,234", "-") in bulk.
+
+    The strings are packed into a fixed-width byte matrix and the digits are
+    accumulated one character position at a time, so the work is a few dozen
+    numpy passes instead of one replace()/int() call per value. Thousands
+    separators and surrounding spaces are ignored; placeholders ("-", "") and
+    anything else that is not an integer are reported as missing.
+
+    Returns:
+        (int64 values with 0 where missing, boolean mask of present values)
+    """
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    chars = _char_columns(_as_bytes(values))
+    present, negative, digits, parsed = _scan_number(chars, allow_dot=False)
+    present &= digits <= _MAX_DIGITS
+    parsed = np.where(present, np.where(negative, -parsed, parsed), 0)
+    return parsed, present
+
+
+def parse_floats(values: Sequence[Optional[str]]) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parse DART decimal strings such as ratios ("8.51", "1,234.5", "12.3%") in bulk.
+
+    Returns:
+        (float64 values with NaN where missing, boolean mask of present values)
+    """
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.float64), np.zeros(0, dtype=bool)
+    raw = _as_bytes(values)
+    present = _scan_number(_char_columns(raw), allow_dot=True)[0]
+    cleaned = np.char.replace(np.char.replace(raw, b",", b""), b"%", b"")
+    parsed = np.where(present, np.char.strip(cleaned), b"nan").astype(np.float64)
+    return parsed, present
+
+
+def parse_dates(values: Sequence[Optional[str]]) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parse dates written as YYYYMMDD, YYYY-MM-DD or YYYY.MM.DD in bulk.
+
+    Returns:
+        (datetime64[D] values with NaT where missing, boolean mask of present values)
+    """
+    if len(values) == 0:
+        return np.zeros(0, dtype="datetime64[D]"), np.zeros(0, dtype=bool)
+    raw = np.char.strip(_as_bytes(values))
+    for separator in (b"-", b".", b"/"):
+        raw = np.char.replace(raw, separator, b"")
+    eight_chars = np.char.str_len(raw) == 8
+    chars = _char_columns(raw.astype("S8"))
+    is_digit = (chars >= _DIGIT_LO) & (chars <= _DIGIT_HI)
+    numbers = chars.astype(np.int64) - _DIGIT_LO
+    year = numbers[0] * 1000 + numbers[1] * 100 + numbers[2] * 10 + numbers[3]
+    month = numbers[4] * 10 + numbers[5]
+    day = numbers[6] * 10 + numbers[7]
+    leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+    month_days = _MONTH_DAYS[np.clip(month - 1, 0, 11)] + ((month == 2) & leap)
+    present = eight_chars & is_digit.all(axis=0) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= month_days)
+
+    # Rebuild ISO strings in one byte matrix and let numpy parse them
+    iso = np.full((len(raw), 10), _MINUS, dtype=np.uint8)
+    iso[:, 0:4] = chars[0:4].T
+    iso[:, 5:7] = chars[4:6].T
+    iso[:, 8:10] = chars[6:8].T
+    iso[~present] = np.frombuffer(b"1970-01-01", dtype=np.uint8)
+    parsed = iso.view("S10").ravel().astype("datetime64[D]")
+    parsed[~present] = np.datetime64("NaT")
+    return parsed, present
+
+
+_PARSERS = {"int": parse_amounts, "float": parse_floats, "date": parse_dates}
+
+
+@dataclass
+class TypedColumns:
+    """
+    Column-oriented view of a response `list`.
+
+    Numeric and date columns are numpy arrays (int64, float64, datetime64[D]);
+    other fields are object arrays of the original strings. `present[name]`
+    is False where the value was missing or a placeholder; int64 columns hold
+    0 there, floats NaN and dates NaT.
+    """
+    data: dict[str, "np.ndarray"] = field(default_factory=dict)
+    present: dict[str, "np.ndarray"] = field(default_factory=dict)
+    types: dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.data.values()))) if self.data else 0
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.data[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.data
+
+    def masked(self, name: str) -> "np.ma.MaskedArray":
+        return np.ma.MaskedArray(self.data[name], mask=~self.present[name])
+
+
+def to_columns(
+    response: dict[str, Any] | Sequence[dict[str, Any]],
+    endpoint: Optional[str] = None,
+    types: Optional[dict[str, str]] = None,
+) -> TypedColumns:
+    """
+    Convert a DS002/DS004 (or any list-shaped) response into typed columns.
+
+    Args:
+        response: API response, or its "list" of rows.
+        endpoint: Endpoint the response came from (e.g. "hyslrSttus.json"), used to
+                  look up the generated field types. Without it types are inferred from field names.
+        types: Per-field overrides ("int", "float", "date" or "str").
+    """
+    rows = response.get("list", []) if isinstance(response, dict) else response
+    names: dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+
+    resolved = field_types(endpoint, names) if endpoint else {name: infer_field_type(name) for name in names}
+    resolved.update(types or {})
+
+    columns = TypedColumns()
+    for name in names:
+        raw = [row.get(name) for row in rows]
+        field_type = resolved.get(name, "str")
+        parser = _PARSERS.get(field_type)
+        if parser is None:
+            values = np.array(raw, dtype=object)
+            present = np.array([value not in _MISSING_TEXT and value is not None for value in raw], dtype=bool)
+        else:
+            values, present = parser(raw)
+        columns.data[name] = values
+        columns.present[name] = present
+        columns.types[name] = field_type if parser else "str"
+    return columns
@@ -0,0 +1,132 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from .utils import KST
+
+_KEY_PARAMS = ("corp_code", "bsns_year", "reprt_code")
+_IGNORED_PARAMS = {"crtfc_key", *_KEY_PARAMS}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS coverage (
+    endpoint TEXT NOT NULL,
+    corp_code TEXT NOT NULL,
+    bsns_year TEXT NOT NULL,
+    reprt_code TEXT NOT NULL,
+    extra TEXT NOT NULL DEFAULT '',
+    has_data INTEGER NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (endpoint, corp_code, bsns_year, reprt_code, extra)
+)
+"""
+
+CoverageKey = tuple[str, str, str, str, str]
+
+
+class CoverageIndex:
+    """
+    Persistent record of which (corp_code, bsns_year, reprt_code, endpoint)
+    combinations returned data and which came back empty (status 013).
+
+    Results for settled business years never change, so they are trusted
+    forever. Years that can still receive filings (the current year, and the
+    previous one until its annual report deadline) are re-checked once their
+    entry is older than `recheck_after` seconds.
+
+    One index can be shared by clients in different threads and event loops.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", recheck_after: float = 24 * 3600):
+        """
+        Initialize CoverageIndex.
+
+        Args:
+            path: sqlite database file (default: in-memory, not persisted).
+            recheck_after: Age in seconds after which entries of open business years expire.
+        """
+        self.path = str(path)
+        self.recheck_after = recheck_after
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    @staticmethod
+    def key(endpoint: str, params: dict[str, Any]) -> Optional[CoverageKey]:
+        """
+        Build the index key for a request, or None for endpoints that are not
+        addressed by (corp_code, bsns_year, reprt_code), e.g. DS005 date ranges.
+        Remaining parameters such as fs_div or idx_cl_code become part of the key.
+        """
+        if not all(params.get(name) for name in _KEY_PARAMS):
+            return None
+        extra = "&".join(f"{k}={params[k]}" for k in sorted(params) if k not in _IGNORED_PARAMS)
+        return (endpoint, str(params["corp_code"]), str(params["bsns_year"]), str(params["reprt_code"]), extra)
+
+    @staticmethod
+    def is_settled(bsns_year: str, now: Optional[datetime] = None) -> bool:
+        """
+        Whether no new periodic report can appear for the business year any more.
+        Annual reports are due 90 days after a December year end, so the
+        previous year stays open until April.
+        """
+        now = now or datetime.now(KST)
+        year = int(bsns_year)
+        return year < now.year - 1 or (year == now.year - 1 and now.month >= 4)
+
+    def _expired(self, bsns_year: str, checked_at: float) -> bool:
+        if self.is_settled(bsns_year):
+            return False
+        return time.time() - checked_at > self.recheck_after
+
+    def record(self, endpoint: str, params: dict[str, Any], has_data: bool) -> None:
+        key = self.key(endpoint, params)
+        if key is None:
+            return
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, int(has_data), time.time()),
+            )
+            self.conn.commit()
+
+    def lookup(self, endpoint: str, params: dict[str, Any]) -> Optional[bool]:
+        """Return True (has data), False (known empty) or None (unknown or expired)."""
+        key = self.key(endpoint, params)
+        if key is None:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT has_data, checked_at FROM coverage "
+                "WHERE endpoint = ? AND corp_code = ? AND bsns_year = ? AND reprt_code = ? AND extra = ?",
+                key,
+            ).fetchone()
+        if row is None or self._expired(key[2], row[1]):
+            return None
+        return bool(row[0])
+
+    def is_known_empty(self, endpoint: str, params: dict[str, Any]) -> bool:
+        return self.lookup(endpoint, params) is False
+
+    def stats(self) -> dict[str, int]:
+        """Number of entries with and without data."""
+        with self._lock:
+            rows = self.conn.execute("SELECT has_data, COUNT(*) FROM coverage GROUP BY has_data").fetchall()
+        counts = {bool(has_data): count for has_data, count in rows}
+        return {"data": counts.get(True, 0), "empty": counts.get(False, 0)}
+
+    def purge_expired(self) -> int:
+        """Delete entries that would no longer be trusted. Returns the number removed."""
+        with self._lock:
+            rows = self.conn.execute("SELECT rowid, bsns_year, checked_at FROM coverage").fetchall()
+            stale = [(rowid,) for rowid, bsns_year, checked_at in rows if self._expired(bsns_year, checked_at)]
+            self.conn.executemany("DELETE FROM coverage WHERE rowid = ?", stale)
+            self.conn.commit()
+        return len(stale)
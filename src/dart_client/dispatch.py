@@ -0,0 +1,149 @@
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from .errors import DartNoDataError
+from .utils import shift_date
+
+if TYPE_CHECKING:
+    from .models.disclosure import Disclosure
+
+# Report title keyword (whitespace and middle dots removed) -> DS005 method.
+# Titles look like "주요사항보고서(유상증자결정)" or "[기재정정]주요사항보고서(자기주식취득결정)".
+DS005_TITLE_ROUTES: dict[str, str] = {
+    "자산양수도": "get_ast_inhtrf_etc_ptbk_opt",
+    "부도발생": "get_df_ocr",
+    "영업정지": "get_bsn_sp",
+    "회생절차개시신청": "get_ctrcvs_bgrq",
+    "해산사유발생": "get_ds_rs_ocr",
+    "유상증자결정": "get_piic_decsn",
+    "무상증자결정": "get_fric_decsn",
+    "유무상증자결정": "get_pifric_decsn",
+    "감자결정": "get_cr_decsn",
+    "채권은행등의관리절차개시": "get_bnk_mngt_pcbg",
+    "소송등의제기": "get_lwst_lg",
+    "해외증권시장주권등상장결정": "get_ov_lst_decsn",
+    "해외증권시장주권등상장폐지결정": "get_ov_dlst_decsn",
+    "해외증권시장주권등상장": "get_ov_lst",
+    "해외증권시장주권등상장폐지": "get_ov_dlst",
+    "전환사채권발행결정": "get_cvbd_is_decsn",
+    "신주인수권부사채권발행결정": "get_bdwt_is_decsn",
+    "교환사채권발행결정": "get_exbd_is_decsn",
+    "채권은행등의관리절차중단": "get_bnk_mngt_pcsp",
+    "상각형조건부자본증권발행결정": "get_wd_cocobd_is_decsn",
+    "자기주식취득결정": "get_tsstk_aq_decsn",
+    "자기주식처분결정": "get_tsstk_dp_decsn",
+    "자기주식취득신탁계약체결결정": "get_tsstk_aq_trctr_cns_decsn",
+    "자기주식취득신탁계약해지결정": "get_tsstk_aq_trctr_cc_decsn",
+    "영업양수결정": "get_bsn_inh_decsn",
+    "영업양도결정": "get_bsn_trf_decsn",
+    "유형자산양수결정": "get_tgast_inh_decsn",
+    "유형자산양도결정": "get_tgast_trf_decsn",
+    "타법인주식및출자증권양수결정": "get_otcpr_stk_invscr_inh_decsn",
+    "타법인주식및출자증권양도결정": "get_otcpr_stk_invscr_trf_decsn",
+    "주권관련사채권양수결정": "get_stkrtbd_inh_decsn",
+    "주권관련사채권양도결정": "get_stkrtbd_trf_decsn",
+    "회사합병결정": "get_cmp_mg_decsn",
+    "회사분할결정": "get_cmp_dv_decsn",
+    "회사분할합병결정": "get_cmp_dvmg_decsn",
+    "주식교환이전결정": "get_stk_extr_decsn",
+}
+
+_NORMALIZE_RE = re.compile(r"[\s·ㆍ・]+")
+
+
+class ReportClassifier:
+    """
+    Maps report titles (report_nm) to the generated method serving their detail.
+
+    All keywords are compiled into a single alternation, longest first, so a
+    title is classified with one regex search no matter how many routes exist
+    (e.g. 유무상증자결정 wins over 무상증자결정).
+    """
+
+    def __init__(self, routes: Optional[dict[str, str]] = None):
+        self.routes = dict(routes if routes is not None else DS005_TITLE_ROUTES)
+        keywords = sorted(self.routes, key=len, reverse=True)
+        self._groups = {f"r{i}": self.routes[kw] for i, kw in enumerate(keywords)}
+        pattern = "|".join(f"(?P<r{i}>{re.escape(kw)})" for i, kw in enumerate(keywords))
+        self._pattern = re.compile(pattern)
+
+    def classify(self, report_nm: str) -> Optional[str]:
+        """Return the method name for a report title, or None if no route matches."""
+        match = self._pattern.search(_NORMALIZE_RE.sub("", report_nm))
+        if match is None or match.lastgroup is None:
+            return None
+        return self._groups[match.lastgroup]
+
+
+@dataclass
+class DispatchResult:
+    """Structured detail fetched for one disclosure."""
+    disclosure: "Disclosure"
+    method: str
+    rows: list[dict[str, Any]] = field(default_factory=list)
+
+
+class DetailDispatcher:
+    """
+    Fetches the structured detail of new filings from the matching endpoint only.
+
+    Instead of scanning every DS005 endpoint per company, each disclosure is
+    routed by its title and a single call is made with a date window around
+    rcept_dt. Rows are matched back to the disclosure by rcept_no.
+    """
+
+    def __init__(self, client: Any, window_days: int = 1, classifier: Optional[ReportClassifier] = None):
+        """
+        Initialize DetailDispatcher.
+
+        Args:
+            client: DartAPIClient used to call the generated endpoints.
+            window_days: Days added before and after rcept_dt for bgn_de/end_de.
+            classifier: Custom ReportClassifier (default: DS005 routes).
+        """
+        self.client = client
+        self.window_days = window_days
+        self.classifier = classifier or ReportClassifier()
+
+    def route(self, disclosure: "Disclosure") -> Optional[str]:
+        return self.classifier.classify(disclosure.report_nm)
+
+    async def _call(self, method: str, corp_code: str, bgn_de: str, end_de: str) -> list[dict[str, Any]]:
+        try:
+            response = await getattr(self.client, method)(corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
+        except DartNoDataError:
+            return []
+        return response.get("list", [])
+
+    async def fetch(self, disclosure: "Disclosure") -> Optional[DispatchResult]:
+        """Fetch detail rows for one disclosure. Returns None for titles without a route."""
+        results = await self.fetch_many([disclosure])
+        return results[0] if results else None
+
+    async def fetch_many(self, disclosures: "Iterable[Disclosure]") -> list[DispatchResult]:
+        """
+        Fetch detail rows for a batch of disclosures.
+
+        Disclosures of the same company routed to the same endpoint share one
+        call whose window spans all of their receipt dates.
+        """
+        groups: dict[tuple[str, str], list[Disclosure]] = {}
+        for disclosure in disclosures:
+            method = self.route(disclosure)
+            if method is not None:
+                groups.setdefault((disclosure.corp_code, method), []).append(disclosure)
+
+        results: list[DispatchResult] = []
+        for (corp_code, method), members in groups.items():
+            dates = [d.rcept_dt for d in members]
+            rows = await self._call(
+                method,
+                corp_code,
+                shift_date(min(dates), -self.window_days),
+                shift_date(max(dates), self.window_days),
+            )
+            for disclosure in members:
+                matched = [row for row in rows if row.get("rcept_no") == disclosure.rcept_no]
+                results.append(DispatchResult(disclosure=disclosure, method=method, rows=matched))
+        return results
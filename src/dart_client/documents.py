@@ -0,0 +1,263 @@
+"""
+Text and table extraction from filing archives (document.xml / get_api_2019003).
+
+Archive members are decompressed and decoded in chunks and fed to an
+incremental HTMLParser, which tolerates DART's loosely formed XML/HTML.
+Sections and tables are written to JSON Lines files as soon as they are
+complete, so neither the document nor its results are held in memory, and
+only file paths and counts travel back from worker processes.
+"""
+import asyncio
+import codecs
+import io
+import json
+import re
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, Optional
+
+_CHUNK_SIZE = 256 * 1024
+_DOCUMENT_SUFFIXES = (".xml", ".htm", ".html")
+_ENCODING_DECLARATION = re.compile(rb"""encoding=["']([A-Za-z0-9_\-]+)["']""")
+_SPACES = re.compile(r"\s+")
+
+# DART marks sections with SECTION-1..3; plain HTML documents use headings
+_SECTION_TAGS = {"section-1": 1, "section-2": 2, "section-3": 3, "h1": 1, "h2": 2, "h3": 3}
+_TITLE_TAGS = {"title", "h1", "h2", "h3"}
+# TD/TH in HTML; DART also uses TE (cell) and TU (unit/header cell)
+_CELL_TAGS = {"td", "th", "te", "tu"}
+_BREAK_TAGS = {"p", "br", "div", "li", "tr", "title"}
+
+ArchiveSource = str | Path | bytes
+
+
+class _FilingParser(HTMLParser):
+    def __init__(self, emit: Callable[[str, dict[str, Any]], None]):
+        super().__init__(convert_charrefs=True)
+        self.emit = emit
+        self.section_index = -1
+        self.level = 0
+        self.title: list[str] = []
+        self.text: list[str] = []
+        self.in_title = False
+        self.table_depth = 0
+        self.table_index = 0
+        self.rows: list[list[str]] = []
+        self.row: Optional[list[str]] = None
+        self.cell: Optional[list[str]] = None
+
+    def _flush_section(self) -> None:
+        lines = (_SPACES.sub(" ", line).strip() for line in "".join(self.text).split("\n"))
+        text = "\n".join(line for line in lines if line)
+        title = _SPACES.sub(" ", "".join(self.title)).strip()
+        if text or title:
+            self.emit("section", {"index": self.section_index, "level": self.level, "title": title, "text": text})
+        self.title, self.text = [], []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag in _SECTION_TAGS and self.table_depth == 0:
+            self._flush_section()
+            self.section_index += 1
+            self.level = _SECTION_TAGS[tag]
+            self.in_title = tag.startswith("h")
+        elif tag in _TITLE_TAGS:
+            self.in_title = True
+        elif tag == "table":
+            self.table_depth += 1
+            if self.table_depth == 1:
+                self.rows = []
+        elif tag == "tr" and self.table_depth == 1:
+            self.row = []
+        elif tag in _CELL_TAGS and self.row is not None and self.table_depth == 1:
+            self.cell = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _CELL_TAGS and self.cell is not None:
+            if self.row is not None:
+                self.row.append(_SPACES.sub(" ", "".join(self.cell)).strip())
+            self.cell = None
+        elif tag == "tr" and self.row is not None:
+            if any(self.row):
+                self.rows.append(self.row)
+            self.row = None
+        elif tag == "table" and self.table_depth:
+            self.table_depth -= 1
+            if self.table_depth == 0 and self.rows:
+                self.emit("table", {"section_index": self.section_index, "index": self.table_index,
+                                    "section_title": _SPACES.sub(" ", "".join(self.title)).strip(),
+                                    "rows": self.rows})
+                self.table_index += 1
+                self.rows = []
+        elif tag in _TITLE_TAGS:
+            self.in_title = False
+        if tag in _BREAK_TAGS and self.table_depth == 0:
+            self.text.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self.cell is not None:
+            self.cell.append(data)
+        elif self.table_depth:
+            return
+        elif self.in_title:
+            self.title.append(data)
+        else:
+            self.text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush_section()
+
+
+def _detect_encoding(head: bytes) -> str:
+    match = _ENCODING_DECLARATION.search(head[:512])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def parse_stream(stream: IO[bytes], emit: Callable[[str, dict[str, Any]], None]) -> None:
+    """
+    Parse one document from a binary stream, calling emit(kind, record) for
+    every finished "section" and "table".
+    """
+    head = stream.read(_CHUNK_SIZE)
+    decoder = codecs.getincrementaldecoder(_detect_encoding(head))(errors="replace")
+    parser = _FilingParser(emit)
+    chunk = head
+    while chunk:
+        parser.feed(decoder.decode(chunk))
+        chunk = stream.read(_CHUNK_SIZE)
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+
+
+def _open_archive(archive: ArchiveSource) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(archive) if isinstance(archive, bytes) else archive)
+
+
+def document_members(archive: zipfile.ZipFile) -> list[str]:
+    """Document members of a filing archive: the main report and its attachments."""
+    return [name for name in archive.namelist() if name.lower().endswith(_DOCUMENT_SUFFIXES)]
+
+
+def iter_records(archive: ArchiveSource) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Parse an archive in this process and yield (kind, record) pairs. Each
+    record carries the archive member it came from.
+    """
+    with _open_archive(archive) as zf:
+        for name in document_members(zf):
+            records: list[tuple[str, dict[str, Any]]] = []
+            with zf.open(name) as member:
+                parse_stream(
+                    member,
+                    lambda kind, record, records=records, name=name: records.append(
+                        (kind, {"member": name, **record})
+                    ),
+                )
+            yield from records
+
+
+@dataclass
+class ParsedArchive:
+    """Where the records of one archive were written."""
+    rcept_no: str
+    sections_path: Path
+    tables_path: Path
+    sections: int = 0
+    tables: int = 0
+    error: Optional[str] = None
+
+
+def parse_archive_to_files(rcept_no: str, archive: ArchiveSource, out_dir: str | Path) -> ParsedArchive:
+    """
+    Parse an archive and stream its sections and tables into
+    <out_dir>/<rcept_no>.sections.jsonl and <rcept_no>.tables.jsonl.
+    """
+    out_dir = Path(out_dir)
+    result = ParsedArchive(
+        rcept_no, out_dir / f"{rcept_no}.sections.jsonl", out_dir / f"{rcept_no}.tables.jsonl"
+    )
+    try:
+        with _open_archive(archive) as zf, \
+                open(result.sections_path, "w", encoding="utf-8") as sections, \
+                open(result.tables_path, "w", encoding="utf-8") as tables:
+
+            for name in document_members(zf):
+                def emit(kind: str, record: dict[str, Any], member: str = name) -> None:
+                    record = {"rcept_no": rcept_no, "member": member, **record}
+                    if kind == "section":
+                        sections.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        result.sections += 1
+                    else:
+                        tables.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        result.tables += 1
+
+                with zf.open(name) as member:
+                    parse_stream(member, emit)
+    except (zipfile.BadZipFile, OSError) as e:
+        result.error = repr(e)
+    return result
+
+
+def read_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Read back a .sections.jsonl or .tables.jsonl file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+class DocumentPipeline:
+    """
+    Parses filing archives in a process pool, off the event loop.
+
+    Pass archive paths (e.g. from ContentStore.path()) so that workers read
+    the files themselves; results come back as ParsedArchive file locations.
+    """
+
+    def __init__(self, out_dir: str | Path, max_workers: Optional[int] = None, executor: Optional[Executor] = None):
+        """
+        Initialize DocumentPipeline.
+
+        Args:
+            out_dir: Directory the JSON Lines results are written to.
+            max_workers: Worker processes (default: CPU count). Ignored if executor is given.
+            executor: Optional executor to use instead of a new ProcessPoolExecutor.
+        """
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self._owns_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def __enter__(self) -> "DocumentPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def run(self, archives: Iterable[tuple[str, ArchiveSource]]) -> Iterator[ParsedArchive]:
+        """Parse (rcept_no, archive) pairs, yielding results in input order."""
+        futures = [
+            self.executor.submit(parse_archive_to_files, rcept_no, archive, self.out_dir)
+            for rcept_no, archive in archives
+        ]
+        for future in futures:
+            yield future.result()
+
+    async def run_async(self, archives: Iterable[tuple[str, ArchiveSource]]) -> list[ParsedArchive]:
+        """Same as run(), awaiting the workers without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(self.executor, parse_archive_to_files, rcept_no, archive, self.out_dir)
+            for rcept_no, archive in archives
+        )))
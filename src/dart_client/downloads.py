@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import time
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+import httpx
+
+from .errors import DartAPIError, DartAuthError, DartLimitError, DartNoDataError
+from .store import ContentStore
+
+logger = logging.getLogger("dart_client")
+
+DOCUMENT_ENDPOINT = "document.xml"
+
+
+@dataclass
+class DownloadReport:
+    requested: int = 0
+    skipped: int = 0          # already in the store
+    downloaded: int = 0
+    resumed: int = 0          # continued from a .part file
+    deduplicated: int = 0     # content already stored under another rcept_no
+    missing: list[str] = field(default_factory=list)  # status 013/014: no document
+    failed: dict[str, str] = field(default_factory=dict)
+    bytes_downloaded: int = 0
+    elapsed: float = 0.0
+    disk_usage: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.downloaded / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes_downloaded / 2**20 / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        usage = self.disk_usage
+        return (
+            f"{self.requested} requested: {self.downloaded} downloaded ({self.resumed} resumed, "
+            f"{self.deduplicated} duplicate content), {self.skipped} already stored, "
+            f"{len(self.missing)} missing, {len(self.failed)} failed; "
+            f"{self.bytes_downloaded / 2**20:.1f} MiB in {self.elapsed:.1f}s "
+            f"({self.files_per_second:.1f} files/s, {self.megabytes_per_second:.2f} MiB/s); "
+            f"store: {usage.get('refs', 0)} receipts, {usage.get('objects', 0)} objects, "
+            f"{usage.get('object_bytes', 0) / 2**20:.1f} MiB"
+        )
+
+
+class DownloadManager:
+    """
+    Downloads original filing archives (document.xml) into a ContentStore.
+
+    Receipts are queued and fetched by `concurrency` workers; the client's
+    limiter still bounds the request rate. Receipts already in the store are
+    skipped, and unfinished .part files from an earlier run are resumed.
+    DartAuthError and DartLimitError stop the run, since every further
+    request would fail the same way.
+    """
+
+    def __init__(self, client: Any, store: Optional[ContentStore] = None, concurrency: int = 4):
+        """
+        Initialize DownloadManager.
+
+        Args:
+            client: DartAPIClient used for the downloads.
+            store: Destination store (default: ContentStore in the user cache directory).
+            concurrency: Number of downloads in flight.
+        """
+        self.client = client
+        self.store = store or ContentStore()
+        self.concurrency = concurrency
+        self.pending: list[str] = []
+
+    def add(self, rcept_nos: Iterable[str]) -> None:
+        queued = set(self.pending)
+        for rcept_no in rcept_nos:
+            if rcept_no not in queued:
+                queued.add(rcept_no)
+                self.pending.append(rcept_no)
+
+    async def _download(self, rcept_no: str, report: DownloadReport) -> None:
+        part = self.store.part_path(rcept_no)
+        offset = part.stat().st_size if part.exists() else 0
+        params = {"rcept_no": rcept_no}
+        try:
+            try:
+                written = await self.client.download(DOCUMENT_ENDPOINT, params, part, offset=offset)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 416 or not offset:
+                    raise
+                # Nothing lies beyond the .part file: it was complete, but the run stopped before committing it
+                if zipfile.is_zipfile(part):
+                    written = 0
+                else:
+                    part.unlink()
+                    written = await self.client.download(DOCUMENT_ENDPOINT, params, part)
+        except DartNoDataError:
+            report.missing.append(rcept_no)
+            return
+        except (DartAuthError, DartLimitError):
+            raise  # a bad key or an exhausted quota fails every remaining receipt too
+        except DartAPIError as e:
+            if e.code == "014":  # 파일이 존재하지 않습니다
+                report.missing.append(rcept_no)
+            else:
+                report.failed[rcept_no] = str(e)
+            return
+        except Exception as e:
+            # Keep the .part file; the next run resumes it
+            report.failed[rcept_no] = repr(e)
+            return
+
+        # Less written than the file holds means the server honoured the range request
+        resumed = written < part.stat().st_size
+        _, duplicate = self.store.commit(rcept_no)
+        report.downloaded += 1
+        report.resumed += resumed
+        report.deduplicated += duplicate
+        report.bytes_downloaded += written
+
+    async def run(self, include_partials: bool = True) -> DownloadReport:
+        """
+        Download everything queued.
+
+        Args:
+            include_partials: Also finish receipts left as .part files by an interrupted run.
+
+        Raises:
+            DartAuthError, DartLimitError: The run stopped; the receipts not
+                downloaded stay queued for the next run().
+        """
+        if include_partials:
+            self.add(self.store.partials())
+        report = DownloadReport()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for rcept_no in self.pending:
+            report.requested += 1
+            if self.store.has(rcept_no):
+                report.skipped += 1
+            else:
+                queue.put_nowait(rcept_no)
+        self.pending = []
+
+        async def worker() -> None:
+            while True:
+                try:
+                    rcept_no = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await self._download(rcept_no, report)
+                except BaseException:
+                    self.pending.append(rcept_no)
+                    raise
+
+        start = time.perf_counter()
+        tasks = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            while not queue.empty():
+                self.pending.append(queue.get_nowait())
+        report.elapsed = time.perf_counter() - start
+        report.disk_usage = self.store.disk_usage()
+        logger.info("document downloads: %s", report.summary())
+        return report
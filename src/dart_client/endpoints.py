@@ -0,0 +1,96 @@
+"""
+Endpoint traits looked up at runtime, backed by the generated registry.
+
+Every generated client method is a thin wrapper that passes its arguments
+to a shared dispatcher together with its registry entry, so batching,
+caching and planning code can ask the same table which parameters an
+endpoint takes, whether it pages, whether it accepts several companies in
+one call and whether it returns a file.
+"""
+from importlib import import_module
+from typing import Any, NamedTuple, Optional
+
+# Endpoint.flags bits
+PAGINATED = 1   # takes page_no/page_count
+MULTI_CORP = 2  # corp_code may list several companies, comma-separated
+FILE = 4        # returns a ZIP/XML file instead of JSON
+
+PERIODIC_PARAMS = ("corp_code", "bsns_year", "reprt_code")
+DATE_RANGE_PARAMS = ("corp_code", "bgn_de", "end_de")
+
+
+class Endpoint(NamedTuple):
+    method: str                   # client method, e.g. "get_alot_matter"
+    path: str                     # e.g. "alotMatter.json"
+    group: str                    # DS001..DS006
+    name: str                     # Korean API name
+    required: tuple[str, ...] = ()
+    optional: tuple[str, ...] = ()
+    flags: int = 0
+    model: Optional[str] = None   # "module.Class" under dart_client.models the response is wrapped in
+
+    @property
+    def params(self) -> tuple[str, ...]:
+        return self.required + self.optional
+
+    @property
+    def paginated(self) -> bool:
+        return bool(self.flags & PAGINATED)
+
+    @property
+    def multi_corp(self) -> bool:
+        return bool(self.flags & MULTI_CORP)
+
+    @property
+    def returns_file(self) -> bool:
+        return bool(self.flags & FILE)
+
+    @property
+    def periodic(self) -> bool:
+        """Addressed by exactly (corp_code, bsns_year, reprt_code), like the DS002 reports."""
+        return self.required == PERIODIC_PARAMS and not self.multi_corp
+
+    def build_params(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Request parameters in declaration order, without the ones left as None."""
+        return {name: values[name] for name in self.params if values.get(name) is not None}
+
+    def wrap(self, response: Any) -> Any:
+        """Build the response model, if the endpoint has one."""
+        if self.model is None or not isinstance(response, dict):
+            return response
+        module, _, cls = self.model.rpartition(".")
+        return getattr(import_module(f"dart_client.models.{module}"), cls)(**response)
+
+
+def _registry() -> dict[str, Endpoint]:
+    from .generated.registry import ENDPOINTS
+    return ENDPOINTS
+
+
+def get_endpoint(key: str) -> Endpoint:
+    """Registry entry by method name ("get_alot_matter") or path ("alotMatter.json")."""
+    registry = _registry()
+    endpoint = registry.get(key)
+    if endpoint is None:
+        endpoint = next((e for e in registry.values() if e.path == key), None)
+    if endpoint is None:
+        raise KeyError(key)
+    return endpoint
+
+
+def find_endpoints(
+    group: Optional[str] = None,
+    periodic: Optional[bool] = None,
+    paginated: Optional[bool] = None,
+    multi_corp: Optional[bool] = None,
+    returns_file: Optional[bool] = None,
+) -> list[Endpoint]:
+    """Registry entries with the given traits, in registry (specification) order."""
+    return [
+        e for e in _registry().values()
+        if (group is None or e.group == group)
+        and (periodic is None or e.periodic == periodic)
+        and (paginated is None or e.paginated == paginated)
+        and (multi_corp is None or e.multi_corp == multi_corp)
+        and (returns_file is None or e.returns_file == returns_file)
+    ]
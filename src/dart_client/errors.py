@@ -12,3 +12,11 @@ class DartAuthError(DartAPIError):
 class DartLimitError(DartAPIError):
     """Raised when API rate limit is exceeded."""
     pass
+
+class DartQuotaError(DartLimitError):
+    """Raised when a request tag has used its quota (see PriorityScheduler)."""
+    pass
+
+class DartNoDataError(DartAPIError):
+    """Raised when the query matched no data (status 013)."""
+    pass
@@ -0,0 +1,202 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional
+
+from .errors import DartNoDataError
+from .utils import today_kst, write_json_atomic
+
+if TYPE_CHECKING:
+    from .models.disclosure import Disclosure
+
+
+async def fetch_disclosures(
+    client: Any,
+    bgn_de: str,
+    end_de: str,
+    page_count: int = 100,
+    **filters: Optional[str],
+) -> "tuple[list[Disclosure], int]":
+    """
+    Read every page of list.json for a window.
+
+    Pages are requested in ascending date order so page boundaries stay stable
+    while new filings arrive. Returns the disclosures and the number of calls made.
+    """
+    items: list[Disclosure] = []
+    calls = 0
+    page_no = 1
+    while True:
+        try:
+            result = await client.get_list(
+                bgn_de=bgn_de,
+                end_de=end_de,
+                sort="date",
+                sort_mth="asc",
+                page_no=page_no,
+                page_count=page_count,
+                **filters,
+            )
+        except DartNoDataError:
+            break
+        finally:
+            calls += 1
+        items.extend(result.list)
+        if page_no >= result.total_page:
+            break
+        page_no += 1
+    return items, calls
+
+
+@dataclass
+class FeedCheckpoint:
+    """
+    Resumable position of a DisclosureFeed.
+
+    DART receipt numbers start with the receipt date (YYYYMMDD) but are not
+    issued in arrival order within a day (exchange filings use the 80xxxx
+    range), so the watermark alone cannot tell which filings of the watermark
+    day were already seen. `seen` keeps every rcept_no of that day.
+    """
+    watermark: Optional[str] = None
+    seen: set[str] = field(default_factory=set)
+
+    @property
+    def watermark_date(self) -> Optional[str]:
+        return self.watermark[:8] if self.watermark else None
+
+    @classmethod
+    def load(cls, path: Path) -> "FeedCheckpoint":
+        if not path.exists():
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(watermark=data.get("watermark"), seen=set(data.get("seen", [])))
+
+    def save(self, path: Path) -> None:
+        write_json_atomic(path, {"watermark": self.watermark, "seen": sorted(self.seen)})
+
+    def advance(self, rcept_nos: Iterable[str]) -> "FeedCheckpoint":
+        """Return a new checkpoint that also covers the given receipt numbers."""
+        watermark = self.watermark
+        seen = set(self.seen)
+        for rcept_no in rcept_nos:
+            if watermark is None or rcept_no > watermark:
+                watermark = rcept_no
+            seen.add(rcept_no)
+        if watermark is not None:
+            seen = {r for r in seen if r[:8] == watermark[:8]}
+        return FeedCheckpoint(watermark=watermark, seen=seen)
+
+
+class DisclosureFeed:
+    """
+    Market-wide disclosure feed with local watchlist filtering.
+
+    Each poll pages through the market-wide list.json from the watermark date
+    to today, so the number of API calls depends on the filing volume of that
+    window only, never on the size of the watchlist. Filings are matched
+    against the watchlist with a set lookup.
+
+    Example:
+        feed = DisclosureFeed(client, watchlist=codes, checkpoint_path="feed.json")
+        for disclosure in await feed.poll():
+            ...
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        watchlist: Optional[Iterable[str]] = None,
+        checkpoint_path: Optional[str | Path] = None,
+        start_date: Optional[str] = None,
+        pblntf_ty: Optional[str] = None,
+        page_count: int = 100,
+    ):
+        """
+        Initialize DisclosureFeed.
+
+        Args:
+            client: DartAPIClient used for list.json calls.
+            watchlist: corp_codes to emit. If None, every disclosure is emitted.
+            checkpoint_path: JSON file holding the watermark. If None, progress is kept in memory only.
+            start_date: First date (YYYYMMDD) to read when there is no checkpoint yet. Defaults to today.
+            pblntf_ty: Optional disclosure type filter passed to list.json.
+            page_count: Page size for list.json (max 100).
+        """
+        self.client = client
+        self.watchlist: Optional[set[str]] = set(watchlist) if watchlist is not None else None
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.start_date = start_date
+        self.pblntf_ty = pblntf_ty
+        self.page_count = page_count
+        self.calls = 0
+
+        if self.checkpoint_path:
+            self.checkpoint = FeedCheckpoint.load(self.checkpoint_path)
+        else:
+            self.checkpoint = FeedCheckpoint()
+        self._pending: Optional[FeedCheckpoint] = None
+
+    def watch(self, *corp_codes: str) -> None:
+        if self.watchlist is None:
+            self.watchlist = set()
+        self.watchlist.update(corp_codes)
+
+    def unwatch(self, *corp_codes: str) -> None:
+        if self.watchlist is not None:
+            self.watchlist.difference_update(corp_codes)
+
+    async def poll(self, commit: bool = True) -> "list[Disclosure]":
+        """
+        Fetch disclosures filed since the checkpoint and return the new, watched ones.
+
+        Args:
+            commit: Advance (and persist) the checkpoint right away. Pass False to
+                    call commit() yourself once the batch has been handled, so a
+                    crash in between replays the batch instead of dropping it.
+        """
+        bgn_de = self.checkpoint.watermark_date or self.start_date or today_kst()
+        end_de = max(today_kst(), bgn_de)
+
+        items, calls = await fetch_disclosures(
+            self.client, bgn_de, end_de, page_count=self.page_count, pblntf_ty=self.pblntf_ty
+        )
+        self.calls += calls
+        fresh = [d for d in items if d.rcept_no not in self.checkpoint.seen]
+        fresh.sort(key=lambda d: d.rcept_no)
+
+        self._pending = self.checkpoint.advance(d.rcept_no for d in fresh)
+        if commit:
+            self.commit()
+
+        if self.watchlist is None:
+            return fresh
+        watchlist = self.watchlist
+        return [d for d in fresh if d.corp_code in watchlist]
+
+    def commit(self) -> None:
+        """Make the last poll's position durable."""
+        if self._pending is None:
+            return
+        self.checkpoint = self._pending
+        self._pending = None
+        if self.checkpoint_path:
+            self.checkpoint.save(self.checkpoint_path)
+
+    async def run(
+        self,
+        handler: "Callable[[list[Disclosure]], Awaitable[None]]",
+        interval: float = 60.0,
+    ) -> None:
+        """
+        Poll forever, handing each non-empty batch to `handler`.
+        The checkpoint advances only after the handler returns.
+        """
+        while True:
+            batch = await self.poll(commit=False)
+            if batch:
+                await handler(batch)
+            self.commit()
+            await asyncio.sleep(interval)
@@ -0,0 +1,152 @@
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from .errors import DartNoDataError
+from .utils import parse_periodic_report, periodic_detail_type, write_json_atomic
+
+if TYPE_CHECKING:
+    from .models.disclosure import Disclosure
+
+FS_DIVS = ("CFS", "OFS")  # 연결, 개별
+
+
+class FsDivResolver:
+    """
+    Remembers the periods for which a company published no consolidated statements.
+
+    Companies without subsidiaries publish no consolidated statements, so the
+    usual "try CFS, get 013, retry with OFS" doubles their calls whenever a
+    period is fetched again. Only the exact (bsns_year, reprt_code) that came
+    back empty goes straight to OFS: a company that publishes both always has
+    OFS data too, so guessing OFS for another period would silently serve the
+    separate statements. Entries are dropped when the company files a newer
+    report for the same period (e.g. a correction).
+
+    One resolver can be shared by clients in different threads and event loops.
+    """
+
+    def __init__(self, path: Optional[str | Path] = None, autosave: bool = True):
+        """
+        Initialize FsDivResolver.
+
+        Args:
+            path: JSON file the learned map is persisted to. If None, it is kept in memory only.
+            autosave: Persist after every change. Disable for large backfills and call save() yourself.
+        """
+        self.path = Path(path) if path else None
+        self.autosave = autosave
+        # corp_code -> bsns_year -> reprt_code -> {"fs_div": ..., "rcept_no": ...}
+        self.entries: dict[str, dict[str, dict[str, dict[str, Optional[str]]]]] = {}
+        self._lock = threading.RLock()
+        if self.path and self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def save(self) -> None:
+        if self.path:
+            with self._lock:
+                write_json_atomic(self.path, self.entries)
+
+    def _changed(self) -> None:
+        if self.autosave:
+            self.save()
+
+    def get(self, corp_code: str, bsns_year: str, reprt_code: str) -> Optional[str]:
+        entry = self.entries.get(corp_code, {}).get(bsns_year, {}).get(reprt_code)
+        return entry["fs_div"] if entry else None
+
+    def learn(
+        self, corp_code: str, bsns_year: str, reprt_code: str, fs_div: str, rcept_no: Optional[str] = None
+    ) -> None:
+        entry = {"fs_div": fs_div, "rcept_no": rcept_no}
+        with self._lock:
+            periods = self.entries.setdefault(corp_code, {}).setdefault(bsns_year, {})
+            if periods.get(reprt_code) == entry:
+                return
+            periods[reprt_code] = entry
+            self._changed()
+
+    def forget(self, corp_code: str, bsns_year: Optional[str] = None, reprt_code: Optional[str] = None) -> None:
+        with self._lock:
+            years = self.entries.get(corp_code, {})
+            if bsns_year is None:
+                removed = self.entries.pop(corp_code, None) is not None
+            elif reprt_code is None:
+                removed = years.pop(bsns_year, None) is not None
+            else:
+                removed = years.get(bsns_year, {}).pop(reprt_code, None) is not None
+                if removed and not years[bsns_year]:
+                    del years[bsns_year]
+            if removed and corp_code in self.entries and not years:
+                del self.entries[corp_code]
+            if removed:
+                self._changed()
+
+    def observe(self, disclosure: "Disclosure") -> None:
+        """
+        Feed a new disclosure (e.g. from DisclosureFeed) so that a newer
+        filing for a learned period invalidates its fs_div.
+        """
+        detail_ty = periodic_detail_type(disclosure.report_nm)
+        if detail_ty is None:
+            return
+        period = parse_periodic_report(disclosure.report_nm, detail_ty)
+        if period is None:
+            return
+        bsns_year, reprt_code = period
+        entry = self.entries.get(disclosure.corp_code, {}).get(bsns_year, {}).get(reprt_code)
+        if entry and (entry["rcept_no"] or "") < disclosure.rcept_no:
+            self.forget(disclosure.corp_code, bsns_year, reprt_code)
+
+    def _order(self, corp_code: str, bsns_year: str, reprt_code: str) -> list[str]:
+        known = self.get(corp_code, bsns_year, reprt_code)
+        return [known] + [d for d in FS_DIVS if d != known] if known else list(FS_DIVS)
+
+    def _learn_response(
+        self, corp_code: str, bsns_year: str, reprt_code: str, fs_div: str, response: dict[str, Any]
+    ) -> None:
+        if fs_div == FS_DIVS[0]:
+            # CFS is tried first anyway, only its absence is worth remembering
+            self.forget(corp_code, bsns_year, reprt_code)
+            return
+        rows = response.get("list") or [{}]
+        self.learn(corp_code, bsns_year, reprt_code, fs_div, rows[0].get("rcept_no"))
+
+    async def fetch(self, client: Any, corp_code: str, bsns_year: str, reprt_code: str) -> dict[str, Any]:
+        """
+        Call fnlttSinglAcntAll with CFS, or OFS when CFS is known to be empty for this period,
+        falling back to the other one on status 013.
+        """
+        last_error: Optional[DartNoDataError] = None
+        for fs_div in self._order(corp_code, bsns_year, reprt_code):
+            try:
+                response = await client.get_fnltt_singl_acnt_all(
+                    corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code, fs_div=fs_div
+                )
+            except DartNoDataError as e:
+                last_error = e
+                continue
+            self._learn_response(corp_code, bsns_year, reprt_code, fs_div, response)
+            return response
+
+        assert last_error is not None
+        raise last_error
+
+    def fetch_sync(self, client: Any, corp_code: str, bsns_year: str, reprt_code: str) -> dict[str, Any]:
+        """Same as fetch(), for SyncDartAPIClient."""
+        last_error: Optional[DartNoDataError] = None
+        for fs_div in self._order(corp_code, bsns_year, reprt_code):
+            try:
+                response = client.get_fnltt_singl_acnt_all(
+                    corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code, fs_div=fs_div
+                )
+            except DartNoDataError as e:
+                last_error = e
+                continue
+            self._learn_response(corp_code, bsns_year, reprt_code, fs_div, response)
+            return response
+
+        assert last_error is not None
+        raise last_error
@@ -0,0 +1,271 @@
+"""
+Local full-text index over downloaded filings (sqlite FTS5).
+
+Korean has no spaces inside compound nouns ("전환사채", "최대주주변경"), so
+word tokenizers miss most matches. Hangul runs are therefore indexed as
+overlapping syllable bigrams, and a query term matches when all of its
+bigrams appear in sequence, which is a substring match at any position.
+A one-syllable term is a bigram prefix query; since the last syllable of a
+run starts no bigram, it is also indexed on its own in a second column.
+"""
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from .documents import ArchiveSource, iter_records
+from .store import ContentStore
+
+if TYPE_CHECKING:
+    from .models.disclosure import Disclosure
+
+_HANGUL_OR_WORD = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+_HANGUL = re.compile(r"[가-힣]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    rcept_no TEXT PRIMARY KEY,
+    corp_code TEXT,
+    corp_name TEXT,
+    stock_code TEXT,
+    corp_cls TEXT,
+    report_nm TEXT,
+    flr_nm TEXT,
+    rcept_dt TEXT,
+    rm TEXT,
+    indexed_at REAL
+);
+CREATE INDEX IF NOT EXISTS filings_corp ON filings (corp_code, rcept_dt);
+CREATE INDEX IF NOT EXISTS filings_date ON filings (rcept_dt);
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    rcept_no TEXT NOT NULL,
+    member TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_rcept_no ON chunks (rcept_no);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(tokens, tails, tokenize = 'unicode61');
+"""
+
+
+def _tokens(text: str) -> list[str]:
+    tokens = []
+    for run in _HANGUL_OR_WORD.findall(text):
+        if _HANGUL.fullmatch(run) and len(run) > 1:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run.lower())
+    return tokens
+
+
+def tokenize(text: str) -> str:
+    """Index form of a text: Hangul runs as syllable bigrams, other words as they are."""
+    return " ".join(_tokens(text))
+
+
+def tails(text: str) -> str:
+    """Last syllables of the Hangul runs of a text, which no bigram starts with."""
+    return " ".join(run[-1] for run in _HANGUL.findall(text) if len(run) > 1)
+
+
+def build_match_query(query: str) -> str:
+    """
+    FTS5 MATCH expression for a user query: every whitespace-separated term
+    must occur, each as a contiguous substring.
+    """
+    phrases = []
+    for term in query.split():
+        tokens = _tokens(term)
+        if len(tokens) == 1 and len(tokens[0]) == 1 and _HANGUL.fullmatch(tokens[0]):
+            phrases.append(f'"{tokens[0]}"*')  # single syllable: prefix of a bigram, or a tail
+        elif tokens:
+            phrases.append('"' + " ".join(tokens) + '"')
+    if not phrases:
+        raise ValueError(f"Query has no searchable terms: {query!r}")
+    return " AND ".join(phrases)
+
+
+def _snippet(text: str, query: str, width: int = 60) -> str:
+    positions = [text.find(term) for term in query.split() if term in text]
+    start = max(min(positions) - width // 2, 0) if positions else 0
+    snippet = text[start:start + width * 2].replace("\n", " ")
+    return ("…" if start else "") + snippet + ("…" if start + width * 2 < len(text) else "")
+
+
+@dataclass
+class SearchHit:
+    rcept_no: str
+    corp_code: Optional[str]
+    corp_name: Optional[str]
+    report_nm: Optional[str]
+    rcept_dt: Optional[str]
+    member: str
+    kind: str  # "section" or "table"
+    title: str
+    snippet: str
+    rank: float
+
+
+class FilingIndex:
+    """
+    Full-text index of filing documents joined with their Disclosure metadata.
+
+    Filings are added one at a time as they are downloaded (index_archive),
+    or in bulk from a ContentStore (update_from_store), which only indexes
+    receipts not indexed yet. Searches never call the API.
+    """
+
+    def __init__(self, path: str | Path = ":memory:"):
+        """
+        Initialize FilingIndex.
+
+        Args:
+            path: sqlite database file (default: in-memory, not persisted).
+        """
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def add_disclosures(self, disclosures: Iterable["Disclosure"]) -> None:
+        """Insert or update filing metadata, e.g. from list.json results or a DisclosureFeed."""
+        self.conn.executemany(
+            "INSERT INTO filings"
+            " (rcept_no, corp_code, corp_name, stock_code, corp_cls, report_nm, flr_nm, rcept_dt, rm)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (rcept_no) DO UPDATE SET"
+            " corp_code = excluded.corp_code, corp_name = excluded.corp_name, stock_code = excluded.stock_code,"
+            " corp_cls = excluded.corp_cls, report_nm = excluded.report_nm, flr_nm = excluded.flr_nm,"
+            " rcept_dt = excluded.rcept_dt, rm = excluded.rm",
+            [
+                (d.rcept_no, d.corp_code, d.corp_name, d.stock_code, d.corp_cls, d.report_nm, d.flr_nm, d.rcept_dt,
+                 d.rm)
+                for d in disclosures
+            ],
+        )
+        self.conn.commit()
+
+    def is_indexed(self, rcept_no: str) -> bool:
+        row = self.conn.execute("SELECT indexed_at FROM filings WHERE rcept_no = ?", (rcept_no,)).fetchone()
+        return row is not None and row[0] is not None
+
+    def _delete_chunks(self, rcept_no: str) -> None:
+        ids = [(row[0],) for row in self.conn.execute("SELECT id FROM chunks WHERE rcept_no = ?", (rcept_no,))]
+        self.conn.executemany("DELETE FROM chunks_fts WHERE rowid = ?", ids)
+        self.conn.execute("DELETE FROM chunks WHERE rcept_no = ?", (rcept_no,))
+
+    def index_archive(
+        self, rcept_no: str, archive: ArchiveSource, disclosure: Optional["Disclosure"] = None, commit: bool = True
+    ) -> int:
+        """
+        (Re)index the documents of one filing archive. Returns the number of chunks indexed.
+
+        Sections are indexed with their text; tables with their cells, one row per line.
+        """
+        if disclosure is not None:
+            self.add_disclosures([disclosure])
+        self._delete_chunks(rcept_no)
+
+        count = 0
+        for kind, record in iter_records(archive):
+            if kind == "section":
+                title, text = record["title"], record["text"]
+            else:
+                title = record["section_title"]
+                text = "\n".join(" | ".join(row) for row in record["rows"])
+            if not (title or text):
+                continue
+            cursor = self.conn.execute(
+                "INSERT INTO chunks (rcept_no, member, kind, title, text) VALUES (?, ?, ?, ?, ?)",
+                (rcept_no, record["member"], kind, title, text),
+            )
+            document = f"{title}\n{text}"
+            self.conn.execute(
+                "INSERT INTO chunks_fts (rowid, tokens, tails) VALUES (?, ?, ?)",
+                (cursor.lastrowid, tokenize(document), tails(document)),
+            )
+            count += 1
+
+        self.conn.execute(
+            "INSERT INTO filings (rcept_no, indexed_at) VALUES (?, ?)"
+            " ON CONFLICT (rcept_no) DO UPDATE SET indexed_at = excluded.indexed_at",
+            (rcept_no, time.time()),
+        )
+        if commit:
+            self.conn.commit()
+        return count
+
+    def update_from_store(self, store: ContentStore, disclosures: Iterable["Disclosure"] = ()) -> int:
+        """
+        Index every receipt in the store that is not indexed yet. Returns the number of filings added.
+        """
+        self.add_disclosures(disclosures)
+        added = 0
+        for rcept_no in store.refs():
+            if self.is_indexed(rcept_no):
+                continue
+            path = store.path(rcept_no)
+            if path is None:
+                continue
+            self.index_archive(rcept_no, path, commit=False)
+            added += 1
+        self.conn.commit()
+        return added
+
+    def search(
+        self,
+        query: str,
+        corp_code: Optional[str] = None,
+        bgn_de: Optional[str] = None,
+        end_de: Optional[str] = None,
+        report_nm: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[SearchHit]:
+        """
+        Search indexed filings.
+
+        Args:
+            query: Whitespace-separated terms, all of which must occur (e.g. "최대주주 변경").
+            corp_code: Only filings of this company.
+            bgn_de: Only filings received on or after this date (YYYYMMDD).
+            end_de: Only filings received on or before this date (YYYYMMDD).
+            report_nm: Only filings whose title contains this text.
+            limit: Maximum number of hits, best match first.
+        """
+        sql = [
+            "SELECT c.rcept_no, f.corp_code, f.corp_name, f.report_nm, f.rcept_dt, c.member, c.kind, c.title,"
+            " c.text, chunks_fts.rank"
+            " FROM chunks_fts JOIN chunks c ON c.id = chunks_fts.rowid"
+            " LEFT JOIN filings f ON f.rcept_no = c.rcept_no"
+            " WHERE chunks_fts MATCH ?"
+        ]
+        params: list[Any] = [build_match_query(query)]
+        for clause, value in (
+            ("f.corp_code = ?", corp_code),
+            ("f.rcept_dt >= ?", bgn_de),
+            ("f.rcept_dt <= ?", end_de),
+            ("f.report_nm LIKE '%' || ? || '%'", report_nm),
+        ):
+            if value is not None:
+                sql.append(f" AND {clause}")
+                params.append(value)
+        sql.append(" ORDER BY chunks_fts.rank LIMIT ?")
+        params.append(limit)
+
+        return [
+            SearchHit(rcept_no, corp, name, report, date, member, kind, title, _snippet(text, query), rank)
+            for rcept_no, corp, name, report, date, member, kind, title, text, rank in self.conn.execute(
+                "".join(sql), params
+            )
+        ]
+
+    def stats(self) -> dict[str, int]:
+        filings = self.conn.execute("SELECT COUNT(*) FROM filings WHERE indexed_at IS NOT NULL").fetchone()[0]
+        chunks = self.conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+        return {"filings": filings, "chunks": chunks}
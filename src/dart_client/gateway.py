@@ -0,0 +1,337 @@
+"""
+Local DART gateway: an HTTP server mirroring opendart's /api/* that holds the
+API key and applies one response cache, one rate limiter and request
+coalescing for every service behind it.
+
+Services point their clients at it instead of opendart:
+
+    DartAPIClient(base_url="http://dart-gateway:8080/api", requests_per_minute=10**6)
+
+or set DART_BASE_URL. Run it with:
+
+    python -m dart_client.gateway --port 8080 --requests-per-minute 1000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+from aiolimiter import AsyncLimiter
+
+from .client import DartClientBase
+
+logger = logging.getLogger("dart_client")
+
+# Answers that are the same for every caller until the data changes; 010/020 etc. are passed on uncached
+CACHEABLE_STATUSES = frozenset({"000", "013"})
+_STATUS_RE = re.compile(rb'"status"\s*:\s*"(\w+)"|<status>(\w+)</status>')
+_FORWARDED_HEADERS = ("content-type", "content-disposition")
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 502: "Bad Gateway"}
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class GatewayResponse:
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+
+    @property
+    def dart_status(self) -> Optional[str]:
+        """status of a JSON or XML status document, None for files."""
+        match = _STATUS_RE.search(self.body[:512])
+        if match is None:
+            return None
+        return (match.group(1) or match.group(2)).decode("ascii")
+
+    @property
+    def cacheable(self) -> bool:
+        if self.status_code != 200:
+            return False
+        status = self.dart_status
+        return status is None or status in CACHEABLE_STATUSES
+
+
+class ResponseCache:
+    """LRU cache of upstream responses, bounded by total size, with a time to live."""
+
+    def __init__(self, ttl: float = 3600, max_bytes: int = 256 * 2**20, max_entry_bytes: int = 8 * 2**20):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            ttl: Seconds a response is served from the cache.
+            max_bytes: Total body size kept; the least recently used responses are evicted first.
+            max_entry_bytes: Larger responses (e.g. big document.xml archives) are not cached.
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.size = 0
+        self._entries: OrderedDict[CacheKey, tuple[float, GatewayResponse]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[GatewayResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if expires < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: CacheKey, response: GatewayResponse) -> None:
+        if len(response.body) > self.max_entry_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self.size += len(response.body)
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: CacheKey) -> None:
+        _, response = self._entries.pop(key)
+        self.size -= len(response.body)
+
+
+@dataclass
+class GatewayStats:
+    requests: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0        # answered by an identical request already in flight
+    upstream_calls: int = 0
+    upstream_errors: int = 0
+
+    def summary(self) -> str:
+        saved = self.requests - self.upstream_calls
+        return (
+            f"{self.requests} requests: {self.upstream_calls} upstream ({self.upstream_errors} failed), "
+            f"{self.cache_hits} cache hits, {self.coalesced} coalesced ({saved} calls saved)"
+        )
+
+
+class DartGateway:
+    """
+    Asyncio HTTP server mirroring opendart's /api/* surface.
+
+    Every GET /api/<endpoint>?<params> is answered from the cache, joined to
+    an identical request already in flight, or forwarded to opendart through
+    the gateway's limiter with the gateway's own crtfc_key (a crtfc_key sent
+    by the caller is dropped). Response bodies are passed through unchanged,
+    so DartAPIClient, SyncDartAPIClient and plain HTTP callers all work.
+    Responses carry an X-Gateway-Cache header (HIT, MISS or COALESCED), and
+    GET /_gateway/stats returns the counters as JSON.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_minute: int = 100,
+        limiter: Optional[AsyncLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        upstream_url: str = DartClientBase.BASE_URL,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize DartGateway.
+
+        Args:
+            api_key: DART API Key. If None, tries to read from DART_API_KEY env var.
+            requests_per_minute: Max upstream requests per minute (default: 100).
+            limiter: Optional external AsyncLimiter or ThreadSafeLimiter (e.g. a SharedRateLimiter
+                     when several gateways share a key). If provided, requests_per_minute is ignored.
+            cache: Response cache (default: ResponseCache() with a one hour TTL). Pass
+                   ResponseCache(ttl=0) to only coalesce.
+            upstream_url: opendart API base URL.
+            timeout: Upstream request timeout in seconds.
+        """
+        self.api_key = api_key or os.getenv("DART_API_KEY")
+        if not self.api_key:
+            raise ValueError("DART_API_KEY is required")
+        self.limiter = limiter or AsyncLimiter(max_rate=requests_per_minute, time_period=60)
+        self.cache = cache if cache is not None else ResponseCache()
+        self.upstream_url = upstream_url.rstrip("/")
+        self.client = httpx.AsyncClient(timeout=timeout, limits=httpx.Limits(max_connections=100))
+        self.stats = GatewayStats()
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._inflight: dict[CacheKey, asyncio.Future[GatewayResponse]] = {}
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        """Base URL for clients, e.g. http://127.0.0.1:8080/api."""
+        if self.server is None:
+            raise RuntimeError("DartGateway is not started")
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Start listening (port 0 picks a free port, see url)."""
+        self.server = await asyncio.start_server(self._handle, host, port)
+        logger.info("DART gateway listening on %s", self.url)
+        return self.server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            # Idle keep-alive connections would keep wait_closed() waiting
+            for writer in list(self._connections):
+                writer.close()
+            await self.server.wait_closed()
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "DartGateway":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def fetch(self, endpoint: str, params: list[tuple[str, str]]) -> tuple[GatewayResponse, str]:
+        """
+        Answer one API request. Returns the response and where it came from:
+        "HIT", "MISS" (forwarded upstream) or "COALESCED".
+        """
+        self.stats.requests += 1
+        key: CacheKey = (endpoint, tuple(sorted((k, v) for k, v in params if k != "crtfc_key")))
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats.cache_hits += 1
+            return cached, "HIT"
+
+        task = self._inflight.get(key)
+        if task is None:
+            source = "MISS"
+            task = self._inflight[key] = asyncio.ensure_future(self._upstream(endpoint, key[1]))
+            task.add_done_callback(lambda done: self._settle(key, done))
+        else:
+            source = "COALESCED"
+            self.stats.coalesced += 1
+        # A caller that disconnects must not cancel the request the others are waiting for
+        return await asyncio.shield(task), source
+
+    def _settle(self, key: CacheKey, task: "asyncio.Future[GatewayResponse]") -> None:
+        del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        response = task.result()
+        if response.cacheable:
+            self.cache.put(key, response)
+
+    async def _upstream(self, endpoint: str, params: tuple[tuple[str, str], ...]) -> GatewayResponse:
+        try:
+            async with self.limiter:
+                self.stats.upstream_calls += 1
+                response = await self.client.get(
+                    f"{self.upstream_url}/{endpoint}", params=[*params, ("crtfc_key", self.api_key)]
+                )
+        except Exception:
+            self.stats.upstream_errors += 1
+            raise
+        headers = tuple((name, response.headers[name]) for name in _FORWARDED_HEADERS if name in response.headers)
+        return GatewayResponse(response.status_code, headers, response.content)
+
+    async def _dispatch(self, method: str, target: str) -> tuple[GatewayResponse, Optional[str]]:
+        url = urlsplit(target)
+        if method != "GET":
+            return _error(405, "Only GET is supported"), None
+        if url.path == "/_gateway/stats":
+            body = {**asdict(self.stats), "cache_entries": len(self.cache), "cache_bytes": self.cache.size}
+            return GatewayResponse(200, (("content-type", "application/json"),), json.dumps(body).encode()), None
+        if not url.path.startswith("/api/") or len(url.path) == len("/api/"):
+            return _error(404, f"Unknown path {url.path}"), None
+        try:
+            return await self.fetch(url.path[len("/api/"):], parse_qsl(url.query, keep_blank_values=True))
+        except httpx.HTTPError as e:
+            return _error(502, f"Upstream request failed: {e!r}"), None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """One client connection; HTTP/1.1 keep-alive, requests answered in order."""
+        self._connections.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if headers.get("content-length"):
+                    await reader.readexactly(int(headers["content-length"]))
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    response, source = _error(400, "Malformed request line"), None
+                    keep_alive = False
+                else:
+                    method, target, version = parts
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                    response, source = await self._dispatch(method, target)
+
+                head = [f"HTTP/1.1 {response.status_code} {_REASONS.get(response.status_code, '')}"]
+                head += [f"{name}: {value}" for name, value in response.headers]
+                head.append(f"content-length: {len(response.body)}")
+                if source is not None:
+                    head.append(f"x-gateway-cache: {source}")
+                head.append("connection: keep-alive" if keep_alive else "connection: close")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + response.body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+def _error(status_code: int, message: str) -> GatewayResponse:
+    body = json.dumps({"status": "GATEWAY_ERROR", "message": message}).encode()
+    return GatewayResponse(status_code, (("content-type", "application/json"),), body)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dart_client.gateway", description="Local DART API gateway")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--requests-per-minute", type=int, default=100, help="Upstream request budget")
+    parser.add_argument("--cache-ttl", type=float, default=3600, help="Seconds responses are cached (0: no cache)")
+    parser.add_argument("--cache-mb", type=int, default=256, help="Cache size in MiB")
+    parser.add_argument("--api-key", help="DART API key (default: DART_API_KEY env var)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    gateway = DartGateway(
+        api_key=args.api_key,
+        requests_per_minute=args.requests_per_minute,
+        cache=ResponseCache(ttl=args.cache_ttl, max_bytes=args.cache_mb * 2**20),
+    )
+    with suppress(KeyboardInterrupt):
+        asyncio.run(gateway.serve_forever(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
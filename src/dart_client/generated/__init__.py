@@ -1,4 +1,30 @@
-from .api import GeneratedDartAPIMixin
-from .models import DartResponse
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["GeneratedDartAPIMixin", "DartResponse"]
+if TYPE_CHECKING:
+    from .api import GeneratedDartAPIMixin
+    from .fields import FIELD_TYPES
+    from .models import DartResponse
+    from .sync_api import GeneratedSyncDartAPIMixin
+
+# Loaded on first access: each client needs only one of the mixins
+_LAZY = {
+    "GeneratedDartAPIMixin": ".api",
+    "GeneratedSyncDartAPIMixin": ".sync_api",
+    "DartResponse": ".models",
+    "FIELD_TYPES": ".fields",
+}
+
+__all__ = ["GeneratedDartAPIMixin", "GeneratedSyncDartAPIMixin", "DartResponse", "FIELD_TYPES"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
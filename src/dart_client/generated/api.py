@@ -1,13 +1,21 @@
-from typing import Optional, Any, Dict, Union, List
-from ..models.corp_code import CorpCode
-from ..models.disclosure import DisclosureList
-from ..models.company import Company
+from typing import TYPE_CHECKING, Optional, Any, Dict, List
+
+from .registry import ENDPOINTS
+
+# Response models are imported where they are used, so that importing the client does not load pydantic
+if TYPE_CHECKING:
+    from ..models.corp_code import CorpCode
+    from ..models.disclosure import DisclosureList
+    from ..models.company import Company
 
 class GeneratedDartAPIMixin:
     """
     Auto-generated API methods from YAML specifications.
+
+    Each method is a typed wrapper over _call(), which looks the endpoint up
+    in the registry (generated/registry.py).
     """
-    async def get_corp_codes(self) -> List[CorpCode]:
+    async def get_corp_codes(self) -> "List[CorpCode]":
         """
         Helper to get corporation codes as a list of CorpCode objects.
         This is a wrapper around get_corp_code() which handles the XML/ZIP logic internally.
@@ -18,8 +26,26 @@ class GeneratedDartAPIMixin:
     async def request(self, endpoint: str, params: Dict[str, Any] | None = None) -> Any:
         raise NotImplementedError("Mixin expects 'request' method to be implemented by host class")
 
+    async def _call(self, method: str, **params: Any) -> Any:
+        """Shared body of the generated methods: drop None arguments, request, build the response model."""
+        endpoint = ENDPOINTS[method]
+        return endpoint.wrap(await self.request(endpoint.path, endpoint.build_params(params)))
+
     # --- Group DS001 ---
-    async def get_list(self, corp_code: Optional[str] = None, bgn_de: Optional[str] = None, end_de: Optional[str] = None, last_reprt_at: Optional[str] = None, pblntf_ty: Optional[str] = None, pblntf_detail_ty: Optional[str] = None, corp_cls: Optional[str] = None, sort: Optional[str] = None, sort_mth: Optional[str] = None, page_no: Optional[int] = None, page_count: Optional[int] = None) -> DisclosureList:
+    async def get_list(
+        self,
+        corp_code: Optional[str] = None,
+        bgn_de: Optional[str] = None,
+        end_de: Optional[str] = None,
+        last_reprt_at: Optional[str] = None,
+        pblntf_ty: Optional[str] = None,
+        pblntf_detail_ty: Optional[str] = None,
+        corp_cls: Optional[str] = None,
+        sort: Optional[str] = None,
+        sort_mth: Optional[str] = None,
+        page_no: Optional[int] = None,
+        page_count: Optional[int] = None,
+    ) -> "DisclosureList":
         """
         공시검색
         
@@ -42,25 +68,22 @@ class GeneratedDartAPIMixin:
             page_no (int): 페이지 번호(1~n)
             page_count (int): 페이지 건수(1~100)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-            "last_reprt_at": last_reprt_at,
-            "pblntf_ty": pblntf_ty,
-            "pblntf_detail_ty": pblntf_detail_ty,
-            "corp_cls": corp_cls,
-            "sort": sort,
-            "sort_mth": sort_mth,
-            "page_no": page_no,
-            "page_count": page_count,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        response = await self.request("list.json", params)
-        return DisclosureList(**response)
-
-    async def get_company(self, corp_code: str) -> Company:
+        return await self._call(
+            "get_list",
+            corp_code=corp_code,
+            bgn_de=bgn_de,
+            end_de=end_de,
+            last_reprt_at=last_reprt_at,
+            pblntf_ty=pblntf_ty,
+            pblntf_detail_ty=pblntf_detail_ty,
+            corp_cls=corp_cls,
+            sort=sort,
+            sort_mth=sort_mth,
+            page_no=page_no,
+            page_count=page_count,
+        )
+
+    async def get_company(self, corp_code: str) -> "Company":
         """
         기업개황
         
@@ -73,13 +96,7 @@ class GeneratedDartAPIMixin:
         Args:
             corp_code (str): 공시대상회사의 고유번호(8자리)
         """
-        params = {
-            "corp_code": corp_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        response = await self.request("company.json", params)
-        return Company(**response)
+        return await self._call("get_company", corp_code=corp_code)
 
     async def get_api_2019003(self, rcept_no: str) -> Dict[str, Any]:
         """
@@ -94,12 +111,7 @@ class GeneratedDartAPIMixin:
         Args:
             rcept_no: 접수번호 (14자리)
         """
-        params = {
-            "rcept_no": rcept_no,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("document.xml", params)
+        return await self._call("get_api_2019003", rcept_no=rcept_no)
 
     async def get_api_2019018(self) -> Dict[str, Any]:
         """
@@ -111,11 +123,7 @@ class GeneratedDartAPIMixin:
         Dataset: api_2019018
         Group: DS001
         """
-        params = {
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("corpCode.xml", params)
+        return await self._call("get_api_2019018")
 
     # --- Group DS002 ---
     async def get_irds_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
@@ -133,14 +141,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("irdsSttus.json", params)
+        return await self._call("get_irds_sttus", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_alot_matter(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -157,14 +158,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("alotMatter.json", params)
+        return await self._call("get_alot_matter", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_tesstk_acqs_dsps_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -181,14 +175,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("tesstkAcqsDspsSttus.json", params)
+        return await self._call(
+            "get_tesstk_acqs_dsps_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_hyslr_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -205,14 +197,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("hyslrSttus.json", params)
+        return await self._call("get_hyslr_sttus", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_hyslr_chg_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -229,14 +214,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("hyslrChgSttus.json", params)
+        return await self._call("get_hyslr_chg_sttus", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_mrhl_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -253,14 +231,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("mrhlSttus.json", params)
+        return await self._call("get_mrhl_sttus", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_exctv_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -277,14 +248,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("exctvSttus.json", params)
+        return await self._call("get_exctv_sttus", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_emp_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -301,14 +265,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("empSttus.json", params)
+        return await self._call("get_emp_sttus", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_hmv_audit_indvdl_by_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -325,14 +282,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("hmvAuditIndvdlBySttus.json", params)
+        return await self._call(
+            "get_hmv_audit_indvdl_by_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_hmv_audit_all_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -349,14 +304,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("hmvAuditAllSttus.json", params)
+        return await self._call(
+            "get_hmv_audit_all_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_indvdl_by_pay(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -373,14 +326,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("indvdlByPay.json", params)
+        return await self._call("get_indvdl_by_pay", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_otr_cpr_invstmnt_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -397,14 +343,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("otrCprInvstmntSttus.json", params)
+        return await self._call(
+            "get_otr_cpr_invstmnt_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_stock_totqy_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -421,14 +365,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("stockTotqySttus.json", params)
+        return await self._call(
+            "get_stock_totqy_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_det_scrits_isu_acmslt(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -445,16 +387,19 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("detScritsIsuAcmslt.json", params)
+        return await self._call(
+            "get_det_scrits_isu_acmslt",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
-    async def get_entrprs_bil_scrits_nrdmp_blce(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
+    async def get_entrprs_bil_scrits_nrdmp_blce(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+    ) -> Dict[str, Any]:
         """
         기업어음증권 미상환 잔액
         
@@ -469,14 +414,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("entrprsBilScritsNrdmpBlce.json", params)
+        return await self._call(
+            "get_entrprs_bil_scrits_nrdmp_blce",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_srtpd_psndbt_nrdmp_blce(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -493,14 +436,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("srtpdPsndbtNrdmpBlce.json", params)
+        return await self._call(
+            "get_srtpd_psndbt_nrdmp_blce",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_cprnd_nrdmp_blce(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -517,14 +458,7 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("cprndNrdmpBlce.json", params)
+        return await self._call("get_cprnd_nrdmp_blce", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_new_capl_scrits_nrdmp_blce(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -541,14 +475,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("newCaplScritsNrdmpBlce.json", params)
+        return await self._call(
+            "get_new_capl_scrits_nrdmp_blce",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_cndl_capl_scrits_nrdmp_blce(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -565,16 +497,19 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("cndlCaplScritsNrdmpBlce.json", params)
+        return await self._call(
+            "get_cndl_capl_scrits_nrdmp_blce",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
-    async def get_accnut_adtor_nm_nd_adt_opinion(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
+    async def get_accnut_adtor_nm_nd_adt_opinion(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+    ) -> Dict[str, Any]:
         """
         회계감사인의 명칭 및 감사의견
         
@@ -589,14 +524,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("accnutAdtorNmNdAdtOpinion.json", params)
+        return await self._call(
+            "get_accnut_adtor_nm_nd_adt_opinion",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_adt_servc_cncls_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -613,16 +546,19 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("adtServcCnclsSttus.json", params)
+        return await self._call(
+            "get_adt_servc_cncls_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
-    async def get_accnut_adtor_non_adt_servc_cncls_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
+    async def get_accnut_adtor_non_adt_servc_cncls_sttus(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+    ) -> Dict[str, Any]:
         """
         회계감사인과의 비감사용역 계약체결 현황
         
@@ -637,16 +573,19 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("accnutAdtorNonAdtServcCnclsSttus.json", params)
+        return await self._call(
+            "get_accnut_adtor_non_adt_servc_cncls_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
-    async def get_outcmpny_drctr_nd_change_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
+    async def get_outcmpny_drctr_nd_change_sttus(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+    ) -> Dict[str, Any]:
         """
         사외이사 및 그 변동현황
         
@@ -661,14 +600,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("outcmpnyDrctrNdChangeSttus.json", params)
+        return await self._call(
+            "get_outcmpny_drctr_nd_change_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_unrst_exctv_mendng_sttus(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -685,16 +622,19 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("unrstExctvMendngSttus.json", params)
+        return await self._call(
+            "get_unrst_exctv_mendng_sttus",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
-    async def get_drctr_adt_all_mendng_sttus_gmtsck_confm_amount(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
+    async def get_drctr_adt_all_mendng_sttus_gmtsck_confm_amount(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+    ) -> Dict[str, Any]:
         """
         이사·감사 전체의 보수현황(주주총회 승인금액)
         
@@ -709,16 +649,19 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("drctrAdtAllMendngSttusGmtsckConfmAmount.json", params)
+        return await self._call(
+            "get_drctr_adt_all_mendng_sttus_gmtsck_confm_amount",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
-    async def get_drctr_adt_all_mendng_sttus_mendng_pymntamt_ty_cl(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
+    async def get_drctr_adt_all_mendng_sttus_mendng_pymntamt_ty_cl(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+    ) -> Dict[str, Any]:
         """
         이사·감사 전체의 보수현황(보수지급금액 - 유형별)
         
@@ -733,14 +676,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("drctrAdtAllMendngSttusMendngPymntamtTyCl.json", params)
+        return await self._call(
+            "get_drctr_adt_all_mendng_sttus_mendng_pymntamt_ty_cl",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_pssrp_cptal_use_dtls(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -757,14 +698,12 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("pssrpCptalUseDtls.json", params)
+        return await self._call(
+            "get_pssrp_cptal_use_dtls",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     async def get_prvsrp_cptal_use_dtls(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
@@ -781,21 +720,20 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("prvsrpCptalUseDtls.json", params)
+        return await self._call(
+            "get_prvsrp_cptal_use_dtls",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+        )
 
     # --- Group DS003 ---
     async def get_fnltt_singl_acnt(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
         단일회사 주요계정
         
-        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에 XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
+        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에
+        XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
         
         Endpoint: fnlttSinglAcnt.json
         Dataset: fnltt_singl_acnt
@@ -806,21 +744,15 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("fnlttSinglAcnt.json", params)
+        return await self._call("get_fnltt_singl_acnt", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_fnltt_multi_acnt(self, corp_code: str, bsns_year: str, reprt_code: str) -> Dict[str, Any]:
         """
         다중회사 주요계정
         
-        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에 XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
-(대상법인 복수조회 복수조회 가능)
+        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에
+        XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
+        (대상법인 복수조회 복수조회 가능)
         
         Endpoint: fnlttMultiAcnt.json
         Dataset: fnltt_multi_acnt
@@ -831,20 +763,14 @@ class GeneratedDartAPIMixin:
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("fnlttMultiAcnt.json", params)
+        return await self._call("get_fnltt_multi_acnt", corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
 
     async def get_api_2019019(self, rcept_no: str, reprt_code: str) -> Dict[str, Any]:
         """
         재무제표 원본파일(XBRL)
         
-        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에 XBRL재무제표의 원본파일(XBRL)을 제공합니다.
+        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에
+        XBRL재무제표의 원본파일(XBRL)을 제공합니다.
         
         Endpoint: api_2019019.json
         Dataset: api_2019019
@@ -854,19 +780,20 @@ class GeneratedDartAPIMixin:
             rcept_no: 접수번호 (14자리)
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
         """
-        params = {
-            "rcept_no": rcept_no,
-            "reprt_code": reprt_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("api_2019019.json", params)
+        return await self._call("get_api_2019019", rcept_no=rcept_no, reprt_code=reprt_code)
 
-    async def get_fnltt_singl_acnt_all(self, corp_code: str, bsns_year: str, reprt_code: str, fs_div: str) -> Dict[str, Any]:
+    async def get_fnltt_singl_acnt_all(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+        fs_div: str,
+    ) -> Dict[str, Any]:
         """
         단일회사 전체 재무제표
         
-        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에 XBRL재무제표의 모든계정과목을 제공합니다.
+        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에
+        XBRL재무제표의 모든계정과목을 제공합니다.
         
         Endpoint: fnlttSinglAcntAll.json
         Dataset: fnltt_singl_acnt_all
@@ -878,15 +805,13 @@ class GeneratedDartAPIMixin:
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
             fs_div: 개별/연결구분 (CFS=연결, OFS=개별)
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-            "fs_div": fs_div,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("fnlttSinglAcntAll.json", params)
+        return await self._call(
+            "get_fnltt_singl_acnt_all",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+            fs_div=fs_div,
+        )
 
     async def get_xbrl_taxonomy(self, sj_div: str) -> Dict[str, Any]:
         """
@@ -901,18 +826,20 @@ class GeneratedDartAPIMixin:
         Args:
             sj_div: 재무제표구분 (BS=재무상태표, IS=손익계산서, etc)
         """
-        params = {
-            "sj_div": sj_div,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("xbrlTaxonomy.json", params)
+        return await self._call("get_xbrl_taxonomy", sj_div=sj_div)
 
-    async def get_fnltt_singl_indx(self, corp_code: str, bsns_year: str, reprt_code: str, idx_cl_code: str) -> Dict[str, Any]:
+    async def get_fnltt_singl_indx(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+        idx_cl_code: str,
+    ) -> Dict[str, Any]:
         """
         단일회사 주요 재무지표
         
-        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에 XBRL재무제표의 주요 재무지표를 제공합니다.
+        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에
+        XBRL재무제표의 주요 재무지표를 제공합니다.
         
         Endpoint: fnlttSinglIndx.json
         Dataset: fnltt_singl_indx
@@ -924,21 +851,26 @@ class GeneratedDartAPIMixin:
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
             idx_cl_code: 지표구분코드
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-            "idx_cl_code": idx_cl_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("fnlttSinglIndx.json", params)
-
-    async def get_fnltt_cmpny_indx(self, corp_code: str, bsns_year: str, reprt_code: str, idx_cl_code: str) -> Dict[str, Any]:
+        return await self._call(
+            "get_fnltt_singl_indx",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+            idx_cl_code=idx_cl_code,
+        )
+
+    async def get_fnltt_cmpny_indx(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        reprt_code: str,
+        idx_cl_code: str,
+    ) -> Dict[str, Any]:
         """
         다중회사 주요 재무지표
         
-        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에 XBRL재무제표의 주요 재무지표를 제공합니다.(대상법인 복수조회 가능)
+        상장법인(유가증권, 코스닥) 및 주요 비상장법인(사업보고서 제출대상 &amp; IFRS 적용)이 제출한 정기보고서 내에
+        XBRL재무제표의 주요 재무지표를 제공합니다.(대상법인 복수조회 가능)
         
         Endpoint: fnlttCmpnyIndx.json
         Dataset: fnltt_cmpny_indx
@@ -950,15 +882,13 @@ class GeneratedDartAPIMixin:
             reprt_code: 보고서 코드 (11011=사업보고서, 11012=반기, 11013=1분기, 11014=3분기)
             idx_cl_code: 지표구분코드
         """
-        params = {
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-            "idx_cl_code": idx_cl_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("fnlttCmpnyIndx.json", params)
+        return await self._call(
+            "get_fnltt_cmpny_indx",
+            corp_code=corp_code,
+            bsns_year=bsns_year,
+            reprt_code=reprt_code,
+            idx_cl_code=idx_cl_code,
+        )
 
     # --- Group DS004 ---
     async def get_majorstock(self, corp_code: str) -> Dict[str, Any]:
@@ -974,19 +904,14 @@ class GeneratedDartAPIMixin:
         Args:
             corp_code: 기업 고유번호 (8자리)
         """
-        params = {
-            "corp_code": corp_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("majorstock.json", params)
+        return await self._call("get_majorstock", corp_code=corp_code)
 
     async def get_elestock(self, corp_code: str) -> Dict[str, Any]:
         """
         임원ㆍ주요주주 소유보고
         
         임원ㆍ주요주주특정증권등 소유상황보고서 내에 임원ㆍ주요주주 소유보고
-정보를 제공합니다.
+        정보를 제공합니다.
         
         Endpoint: elestock.json
         Dataset: elestock
@@ -995,12 +920,7 @@ class GeneratedDartAPIMixin:
         Args:
             corp_code: 기업 고유번호 (8자리)
         """
-        params = {
-            "corp_code": corp_code,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("elestock.json", params)
+        return await self._call("get_elestock", corp_code=corp_code)
 
     # --- Group DS005 ---
     async def get_ast_inhtrf_etc_ptbk_opt(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
@@ -1018,14 +938,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("astInhtrfEtcPtbkOpt.json", params)
+        return await self._call("get_ast_inhtrf_etc_ptbk_opt", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_df_ocr(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1042,14 +955,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("dfOcr.json", params)
+        return await self._call("get_df_ocr", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_bsn_sp(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1066,14 +972,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("bsnSp.json", params)
+        return await self._call("get_bsn_sp", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_ctrcvs_bgrq(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1090,14 +989,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("ctrcvsBgrq.json", params)
+        return await self._call("get_ctrcvs_bgrq", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_ds_rs_ocr(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1114,14 +1006,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("dsRsOcr.json", params)
+        return await self._call("get_ds_rs_ocr", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_piic_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1138,14 +1023,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("piicDecsn.json", params)
+        return await self._call("get_piic_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_fric_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1162,14 +1040,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("fricDecsn.json", params)
+        return await self._call("get_fric_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_pifric_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1186,14 +1057,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("pifricDecsn.json", params)
+        return await self._call("get_pifric_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_cr_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1210,14 +1074,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("crDecsn.json", params)
+        return await self._call("get_cr_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_bnk_mngt_pcbg(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1234,14 +1091,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("bnkMngtPcbg.json", params)
+        return await self._call("get_bnk_mngt_pcbg", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_lwst_lg(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1258,14 +1108,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("lwstLg.json", params)
+        return await self._call("get_lwst_lg", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_ov_lst_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1282,14 +1125,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("ovLstDecsn.json", params)
+        return await self._call("get_ov_lst_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_ov_dlst_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1306,14 +1142,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("ovDlstDecsn.json", params)
+        return await self._call("get_ov_dlst_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_ov_lst(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1330,14 +1159,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("ovLst.json", params)
+        return await self._call("get_ov_lst", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_ov_dlst(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1354,14 +1176,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("ovDlst.json", params)
+        return await self._call("get_ov_dlst", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_cvbd_is_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1378,14 +1193,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("cvbdIsDecsn.json", params)
+        return await self._call("get_cvbd_is_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_bdwt_is_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1402,14 +1210,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("bdwtIsDecsn.json", params)
+        return await self._call("get_bdwt_is_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_exbd_is_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1426,14 +1227,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("exbdIsDecsn.json", params)
+        return await self._call("get_exbd_is_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_bnk_mngt_pcsp(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1450,14 +1244,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("bnkMngtPcsp.json", params)
+        return await self._call("get_bnk_mngt_pcsp", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_wd_cocobd_is_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1474,14 +1261,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("wdCocobdIsDecsn.json", params)
+        return await self._call("get_wd_cocobd_is_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_tsstk_aq_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1498,14 +1278,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("tsstkAqDecsn.json", params)
+        return await self._call("get_tsstk_aq_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_tsstk_dp_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1522,14 +1295,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("tsstkDpDecsn.json", params)
+        return await self._call("get_tsstk_dp_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_tsstk_aq_trctr_cns_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1546,14 +1312,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("tsstkAqTrctrCnsDecsn.json", params)
+        return await self._call("get_tsstk_aq_trctr_cns_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_tsstk_aq_trctr_cc_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1570,14 +1329,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("tsstkAqTrctrCcDecsn.json", params)
+        return await self._call("get_tsstk_aq_trctr_cc_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_bsn_inh_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1594,14 +1346,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("bsnInhDecsn.json", params)
+        return await self._call("get_bsn_inh_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_bsn_trf_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1618,14 +1363,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("bsnTrfDecsn.json", params)
+        return await self._call("get_bsn_trf_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_tgast_inh_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1642,14 +1380,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("tgastInhDecsn.json", params)
+        return await self._call("get_tgast_inh_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_tgast_trf_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1666,14 +1397,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("tgastTrfDecsn.json", params)
+        return await self._call("get_tgast_trf_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_otcpr_stk_invscr_inh_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1690,14 +1414,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("otcprStkInvscrInhDecsn.json", params)
+        return await self._call("get_otcpr_stk_invscr_inh_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_otcpr_stk_invscr_trf_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1714,14 +1431,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("otcprStkInvscrTrfDecsn.json", params)
+        return await self._call("get_otcpr_stk_invscr_trf_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_stkrtbd_inh_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1738,14 +1448,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("stkrtbdInhDecsn.json", params)
+        return await self._call("get_stkrtbd_inh_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_stkrtbd_trf_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1762,14 +1465,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("stkrtbdTrfDecsn.json", params)
+        return await self._call("get_stkrtbd_trf_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_cmp_mg_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1786,14 +1482,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("cmpMgDecsn.json", params)
+        return await self._call("get_cmp_mg_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_cmp_dv_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1810,14 +1499,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("cmpDvDecsn.json", params)
+        return await self._call("get_cmp_dv_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_cmp_dvmg_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1834,14 +1516,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("cmpDvmgDecsn.json", params)
+        return await self._call("get_cmp_dvmg_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_stk_extr_decsn(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1858,14 +1533,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("stkExtrDecsn.json", params)
+        return await self._call("get_stk_extr_decsn", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     # --- Group DS006 ---
     async def get_estk_rs(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
@@ -1883,14 +1551,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("estkRs.json", params)
+        return await self._call("get_estk_rs", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_bd_rs(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1907,14 +1568,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("bdRs.json", params)
+        return await self._call("get_bd_rs", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_stkdp_rs(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1931,14 +1585,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("stkdpRs.json", params)
+        return await self._call("get_stkdp_rs", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_mg_rs(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1955,14 +1602,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("mgRs.json", params)
+        return await self._call("get_mg_rs", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_extr_rs(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -1979,14 +1619,7 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("extrRs.json", params)
+        return await self._call("get_extr_rs", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
 
     async def get_dv_rs(self, corp_code: str, bgn_de: str, end_de: str) -> Dict[str, Any]:
         """
@@ -2003,11 +1636,4 @@ class GeneratedDartAPIMixin:
             bgn_de: 시작일 (YYYYMMDD)
             end_de: 종료일 (YYYYMMDD)
         """
-        params = {
-            "corp_code": corp_code,
-            "bgn_de": bgn_de,
-            "end_de": end_de,
-        }
-        # Filter None values
-        params = {k: v for k, v in params.items() if v is not None}
-        return await self.request("dvRs.json", params)
+        return await self._call("get_dv_rs", corp_code=corp_code, bgn_de=bgn_de, end_de=end_de)
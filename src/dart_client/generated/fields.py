@@ -0,0 +1,110 @@
+"""
+Response field types per endpoint, generated from the YAML specifications.
+
+Only non-string fields are listed. FIELD_TYPE_RULES is what the generator
+infers types from, for endpoints or fields not listed here.
+"""
+
+FIELD_TYPE_RULES = (
+    (r"(_rt|_rate|^stkrt|_stkrt)(_irds)?$", "float"),
+    (r"(_co|_qy|_cnt|_amount|_am|_totamt|_totqy|^stkqy|_stkqy|^nmpr|^sm)(_irds)?$", "int"),
+    (r"(_dt|_de|^change_on)$", "date"),
+)
+
+FIELD_TYPES = {
+    # --- Group DS002 ---
+    "irdsSttus.json": {
+        "isu_dcrs_de": "date",
+        "isu_dcrs_qy": "int",
+        "isu_dcrs_mstvdv_fval_amount": "int",
+        "isu_dcrs_mstvdv_amount": "int",
+        "stlm_dt": "date",
+    },
+    "tesstkAcqsDspsSttus.json": {
+        "bsis_qy": "int",
+        "change_qy_acqs": "int",
+        "change_qy_dsps": "int",
+        "change_qy_incnr": "int",
+        "trmend_qy": "int",
+        "stlm_dt": "date",
+    },
+    "hyslrSttus.json": {
+        "bsis_posesn_stock_co": "int",
+        "bsis_posesn_stock_qota_rt": "float",
+        "trmend_posesn_stock_co": "int",
+        "trmend_posesn_stock_qota_rt": "float",
+        "stlm_dt": "date",
+    },
+    "hyslrChgSttus.json": {
+        "change_on": "date",
+        "posesn_stock_co": "int",
+        "qota_rt": "float",
+        "stlm_dt": "date",
+    },
+    "mrhlSttus.json": {
+        "shrholdr_co": "int",
+        "shrholdr_tot_co": "int",
+        "shrholdr_rate": "float",
+        "hold_stock_co": "int",
+        "stock_tot_co": "int",
+        "hold_stock_rate": "float",
+        "stlm_dt": "date",
+    },
+    "empSttus.json": {
+        "reform_bfe_emp_co_rgllbr": "int",
+        "reform_bfe_emp_co_cnttk": "int",
+        "reform_bfe_emp_co_etc": "int",
+        "rgllbr_co": "int",
+        "rgllbr_abacpt_labrr_co": "int",
+        "cnttk_co": "int",
+        "cnttk_abacpt_labrr_co": "int",
+        "sm": "int",
+        "fyer_salary_totamt": "int",
+        "jan_salary_am": "int",
+        "stlm_dt": "date",
+    },
+    "hmvAuditIndvdlBySttus.json": {
+        "mendng_totamt": "int",
+        "stlm_dt": "date",
+    },
+    "hmvAuditAllSttus.json": {
+        "nmpr": "int",
+        "mendng_totamt": "int",
+        "jan_avrg_mendng_am": "int",
+        "stlm_dt": "date",
+    },
+    "indvdlByPay.json": {
+        "mendng_totamt": "int",
+        "stlm_dt": "date",
+    },
+    "stockTotqySttus.json": {
+        "isu_stock_totqy": "int",
+        "now_to_isu_stock_totqy": "int",
+        "now_to_dcrs_stock_totqy": "int",
+        "redc": "int",
+        "profit_incnr": "int",
+        "rdmstk_repy": "int",
+        "etc": "int",
+        "istc_totqy": "int",
+        "tesstk_co": "int",
+        "distb_stock_co": "int",
+        "stlm_dt": "date",
+    },
+    # --- Group DS004 ---
+    "majorstock.json": {
+        "rcept_dt": "date",
+        "stkqy": "int",
+        "stkqy_irds": "int",
+        "stkrt": "float",
+        "stkrt_irds": "float",
+        "ctr_stkqy": "int",
+        "ctr_stkrt": "float",
+    },
+    "elestock.json": {
+        "rcept_dt": "date",
+        "sp_stock_lmp_cnt": "int",
+        "sp_stock_lmp_irds_cnt": "int",
+        "sp_stock_lmp_rate": "float",
+        "sp_stock_lmp_irds_rate": "float",
+    },
+}
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Any, Dict
+from pydantic import BaseModel
+from typing import List, Any, Dict
 
 class DartResponse(BaseModel):
     status: str
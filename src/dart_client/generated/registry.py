@@ -0,0 +1,273 @@
+"""
+Endpoint registry, generated from the YAML specifications.
+
+Endpoint(method, path, group, name, required, optional, flags, model) per API,
+in specification order. Look entries up through dart_client.endpoints.
+"""
+from ..endpoints import DATE_RANGE_PARAMS, FILE, MULTI_CORP, PAGINATED, PERIODIC_PARAMS, Endpoint
+
+ENDPOINTS: dict[str, Endpoint] = {e.method: e for e in (
+    # --- Group DS001 ---
+    Endpoint(
+        "get_list",
+        "list.json",
+        "DS001",
+        "공시검색",
+        (),
+        optional=(
+            "corp_code",
+            "bgn_de",
+            "end_de",
+            "last_reprt_at",
+            "pblntf_ty",
+            "pblntf_detail_ty",
+            "corp_cls",
+            "sort",
+            "sort_mth",
+            "page_no",
+            "page_count",
+        ),
+        flags=PAGINATED,
+        model="disclosure.DisclosureList",
+    ),
+    Endpoint("get_company", "company.json", "DS001", "기업개황", ("corp_code",), model="company.Company"),
+    Endpoint("get_api_2019003", "document.xml", "DS001", "공시서류원본파일", ("rcept_no",), flags=FILE),
+    Endpoint("get_api_2019018", "corpCode.xml", "DS001", "고유번호", (), flags=FILE),
+    # --- Group DS002 ---
+    Endpoint("get_irds_sttus", "irdsSttus.json", "DS002", "증자(감자) 현황", PERIODIC_PARAMS),
+    Endpoint("get_alot_matter", "alotMatter.json", "DS002", "배당에 관한 사항", PERIODIC_PARAMS),
+    Endpoint(
+        "get_tesstk_acqs_dsps_sttus",
+        "tesstkAcqsDspsSttus.json",
+        "DS002",
+        "자기주식 취득 및 처분 현황",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint("get_hyslr_sttus", "hyslrSttus.json", "DS002", "최대주주 현황", PERIODIC_PARAMS),
+    Endpoint("get_hyslr_chg_sttus", "hyslrChgSttus.json", "DS002", "최대주주 변동현황", PERIODIC_PARAMS),
+    Endpoint("get_mrhl_sttus", "mrhlSttus.json", "DS002", "소액주주 현황", PERIODIC_PARAMS),
+    Endpoint("get_exctv_sttus", "exctvSttus.json", "DS002", "임원 현황", PERIODIC_PARAMS),
+    Endpoint("get_emp_sttus", "empSttus.json", "DS002", "직원 현황", PERIODIC_PARAMS),
+    Endpoint(
+        "get_hmv_audit_indvdl_by_sttus",
+        "hmvAuditIndvdlBySttus.json",
+        "DS002",
+        "이사·감사의 개인별 보수현황(5억원 이상)",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_hmv_audit_all_sttus",
+        "hmvAuditAllSttus.json",
+        "DS002",
+        "이사·감사 전체의 보수현황(보수지급금액 - 이사·감사 전체)",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_indvdl_by_pay",
+        "indvdlByPay.json",
+        "DS002",
+        "개인별 보수지급 금액(5억이상 상위5인)",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint("get_otr_cpr_invstmnt_sttus", "otrCprInvstmntSttus.json", "DS002", "타법인 출자현황", PERIODIC_PARAMS),
+    Endpoint("get_stock_totqy_sttus", "stockTotqySttus.json", "DS002", "주식의 총수 현황", PERIODIC_PARAMS),
+    Endpoint("get_det_scrits_isu_acmslt", "detScritsIsuAcmslt.json", "DS002", "채무증권 발행실적", PERIODIC_PARAMS),
+    Endpoint(
+        "get_entrprs_bil_scrits_nrdmp_blce",
+        "entrprsBilScritsNrdmpBlce.json",
+        "DS002",
+        "기업어음증권 미상환 잔액",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_srtpd_psndbt_nrdmp_blce",
+        "srtpdPsndbtNrdmpBlce.json",
+        "DS002",
+        "단기사채 미상환 잔액",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint("get_cprnd_nrdmp_blce", "cprndNrdmpBlce.json", "DS002", "회사채 미상환 잔액", PERIODIC_PARAMS),
+    Endpoint(
+        "get_new_capl_scrits_nrdmp_blce",
+        "newCaplScritsNrdmpBlce.json",
+        "DS002",
+        "신종자본증권 미상환 잔액",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_cndl_capl_scrits_nrdmp_blce",
+        "cndlCaplScritsNrdmpBlce.json",
+        "DS002",
+        "조건부 자본증권 미상환 잔액",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_accnut_adtor_nm_nd_adt_opinion",
+        "accnutAdtorNmNdAdtOpinion.json",
+        "DS002",
+        "회계감사인의 명칭 및 감사의견",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint("get_adt_servc_cncls_sttus", "adtServcCnclsSttus.json", "DS002", "감사용역체결현황", PERIODIC_PARAMS),
+    Endpoint(
+        "get_accnut_adtor_non_adt_servc_cncls_sttus",
+        "accnutAdtorNonAdtServcCnclsSttus.json",
+        "DS002",
+        "회계감사인과의 비감사용역 계약체결 현황",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_outcmpny_drctr_nd_change_sttus",
+        "outcmpnyDrctrNdChangeSttus.json",
+        "DS002",
+        "사외이사 및 그 변동현황",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_unrst_exctv_mendng_sttus",
+        "unrstExctvMendngSttus.json",
+        "DS002",
+        "미등기임원 보수현황",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_drctr_adt_all_mendng_sttus_gmtsck_confm_amount",
+        "drctrAdtAllMendngSttusGmtsckConfmAmount.json",
+        "DS002",
+        "이사·감사 전체의 보수현황(주주총회 승인금액)",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint(
+        "get_drctr_adt_all_mendng_sttus_mendng_pymntamt_ty_cl",
+        "drctrAdtAllMendngSttusMendngPymntamtTyCl.json",
+        "DS002",
+        "이사·감사 전체의 보수현황(보수지급금액 - 유형별)",
+        PERIODIC_PARAMS,
+    ),
+    Endpoint("get_pssrp_cptal_use_dtls", "pssrpCptalUseDtls.json", "DS002", "공모자금의 사용내역", PERIODIC_PARAMS),
+    Endpoint("get_prvsrp_cptal_use_dtls", "prvsrpCptalUseDtls.json", "DS002", "사모자금의 사용내역", PERIODIC_PARAMS),
+    # --- Group DS003 ---
+    Endpoint("get_fnltt_singl_acnt", "fnlttSinglAcnt.json", "DS003", "단일회사 주요계정", PERIODIC_PARAMS),
+    Endpoint(
+        "get_fnltt_multi_acnt",
+        "fnlttMultiAcnt.json",
+        "DS003",
+        "다중회사 주요계정",
+        PERIODIC_PARAMS,
+        flags=MULTI_CORP,
+    ),
+    Endpoint(
+        "get_api_2019019",
+        "api_2019019.json",
+        "DS003",
+        "재무제표 원본파일(XBRL)",
+        ("rcept_no", "reprt_code"),
+        flags=FILE,
+    ),
+    Endpoint(
+        "get_fnltt_singl_acnt_all",
+        "fnlttSinglAcntAll.json",
+        "DS003",
+        "단일회사 전체 재무제표",
+        ("corp_code", "bsns_year", "reprt_code", "fs_div"),
+    ),
+    Endpoint("get_xbrl_taxonomy", "xbrlTaxonomy.json", "DS003", "XBRL택사노미재무제표양식", ("sj_div",)),
+    Endpoint(
+        "get_fnltt_singl_indx",
+        "fnlttSinglIndx.json",
+        "DS003",
+        "단일회사 주요 재무지표",
+        ("corp_code", "bsns_year", "reprt_code", "idx_cl_code"),
+    ),
+    Endpoint(
+        "get_fnltt_cmpny_indx",
+        "fnlttCmpnyIndx.json",
+        "DS003",
+        "다중회사 주요 재무지표",
+        ("corp_code", "bsns_year", "reprt_code", "idx_cl_code"),
+        flags=MULTI_CORP,
+    ),
+    # --- Group DS004 ---
+    Endpoint("get_majorstock", "majorstock.json", "DS004", "대량보유 상황보고", ("corp_code",)),
+    Endpoint("get_elestock", "elestock.json", "DS004", "임원ㆍ주요주주 소유보고", ("corp_code",)),
+    # --- Group DS005 ---
+    Endpoint(
+        "get_ast_inhtrf_etc_ptbk_opt",
+        "astInhtrfEtcPtbkOpt.json",
+        "DS005",
+        "자산양수도(기타), 풋백옵션",
+        DATE_RANGE_PARAMS,
+    ),
+    Endpoint("get_df_ocr", "dfOcr.json", "DS005", "부도발생", DATE_RANGE_PARAMS),
+    Endpoint("get_bsn_sp", "bsnSp.json", "DS005", "영업정지", DATE_RANGE_PARAMS),
+    Endpoint("get_ctrcvs_bgrq", "ctrcvsBgrq.json", "DS005", "회생절차 개시신청", DATE_RANGE_PARAMS),
+    Endpoint("get_ds_rs_ocr", "dsRsOcr.json", "DS005", "해산사유 발생", DATE_RANGE_PARAMS),
+    Endpoint("get_piic_decsn", "piicDecsn.json", "DS005", "유상증자 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_fric_decsn", "fricDecsn.json", "DS005", "무상증자 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_pifric_decsn", "pifricDecsn.json", "DS005", "유무상증자 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_cr_decsn", "crDecsn.json", "DS005", "감자 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_bnk_mngt_pcbg", "bnkMngtPcbg.json", "DS005", "채권은행 등의 관리절차 개시", DATE_RANGE_PARAMS),
+    Endpoint("get_lwst_lg", "lwstLg.json", "DS005", "소송 등의 제기", DATE_RANGE_PARAMS),
+    Endpoint("get_ov_lst_decsn", "ovLstDecsn.json", "DS005", "해외 증권시장 주권등 상장 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_ov_dlst_decsn", "ovDlstDecsn.json", "DS005", "해외 증권시장 주권등 상장폐지 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_ov_lst", "ovLst.json", "DS005", "해외 증권시장 주권등 상장", DATE_RANGE_PARAMS),
+    Endpoint("get_ov_dlst", "ovDlst.json", "DS005", "해외 증권시장 주권등 상장폐지", DATE_RANGE_PARAMS),
+    Endpoint("get_cvbd_is_decsn", "cvbdIsDecsn.json", "DS005", "전환사채권 발행결정", DATE_RANGE_PARAMS),
+    Endpoint("get_bdwt_is_decsn", "bdwtIsDecsn.json", "DS005", "신주인수권부사채권 발행결정", DATE_RANGE_PARAMS),
+    Endpoint("get_exbd_is_decsn", "exbdIsDecsn.json", "DS005", "교환사채권 발행결정", DATE_RANGE_PARAMS),
+    Endpoint("get_bnk_mngt_pcsp", "bnkMngtPcsp.json", "DS005", "채권은행 등의 관리절차 중단", DATE_RANGE_PARAMS),
+    Endpoint(
+        "get_wd_cocobd_is_decsn",
+        "wdCocobdIsDecsn.json",
+        "DS005",
+        "상각형 조건부자본증권 발행결정",
+        DATE_RANGE_PARAMS,
+    ),
+    Endpoint("get_tsstk_aq_decsn", "tsstkAqDecsn.json", "DS005", "자기주식 취득 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_tsstk_dp_decsn", "tsstkDpDecsn.json", "DS005", "자기주식 처분 결정", DATE_RANGE_PARAMS),
+    Endpoint(
+        "get_tsstk_aq_trctr_cns_decsn",
+        "tsstkAqTrctrCnsDecsn.json",
+        "DS005",
+        "자기주식취득 신탁계약 체결 결정",
+        DATE_RANGE_PARAMS,
+    ),
+    Endpoint(
+        "get_tsstk_aq_trctr_cc_decsn",
+        "tsstkAqTrctrCcDecsn.json",
+        "DS005",
+        "자기주식취득 신탁계약 해지 결정",
+        DATE_RANGE_PARAMS,
+    ),
+    Endpoint("get_bsn_inh_decsn", "bsnInhDecsn.json", "DS005", "영업양수 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_bsn_trf_decsn", "bsnTrfDecsn.json", "DS005", "영업양도 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_tgast_inh_decsn", "tgastInhDecsn.json", "DS005", "유형자산 양수 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_tgast_trf_decsn", "tgastTrfDecsn.json", "DS005", "유형자산 양도 결정", DATE_RANGE_PARAMS),
+    Endpoint(
+        "get_otcpr_stk_invscr_inh_decsn",
+        "otcprStkInvscrInhDecsn.json",
+        "DS005",
+        "타법인 주식 및 출자증권 양수결정",
+        DATE_RANGE_PARAMS,
+    ),
+    Endpoint(
+        "get_otcpr_stk_invscr_trf_decsn",
+        "otcprStkInvscrTrfDecsn.json",
+        "DS005",
+        "타법인 주식 및 출자증권 양도결정",
+        DATE_RANGE_PARAMS,
+    ),
+    Endpoint("get_stkrtbd_inh_decsn", "stkrtbdInhDecsn.json", "DS005", "주권 관련 사채권 양수 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_stkrtbd_trf_decsn", "stkrtbdTrfDecsn.json", "DS005", "주권 관련 사채권 양도 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_cmp_mg_decsn", "cmpMgDecsn.json", "DS005", "회사합병 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_cmp_dv_decsn", "cmpDvDecsn.json", "DS005", "회사분할 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_cmp_dvmg_decsn", "cmpDvmgDecsn.json", "DS005", "회사분할합병 결정", DATE_RANGE_PARAMS),
+    Endpoint("get_stk_extr_decsn", "stkExtrDecsn.json", "DS005", "주식교환·이전 결정", DATE_RANGE_PARAMS),
+    # --- Group DS006 ---
+    Endpoint("get_estk_rs", "estkRs.json", "DS006", "지분증권", DATE_RANGE_PARAMS),
+    Endpoint("get_bd_rs", "bdRs.json", "DS006", "채무증권", DATE_RANGE_PARAMS),
+    Endpoint("get_stkdp_rs", "stkdpRs.json", "DS006", "증권예탁증권", DATE_RANGE_PARAMS),
+    Endpoint("get_mg_rs", "mgRs.json", "DS006", "합병", DATE_RANGE_PARAMS),
+    Endpoint("get_extr_rs", "extrRs.json", "DS006", "주식의포괄적교환·이전", DATE_RANGE_PARAMS),
+    Endpoint("get_dv_rs", "dvRs.json", "DS006", "분할", DATE_RANGE_PARAMS),
+)}
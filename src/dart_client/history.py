@@ -0,0 +1,163 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from .errors import DartNoDataError
+from .utils import parse_amount
+
+ANNUAL_REPORT = "11011"
+
+# Amount column -> how many years before bsns_year it describes.
+# Only annual reports carry all three columns.
+PERIOD_COLUMNS: dict[str, int] = {
+    "thstrm_amount": 0,     # 당기
+    "frmtrm_amount": 1,     # 전기
+    "bfefrmtrm_amount": 2,  # 전전기
+}
+
+# 자본변동표 rows are not one value per account and period, so they are left out by default
+DEFAULT_SJ_DIVS = ("BS", "IS", "CIS", "CF")
+
+AccountKey = tuple[str, str]  # (sj_div, account_id or account_nm)
+
+
+def account_key(row: dict[str, Any]) -> AccountKey:
+    """Key a statement row by its standard account_id, or by name for non-standard accounts."""
+    account_id = row.get("account_id") or ""
+    if not account_id or account_id.startswith("-"):  # "-표준계정코드 미사용-"
+        account_id = row.get("account_nm", "")
+    return row.get("sj_div", ""), account_id
+
+
+def plan_years(start_year: int, end_year: int, stride: int = len(PERIOD_COLUMNS)) -> list[int]:
+    """
+    Business years to request so that every year in [start_year, end_year] is
+    covered by the current, prior or before-prior column of some annual report.
+    """
+    return list(range(end_year, start_year - 1, -stride))
+
+
+@dataclass
+class FinancialHistory:
+    """Per-year account series assembled from annual reports."""
+    corp_code: str
+    start_year: int
+    end_year: int
+    series: dict[int, dict[AccountKey, int]] = field(default_factory=dict)
+    # year -> bsns_year of the report its values were taken from
+    sources: dict[int, int] = field(default_factory=dict)
+    requested_years: list[int] = field(default_factory=list)
+
+    @property
+    def calls(self) -> int:
+        return len(self.requested_years)
+
+    @property
+    def naive_calls(self) -> int:
+        """Calls a one-report-per-year backfill would make."""
+        return self.end_year - self.start_year + 1
+
+    @property
+    def missing_years(self) -> list[int]:
+        return [y for y in range(self.start_year, self.end_year + 1) if y not in self.series]
+
+    def account(self, key: AccountKey) -> dict[int, int]:
+        """Values of one account by year."""
+        return {year: values[key] for year, values in sorted(self.series.items()) if key in values}
+
+
+class HistoricalFinancials:
+    """
+    Historical annual financials fetched with a stride of three years.
+
+    Every annual fnlttSinglAcnt/fnlttSinglAcntAll row carries the current,
+    prior and before-prior amounts, so one report covers three fiscal years.
+    Reports are requested newest first and a year's values come from the
+    newest report that covers it, which picks up restated figures. Years
+    left uncovered (a missing report, or a report lacking a column) are
+    filled from other reports that cover them.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        method: str = "get_fnltt_singl_acnt_all",
+        fs_div: str = "AUTO",
+        sj_divs: Iterable[str] = DEFAULT_SJ_DIVS,
+    ):
+        """
+        Initialize HistoricalFinancials.
+
+        Args:
+            client: DartAPIClient used for the statement calls.
+            method: "get_fnltt_singl_acnt_all" (all accounts) or "get_fnltt_singl_acnt" (main accounts).
+            fs_div: CFS/OFS, or "AUTO" to let the client resolve it (get_fnltt_singl_acnt_all only).
+                    For get_fnltt_singl_acnt, rows of this fs_div are used (AUTO prefers CFS).
+            sj_divs: Statement kinds to keep.
+        """
+        self.client = client
+        self.method = method
+        self.fs_div = fs_div
+        self.sj_divs = set(sj_divs)
+
+    async def _fetch_rows(self, corp_code: str, bsns_year: int) -> list[dict[str, Any]]:
+        if self.method == "get_fnltt_singl_acnt_all":
+            response = await self.client.get_fnltt_singl_acnt_all(
+                corp_code=corp_code, bsns_year=str(bsns_year), reprt_code=ANNUAL_REPORT, fs_div=self.fs_div
+            )
+            return response.get("list", [])
+
+        response = await getattr(self.client, self.method)(
+            corp_code=corp_code, bsns_year=str(bsns_year), reprt_code=ANNUAL_REPORT
+        )
+        rows = response.get("list", [])
+        preferred = ("CFS", "OFS") if self.fs_div == "AUTO" else (self.fs_div,)
+        for fs_div in preferred:
+            selected = [row for row in rows if row.get("fs_div") == fs_div]
+            if selected:
+                return selected
+        return []
+
+    def _absorb(self, history: FinancialHistory, report_year: int, rows: list[dict[str, Any]]) -> None:
+        for column, offset in PERIOD_COLUMNS.items():
+            year = report_year - offset
+            if not history.start_year <= year <= history.end_year:
+                continue
+            values = history.series.get(year)
+            for row in rows:
+                if row.get("sj_div") not in self.sj_divs:
+                    continue
+                amount = parse_amount(row.get(column))
+                if amount is None:
+                    continue
+                if values is None:
+                    values = history.series.setdefault(year, {})
+                    history.sources[year] = report_year
+                # Newer reports are absorbed first, so restated figures win
+                values.setdefault(account_key(row), amount)
+
+    async def fetch(self, corp_code: str, start_year: int, end_year: int) -> FinancialHistory:
+        """
+        Assemble annual values for start_year..end_year (inclusive).
+        """
+        history = FinancialHistory(corp_code=corp_code, start_year=start_year, end_year=end_year)
+
+        async def request(report_year: int) -> None:
+            history.requested_years.append(report_year)
+            try:
+                rows = await self._fetch_rows(corp_code, report_year)
+            except DartNoDataError:
+                return
+            self._absorb(history, report_year, rows)
+
+        for report_year in plan_years(start_year, end_year):
+            await request(report_year)
+
+        # Fill gaps newest first with the oldest unrequested report covering them,
+        # which also reaches furthest into the remaining older gaps
+        for year in sorted(history.missing_years, reverse=True):
+            for report_year in range(year, min(year + len(PERIOD_COLUMNS) - 1, end_year) + 1):
+                if year in history.series:
+                    break
+                if report_year not in history.requested_years:
+                    await request(report_year)
+        return history
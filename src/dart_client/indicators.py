@@ -0,0 +1,274 @@
+"""
+Local computation of DART financial indicators (fnlttSinglIndx) from fetched statements.
+
+Requires numpy: pip install "dart-api-client[analysis]"
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "dart_client.indicators requires numpy. Install it with: pip install 'dart-api-client[analysis]'"
+    ) from e
+
+from .utils import parse_amount
+
+# idx_cl_code values accepted by fnlttSinglIndx / fnlttCmpnyIndx
+PROFITABILITY = "M210000"  # 수익성지표
+STABILITY = "M220000"      # 안정성지표
+GROWTH = "M230000"         # 성장성지표
+ACTIVITY = "M240000"       # 활동성지표
+
+
+@dataclass(frozen=True)
+class Account:
+    """A statement account matched by standard account_id or by (normalized) account_nm."""
+    account_ids: tuple[str, ...]
+    names: tuple[str, ...]
+    sj_divs: tuple[str, ...]
+
+
+_IS = ("IS", "CIS")
+_BS = ("BS",)
+
+ACCOUNTS: dict[str, Account] = {
+    "revenue": Account(("ifrs-full_Revenue",), ("매출액", "수익(매출액)", "영업수익"), _IS),
+    "gross_profit": Account(("ifrs-full_GrossProfit",), ("매출총이익",), _IS),
+    "operating_income": Account(("dart_OperatingIncomeLoss",), ("영업이익", "영업이익(손실)"), _IS),
+    "pretax_income": Account(
+        ("ifrs-full_ProfitLossBeforeTax",),
+        ("법인세차감전순이익", "법인세비용차감전순이익", "법인세비용차감전순이익(손실)"),
+        _IS,
+    ),
+    "net_income": Account(("ifrs-full_ProfitLoss",), ("당기순이익", "당기순이익(손실)"), _IS),
+    "comprehensive_income": Account(("ifrs-full_ComprehensiveIncome",), ("총포괄손익", "총포괄이익"), _IS),
+    "total_assets": Account(("ifrs-full_Assets",), ("자산총계",), _BS),
+    "current_assets": Account(("ifrs-full_CurrentAssets",), ("유동자산",), _BS),
+    "noncurrent_assets": Account(("ifrs-full_NoncurrentAssets",), ("비유동자산",), _BS),
+    "inventories": Account(("ifrs-full_Inventories",), ("재고자산",), _BS),
+    "trade_receivables": Account(
+        ("dart_ShortTermTradeReceivable", "ifrs-full_TradeAndOtherCurrentReceivables"), ("매출채권",), _BS
+    ),
+    "ppe": Account(("ifrs-full_PropertyPlantAndEquipment",), ("유형자산",), _BS),
+    "total_liabilities": Account(("ifrs-full_Liabilities",), ("부채총계",), _BS),
+    "current_liabilities": Account(("ifrs-full_CurrentLiabilities",), ("유동부채",), _BS),
+    "total_equity": Account(("ifrs-full_Equity",), ("자본총계",), _BS),
+}
+
+_NAME_RE = re.compile(r"\s+")
+
+
+def _normalize(name: str) -> str:
+    return _NAME_RE.sub("", name)
+
+
+def _build_lookup() -> dict[tuple[str, str], str]:
+    lookup: dict[tuple[str, str], str] = {}
+    for key, account in ACCOUNTS.items():
+        for sj_div in account.sj_divs:
+            for account_id in account.account_ids:
+                lookup[(sj_div, account_id)] = key
+            for name in account.names:
+                lookup[(sj_div, _normalize(name))] = key
+    return lookup
+
+
+_LOOKUP = _build_lookup()
+
+
+@dataclass
+class StatementArrays:
+    """
+    Account values of many companies, one float64 array per account and period.
+    Missing accounts are NaN.
+    """
+    corp_codes: list[str]
+    current: dict[str, "np.ndarray"]
+    prior: dict[str, "np.ndarray"]
+
+
+def extract_accounts(responses: Iterable[dict[str, Any]], fs_div: str = "CFS") -> StatementArrays:
+    """
+    Collect the accounts used by the indicators from fnlttSinglAcnt,
+    fnlttSinglAcntAll or fnlttMultiAcnt responses.
+
+    Args:
+        responses: API responses (dicts with a "list" of rows), any number of companies each.
+        fs_div: Preferred statement kind for rows that carry fs_div; companies
+                without it fall back to the other kind.
+    """
+    rows = [row for response in responses for row in response.get("list", [])]
+
+    available: dict[str, set[str]] = {}
+    for row in rows:
+        available.setdefault(row["corp_code"], set()).add(row.get("fs_div", fs_div))
+    corp_codes = list(available)
+    column = {corp_code: i for i, corp_code in enumerate(corp_codes)}
+    chosen = {c: fs_div if fs_div in kinds else next(iter(kinds)) for c, kinds in available.items()}
+
+    n_accounts, n_companies = len(ACCOUNTS), len(corp_codes)
+    slot = {key: i for i, key in enumerate(ACCOUNTS)}
+    current = np.full((n_accounts, n_companies), np.nan)
+    prior = np.full((n_accounts, n_companies), np.nan)
+
+    for row in rows:
+        corp_code = row["corp_code"]
+        if row.get("fs_div", fs_div) != chosen[corp_code]:
+            continue
+        sj_div = row.get("sj_div", "")
+        key = _LOOKUP.get((sj_div, row.get("account_id", ""))) or _LOOKUP.get(
+            (sj_div, _normalize(row.get("account_nm", "")))
+        )
+        if key is None:
+            continue
+        i, j = slot[key], column[corp_code]
+        # The first matching row wins (e.g. IS before CIS for 당기순이익)
+        if np.isnan(current[i, j]):
+            value = parse_amount(row.get("thstrm_amount"))
+            if value is not None:
+                current[i, j] = value
+        if np.isnan(prior[i, j]):
+            value = parse_amount(row.get("frmtrm_amount"))
+            if value is not None:
+                prior[i, j] = value
+
+    return StatementArrays(
+        corp_codes=corp_codes,
+        current={key: current[i] for key, i in slot.items()},
+        prior={key: prior[i] for key, i in slot.items()},
+    )
+
+
+def _div(numerator: "np.ndarray", denominator: "np.ndarray") -> "np.ndarray":
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = numerator / denominator
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+def _pct(numerator: "np.ndarray", denominator: "np.ndarray") -> "np.ndarray":
+    return _div(numerator, denominator) * 100
+
+
+def _avg(s: StatementArrays, key: str) -> "np.ndarray":
+    # Averages fall back to the closing balance when the opening one is missing
+    return np.where(np.isnan(s.prior[key]), s.current[key], (s.current[key] + s.prior[key]) / 2)
+
+
+def _growth(s: StatementArrays, key: str) -> "np.ndarray":
+    return _pct(s.current[key] - s.prior[key], np.abs(s.prior[key]))
+
+
+@dataclass(frozen=True)
+class Indicator:
+    idx_cl_code: str
+    idx_nm: str
+    compute: Callable[[StatementArrays], "np.ndarray"]
+
+
+INDICATORS: tuple[Indicator, ...] = (
+    Indicator(PROFITABILITY, "영업이익률", lambda s: _pct(s.current["operating_income"], s.current["revenue"])),
+    Indicator(PROFITABILITY, "순이익률", lambda s: _pct(s.current["net_income"], s.current["revenue"])),
+    Indicator(PROFITABILITY, "매출총이익률", lambda s: _pct(s.current["gross_profit"], s.current["revenue"])),
+    Indicator(
+        PROFITABILITY, "총포괄이익률", lambda s: _pct(s.current["comprehensive_income"], s.current["revenue"])
+    ),
+    Indicator(PROFITABILITY, "세전계속사업이익률", lambda s: _pct(s.current["pretax_income"], s.current["revenue"])),
+    Indicator(PROFITABILITY, "ROE", lambda s: _pct(s.current["net_income"], _avg(s, "total_equity"))),
+    Indicator(PROFITABILITY, "ROA", lambda s: _pct(s.current["net_income"], _avg(s, "total_assets"))),
+    Indicator(STABILITY, "부채비율", lambda s: _pct(s.current["total_liabilities"], s.current["total_equity"])),
+    Indicator(STABILITY, "유동비율", lambda s: _pct(s.current["current_assets"], s.current["current_liabilities"])),
+    Indicator(
+        STABILITY,
+        "당좌비율",
+        lambda s: _pct(s.current["current_assets"] - s.current["inventories"], s.current["current_liabilities"]),
+    ),
+    Indicator(STABILITY, "자기자본비율", lambda s: _pct(s.current["total_equity"], s.current["total_assets"])),
+    Indicator(STABILITY, "비유동비율", lambda s: _pct(s.current["noncurrent_assets"], s.current["total_equity"])),
+    Indicator(GROWTH, "매출액증가율(YoY)", lambda s: _growth(s, "revenue")),
+    Indicator(GROWTH, "영업이익증가율(YoY)", lambda s: _growth(s, "operating_income")),
+    Indicator(GROWTH, "순이익증가율(YoY)", lambda s: _growth(s, "net_income")),
+    Indicator(GROWTH, "총자산증가율", lambda s: _growth(s, "total_assets")),
+    Indicator(GROWTH, "자기자본증가율", lambda s: _growth(s, "total_equity")),
+    Indicator(ACTIVITY, "총자산회전율", lambda s: _div(s.current["revenue"], _avg(s, "total_assets"))),
+    Indicator(ACTIVITY, "자기자본회전율", lambda s: _div(s.current["revenue"], _avg(s, "total_equity"))),
+    Indicator(ACTIVITY, "유형자산회전율", lambda s: _div(s.current["revenue"], _avg(s, "ppe"))),
+    Indicator(ACTIVITY, "재고자산회전율", lambda s: _div(s.current["revenue"], _avg(s, "inventories"))),
+    Indicator(ACTIVITY, "매출채권회전율", lambda s: _div(s.current["revenue"], _avg(s, "trade_receivables"))),
+)
+
+
+@dataclass
+class IndicatorTable:
+    """Indicator values by idx_nm, aligned with corp_codes."""
+    corp_codes: list[str]
+    values: dict[str, "np.ndarray"]
+    idx_cl_codes: dict[str, str]
+
+    def get(self, corp_code: str, idx_nm: str) -> Optional[float]:
+        value = self.values[idx_nm][self.corp_codes.index(corp_code)]
+        return None if np.isnan(value) else float(value)
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """Rows shaped like fnlttSinglIndx/fnlttCmpnyIndx list items (idx_val rounded to 2 decimals)."""
+        rows = []
+        for idx_nm, values in self.values.items():
+            for corp_code, value in zip(self.corp_codes, values, strict=True):
+                if not np.isnan(value):
+                    rows.append({
+                        "corp_code": corp_code,
+                        "idx_cl_code": self.idx_cl_codes[idx_nm],
+                        "idx_nm": idx_nm,
+                        "idx_val": f"{value:.2f}",
+                    })
+        return rows
+
+
+def compute_indicators(
+    statements: StatementArrays,
+    idx_cl_codes: Optional[Iterable[str]] = None,
+) -> IndicatorTable:
+    """
+    Compute indicators for every company at once.
+
+    Args:
+        statements: Output of extract_accounts().
+        idx_cl_codes: Restrict to these indicator groups (default: all four).
+    """
+    wanted = set(idx_cl_codes) if idx_cl_codes is not None else None
+    selected = [ind for ind in INDICATORS if wanted is None or ind.idx_cl_code in wanted]
+    return IndicatorTable(
+        corp_codes=statements.corp_codes,
+        values={ind.idx_nm: ind.compute(statements) for ind in selected},
+        idx_cl_codes={ind.idx_nm: ind.idx_cl_code for ind in selected},
+    )
+
+
+def compare_with_api(
+    table: IndicatorTable,
+    api_rows: Iterable[dict[str, Any]],
+    tolerance: float = 0.01,
+) -> list[dict[str, Any]]:
+    """
+    Check local values against fnlttSinglIndx/fnlttCmpnyIndx rows.
+
+    Returns one entry per indicator present on both sides whose absolute
+    difference exceeds `tolerance`. An empty list means the local engine
+    reproduces the API for those companies.
+    """
+    mismatches = []
+    for row in api_rows:
+        idx_nm = row.get("idx_nm")
+        if idx_nm not in table.values or row.get("corp_code") not in table.corp_codes:
+            continue
+        local = table.get(row["corp_code"], idx_nm)
+        try:
+            remote = float(str(row.get("idx_val")).replace(",", ""))
+        except ValueError:
+            continue
+        if local is None or abs(round(local, 2) - remote) > tolerance:
+            mismatches.append({"corp_code": row["corp_code"], "idx_nm": idx_nm, "local": local, "api": remote})
+    return mismatches
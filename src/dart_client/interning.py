@@ -0,0 +1,84 @@
+import json
+from typing import Any, Iterable, Optional
+
+# Fields whose values repeat across rows and responses: company and report
+# identifiers, statement/account labels and period captions. Amounts and
+# free-text remarks are left alone since they are mostly unique.
+DEFAULT_INTERN_FIELDS = frozenset({
+    # common
+    "rcept_no", "corp_code", "corp_name", "corp_cls", "stock_code", "bsns_year", "reprt_code", "stlm_dt",
+    # fnlttSinglAcnt / fnlttSinglAcntAll / fnlttMultiAcnt
+    "fs_div", "fs_nm", "sj_div", "sj_nm", "account_id", "account_nm", "account_detail", "currency",
+    "thstrm_nm", "thstrm_dt", "frmtrm_nm", "frmtrm_dt", "frmtrm_q_nm", "frmtrm_add_nm",
+    "bfefrmtrm_nm", "bfefrmtrm_dt", "thstrm_add_nm",
+    # DS002 / DS004
+    "se", "stock_knd", "relate", "rcept_dt", "repror", "report_tp", "report_resn",
+    "isu_exctv_rgist_at", "isu_exctv_ofcps", "isu_main_shrholdr", "ofcps", "sexdstn", "fo_bbm",
+})
+
+
+class StringPool:
+    """
+    Shares one string object per distinct value of repetitive fields while decoding JSON.
+
+    A fnlttSinglAcntAll response repeats the same corp_name, sj_nm, fs_nm,
+    account_nm and rcept_no on every row, and a backfill repeats them again
+    in every response. Decoding through a pool keeps a single copy of each
+    distinct value, which works like dictionary encoding for rows kept as
+    plain dicts.
+    """
+
+    def __init__(self, fields: Optional[Iterable[str]] = None, max_size: int = 1_000_000):
+        """
+        Initialize StringPool.
+
+        Args:
+            fields: Field names whose string values are pooled (default: DEFAULT_INTERN_FIELDS).
+            max_size: Maximum number of distinct values kept. Once full, values already in
+                      the pool are still shared but new ones are not added.
+        """
+        self.fields = frozenset(fields) if fields is not None else DEFAULT_INTERN_FIELDS
+        self.max_size = max_size
+        self.pool: dict[str, str] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self.pool)
+
+    def intern(self, value: str) -> str:
+        shared = self.pool.get(value)
+        if shared is not None:
+            self.hits += 1
+            return shared
+        if len(self.pool) < self.max_size:
+            self.pool[value] = value
+        return value
+
+    def object_pairs_hook(self, pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+        fields, intern = self.fields, self.intern
+        return {
+            key: intern(value) if key in fields and type(value) is str else value
+            for key, value in pairs
+        }
+
+    def loads(self, content: str | bytes) -> Any:
+        """json.loads() with pooled values."""
+        return json.loads(content, object_pairs_hook=self.object_pairs_hook)
+
+    def intern_values(self, data: Any) -> Any:
+        """Pool the values of already decoded JSON, e.g. decoded in another process."""
+        if isinstance(data, dict):
+            fields, intern = self.fields, self.intern
+            for key, value in data.items():
+                if key in fields and type(value) is str:
+                    data[key] = intern(value)
+                elif isinstance(value, (dict, list)):
+                    self.intern_values(value)
+        elif isinstance(data, list):
+            for item in data:
+                self.intern_values(item)
+        return data
+
+    def clear(self) -> None:
+        self.pool.clear()
+        self.hits = 0
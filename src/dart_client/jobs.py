@@ -0,0 +1,405 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .endpoints import get_endpoint
+from .errors import DartAuthError, DartLimitError, DartNoDataError
+from .planner import PlannedCall
+from .scheduler import Priority, current_tag, request_priority, request_tag
+
+logger = logging.getLogger("dart_client")
+
+REPRT_CODES = ("11011", "11012", "11013", "11014")
+
+# Item states; everything but PENDING is an outcome
+PENDING = "pending"
+DATA = "data"
+EMPTY = "empty"    # status 013
+ERROR = "error"
+
+PROGRESS_REFRESH = 2.0  # seconds between reloads of the journal-wide counts during run()
+LOCK_TIMEOUT = 60.0     # seconds a journal write waits for another worker's transaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    method TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    result TEXT,
+    finished_at REAL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    UNIQUE (method, params)
+);
+CREATE INDEX IF NOT EXISTS items_status ON items (status, id);
+"""
+
+
+def _dump_result(result: Any) -> Optional[str]:
+    if isinstance(result, bytes):
+        return None
+    if hasattr(result, "model_dump"):
+        result = result.model_dump()
+    return json.dumps(result, ensure_ascii=False, default=str)
+
+
+@dataclass
+class BackfillProgress:
+    """Journal-wide outcome counts; finished_this_run counts every worker sharing the journal."""
+    total: int = 0
+    data: int = 0
+    empty: int = 0
+    errors: int = 0
+    finished_this_run: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def done(self) -> int:
+        return self.data + self.empty
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.done - self.errors
+
+    @property
+    def items_per_second(self) -> float:
+        return self.finished_this_run / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds until the pending items are finished at this run's pace, None before the first item."""
+        rate = self.items_per_second
+        return self.pending / rate if rate else None
+
+    def summary(self) -> str:
+        eta = f"{self.eta / 3600:.1f}h" if self.eta is not None else "unknown"
+        return (
+            f"{self.done + self.errors}/{self.total} finished ({self.data} data, {self.empty} empty, "
+            f"{self.errors} errors), {self.pending} pending; {self.items_per_second:.2f} items/s, ETA {eta}"
+        )
+
+
+class BackfillJob:
+    """
+    Durable backfill of many API calls, journaled in sqlite.
+
+    The cross product of companies, years, reprt_codes and endpoints is
+    expanded into one journal row per call. run() executes the pending rows
+    with `concurrency` calls in flight (the client's limiter still bounds the
+    request rate) and writes each outcome as soon as it arrives: "data" with
+    the response, "empty" for status 013, or "error" with the message. A row
+    is only marked finished once its outcome is committed, so a crashed or
+    interrupted run resumes with exactly the calls that had not finished.
+    Failed calls are retried by later runs until they have been attempted
+    `max_attempts` times.
+
+    Several worker processes can run one journal together. The journal uses
+    sqlite's rollback journal, not WAL, so the file may also be shared
+    between hosts, on a network filesystem whose file locks work (e.g. NFSv4
+    with locking enabled). Each call is leased to one worker for
+    `lease_seconds`, and a running worker renews the leases of its calls in
+    flight; a lease that runs out because its worker died is taken over by
+    another worker. Journal writes run in a thread, so a worker waiting for
+    another one's lock does not block its event loop. Give all their
+    clients one SharedRateLimiter to keep the key's request budget across
+    processes.
+
+    Example:
+        job = BackfillJob(client, "backfill.db")
+        job.add_matrix(corp_codes, range(2015, 2025), methods=DS002_METHODS)
+        await job.run(on_progress=lambda p: print(p.summary()))
+        for call, data in job.results():
+            ...
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str | Path = ":memory:",
+        concurrency: int = 4,
+        max_attempts: int = 3,
+        store_results: bool = True,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 300.0,
+        priority: Priority = Priority.BACKGROUND,
+        tag: Optional[str] = None,
+    ):
+        """
+        Initialize BackfillJob.
+
+        Args:
+            client: DartAPIClient executing the calls.
+            path: sqlite journal file (default: in-memory, not resumable).
+            concurrency: Number of calls in flight.
+            max_attempts: Attempts per call before its error is final.
+            store_results: Keep the JSON responses in the journal. Without it
+                           only the outcome of each call is recorded.
+            worker_id: Name of this worker in the journal's leases (default: host, pid and a random suffix).
+            lease_seconds: How long a leased call stays reserved for this worker without a renewal.
+                           run() renews the leases every lease_seconds / 3, so this only bounds how
+                           long the calls of a dead worker wait before another worker takes them over.
+            priority: request_priority() of the job's calls, for clients with a PriorityScheduler.
+            tag: request_tag() of the job's calls (default: the tag of the caller's context).
+        """
+        self.client = client
+        self.path = str(path)
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.store_results = store_results
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.priority = priority
+        self.tag = tag
+        self.conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT, check_same_thread=False)
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=DELETE")  # WAL needs shared memory, i.e. a single host
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def add(self, calls: Iterable[PlannedCall]) -> int:
+        """Journal calls that are not in the journal yet. Returns the number added."""
+        rows = [(call.method, json.dumps(dict(call.params), sort_keys=True)) for call in calls]
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.executemany("INSERT OR IGNORE INTO items (method, params) VALUES (?, ?)", rows)
+            self.conn.commit()
+            return self.conn.total_changes - before
+
+    def add_matrix(
+        self,
+        corp_codes: Iterable[str],
+        years: Iterable[int | str],
+        reprt_codes: Iterable[str] = REPRT_CODES,
+        methods: Iterable[str] = (),
+        **fixed: str,
+    ) -> int:
+        """
+        Journal every (method, corp_code, bsns_year, reprt_code) combination.
+
+        Args:
+            corp_codes: Companies.
+            years: Business years.
+            reprt_codes: Report codes (default: all four).
+            methods: Client methods addressed by corp_code/bsns_year/reprt_code,
+                     e.g. planner.DS002_METHODS.
+            **fixed: Further parameters (e.g. fs_div="CFS", idx_cl_code="M210000"),
+                     passed to the methods that take them.
+
+        Returns:
+            Number of calls added.
+        """
+        endpoints = [get_endpoint(method) for method in methods]
+        for endpoint in endpoints:
+            missing = set(endpoint.required) - {"corp_code", "bsns_year", "reprt_code", *fixed}
+            if missing:
+                raise ValueError(f"{endpoint.method} also requires {', '.join(sorted(missing))}")
+        bsns_years = [str(year) for year in years]
+        codes = list(reprt_codes)
+
+        def calls() -> Iterator[PlannedCall]:
+            for corp_code in corp_codes:
+                for endpoint in endpoints:
+                    extra = {k: v for k, v in fixed.items() if k in endpoint.params}
+                    for year in bsns_years:
+                        for reprt_code in codes:
+                            yield PlannedCall.of(
+                                endpoint.method, corp_code=corp_code, bsns_year=year, reprt_code=reprt_code, **extra
+                            )
+
+        return self.add(calls())
+
+    def progress(self) -> BackfillProgress:
+        """Outcome counts of the whole journal."""
+        return self._count(BackfillProgress())
+
+    def _count(self, progress: BackfillProgress) -> BackfillProgress:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, attempts, COUNT(*) FROM items GROUP BY status, attempts"
+            ).fetchall()
+        progress.total = progress.data = progress.empty = progress.errors = 0
+        for status, attempts, count in rows:
+            progress.total += count
+            if status == DATA:
+                progress.data += count
+            elif status == EMPTY:
+                progress.empty += count
+            elif status == ERROR and attempts >= self.max_attempts:
+                progress.errors += count
+        return progress
+
+    def _lease(self, run_started: float) -> Optional[tuple[int, str, str]]:
+        """
+        Take the next unfinished call that no live worker holds. Calls that
+        failed during this run are left for a later run.
+        """
+        now = time.time()
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock before the SELECT, so two
+            # processes cannot lease the same row
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute(
+                    "SELECT id, method, params FROM items "
+                    "WHERE (status = ? OR (status = ? AND attempts < ? AND finished_at < ?)) "
+                    "AND (lease_expires IS NULL OR lease_expires < ?) ORDER BY id LIMIT 1",
+                    (PENDING, ERROR, self.max_attempts, run_started, now),
+                ).fetchone()
+                if row is not None:
+                    self.conn.execute(
+                        "UPDATE items SET lease_owner = ?, lease_expires = ? WHERE id = ?",
+                        (self.worker_id, now + self.lease_seconds, row[0]),
+                    )
+            finally:
+                self.conn.commit()
+        return row
+
+    def _renew(self) -> None:
+        """Extend the leases of the calls this worker has in flight."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE items SET lease_expires = ? WHERE lease_owner = ?",
+                (time.time() + self.lease_seconds, self.worker_id),
+            )
+            self.conn.commit()
+
+    def _release(self) -> None:
+        """Give up the leases of calls this worker did not finish."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE items SET lease_owner = NULL, lease_expires = NULL WHERE lease_owner = ?", (self.worker_id,)
+            )
+            self.conn.commit()
+
+    def _finish(self, item_id: int, status: str, result: Optional[str] = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.conn.execute(
+                "UPDATE items SET status = ?, result = ?, error = ?, attempts = attempts + 1, finished_at = ?, "
+                "lease_owner = NULL, lease_expires = NULL WHERE id = ?",
+                (status, result, error, time.time(), item_id),
+            )
+            self.conn.commit()
+
+    async def _execute(self, item_id: int, method: str, params: str) -> str:
+        try:
+            result = await getattr(self.client, method)(**json.loads(params))
+        except DartNoDataError:
+            await asyncio.to_thread(self._finish, item_id, EMPTY)
+            return EMPTY
+        except (DartAuthError, DartLimitError):
+            raise  # retrying cannot help before the key or the daily quota is fixed; the row stays pending
+        except Exception as e:
+            logger.warning("backfill %s(%s) failed: %r", method, params, e)
+            await asyncio.to_thread(self._finish, item_id, ERROR, error=str(e) or repr(e))
+            return ERROR
+        stored = _dump_result(result) if self.store_results else None
+        await asyncio.to_thread(self._finish, item_id, DATA, result=stored)
+        return DATA
+
+    async def run(
+        self,
+        on_progress: Optional[Callable[[BackfillProgress], None]] = None,
+        limit: Optional[int] = None,
+    ) -> BackfillProgress:
+        """
+        Execute the pending calls, and retry failed ones with attempts left.
+
+        Any number of processes may run the same journal at once (see the
+        class docstring). DartAuthError and
+        DartLimitError (e.g. the daily quota) stop the run and are raised;
+        unfinished calls stay pending for the next run.
+
+        Args:
+            on_progress: Called with the progress after every finished call.
+            limit: Stop after this many calls, e.g. to spread a backfill over several days.
+        """
+        progress = self.progress()
+        baseline = progress.done + progress.errors
+        run_started = time.time()
+        start = refreshed = time.perf_counter()
+        leased = 0
+
+        async def worker() -> None:
+            nonlocal leased, refreshed
+            while limit is None or leased < limit:
+                leased += 1
+                item = await asyncio.to_thread(self._lease, run_started)
+                if item is None:
+                    return
+                outcome = await self._execute(*item)
+                now = time.perf_counter()
+                progress.elapsed = now - start
+                if outcome == ERROR or now - refreshed >= PROGRESS_REFRESH:
+                    # Reload the counts, which include the other workers' calls
+                    refreshed = now
+                    await asyncio.to_thread(self._count, progress)
+                    progress.finished_this_run = progress.done + progress.errors - baseline
+                else:
+                    progress.finished_this_run += 1
+                    if outcome == DATA:
+                        progress.data += 1
+                    else:
+                        progress.empty += 1
+                if on_progress is not None:
+                    on_progress(progress)
+
+        async def heartbeat() -> None:
+            while True:
+                await asyncio.sleep(self.lease_seconds / 3)
+                await asyncio.to_thread(self._renew)
+
+        # The tasks copy the context, and with it the priority and tag
+        with request_priority(self.priority), request_tag(self.tag or current_tag()):
+            tasks = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        renewer = asyncio.ensure_future(heartbeat())
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in [*tasks, renewer]:
+                task.cancel()
+            await asyncio.gather(*tasks, renewer, return_exceptions=True)
+            # Waits for a journal write still running in a thread, it holds _lock
+            await asyncio.to_thread(self._release)
+        self._count(progress)
+        progress.finished_this_run = progress.done + progress.errors - baseline
+        progress.elapsed = time.perf_counter() - start
+        logger.info("backfill %s: %s", self.worker_id, progress.summary())
+        return progress
+
+    def results(self, method: Optional[str] = None) -> Iterator[tuple[PlannedCall, Any]]:
+        """Calls that returned data, with their stored response (None with store_results=False)."""
+        query = "SELECT method, params, result FROM items WHERE status = ?"
+        args: tuple[Any, ...] = (DATA,)
+        if method is not None:
+            query += " AND method = ?"
+            args += (method,)
+        with self._lock:
+            rows = self.conn.execute(query + " ORDER BY id", args).fetchall()
+        for method_, params, result in rows:
+            call = PlannedCall(method_, tuple(sorted(json.loads(params).items())))
+            yield call, json.loads(result) if result is not None else None
+
+    def failures(self) -> dict[PlannedCall, str]:
+        """Calls whose last attempt failed, with the error message."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT method, params, error FROM items WHERE status = ? ORDER BY id", (ERROR,)
+            ).fetchall()
+        return {PlannedCall(m, tuple(sorted(json.loads(p).items()))): error for m, p, error in rows}
@@ -0,0 +1,154 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_BUCKET_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_buckets (
+    name TEXT PRIMARY KEY,
+    level REAL NOT NULL,
+    last_check REAL NOT NULL
+)
+"""
+
+
+class ThreadSafeLimiter:
+    """
+    Leaky bucket rate limiter that can be shared across threads and event loops.
+
+    Same semantics as aiolimiter.AsyncLimiter (up to `max_rate` acquisitions
+    per `time_period`, bursts included), usable both as `with limiter:` in
+    threads and as `async with limiter:` in any event loop. A caller that has
+    to wait reserves its slot immediately, so waiters are served in arrival
+    order and nobody polls.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60):
+        """
+        Initialize ThreadSafeLimiter.
+
+        Args:
+            max_rate: Allowed acquisitions per time_period.
+            time_period: Length of the period in seconds.
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Take `amount` of capacity and return how long to wait before using it."""
+        if not 0 <= amount <= self.max_rate:
+            raise ValueError("Amount must be a number between 0 and the maximum capacity")
+        with self._lock:
+            now = time.monotonic()
+            self._level = max(self._level - (now - self._last_check) * self._rate_per_sec, 0.0)
+            self._last_check = now
+            self._level += amount
+            overflow = self._level - self.max_rate
+        return overflow / self._rate_per_sec if overflow > 0 else 0.0
+
+    def has_capacity(self, amount: float = 1) -> bool:
+        with self._lock:
+            level = max(self._level - (time.monotonic() - self._last_check) * self._rate_per_sec, 0.0)
+        return level + amount <= self.max_rate
+
+    def acquire(self, amount: float = 1) -> None:
+        """Acquire capacity, blocking the calling thread until it is available."""
+        delay = self._reserve(amount)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, amount: float = 1) -> None:
+        """Acquire capacity, suspending the calling task until it is available."""
+        delay = self._reserve(amount)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+    async def __aenter__(self) -> None:
+        await self.acquire_async()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class SharedRateLimiter(ThreadSafeLimiter):
+    """
+    ThreadSafeLimiter whose bucket lives in a sqlite file, so that processes
+    using the same file share one request budget.
+
+    The file uses sqlite's rollback journal, not WAL, so it may also be
+    shared between hosts on a network filesystem whose file locks work; the
+    bucket level is stored with a wall-clock timestamp, so those hosts need
+    reasonably synchronized clocks. Every acquisition is one short write
+    transaction on the file; acquire_async() runs it in a thread, so waiting
+    for another process's lock does not block the event loop.
+    """
+
+    def __init__(self, path: str | Path, max_rate: float, time_period: float = 60, name: str = "default"):
+        """
+        Initialize SharedRateLimiter.
+
+        Args:
+            path: sqlite file holding the bucket, e.g. next to a shared BackfillJob journal.
+            max_rate: Allowed acquisitions per time_period, across all users of the file.
+            time_period: Length of the period in seconds.
+            name: Bucket name, so that one file can hold the budgets of several API keys.
+        """
+        super().__init__(max_rate, time_period)
+        self.path = str(path)
+        self.name = name
+        self.conn = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=DELETE")  # WAL needs shared memory, i.e. a single host
+        self.conn.execute(_BUCKET_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def _load(self) -> tuple[float, float]:
+        row = self.conn.execute("SELECT level, last_check FROM rate_buckets WHERE name = ?", (self.name,)).fetchone()
+        now = time.time()
+        if row is None:
+            return 0.0, now
+        level, last_check = row
+        return max(level - (now - last_check) * self._rate_per_sec, 0.0), now
+
+    def _reserve(self, amount: float) -> float:
+        if not 0 <= amount <= self.max_rate:
+            raise ValueError("Amount must be a number between 0 and the maximum capacity")
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                level, now = self._load()
+                level += amount
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO rate_buckets (name, level, last_check) VALUES (?, ?, ?)",
+                    (self.name, level, now),
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        overflow = level - self.max_rate
+        return overflow / self._rate_per_sec if overflow > 0 else 0.0
+
+    def has_capacity(self, amount: float = 1) -> bool:
+        with self._lock:
+            level, _ = self._load()
+        return level + amount <= self.max_rate
+
+    async def acquire_async(self, amount: float = 1) -> None:
+        delay = await asyncio.to_thread(self._reserve, amount)
+        if delay:
+            await asyncio.sleep(delay)
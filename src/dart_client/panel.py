@@ -0,0 +1,160 @@
+"""
+Columnar financial panels (companies × periods × accounts) built from statement responses.
+
+Requires numpy: pip install "dart-api-client[analysis]"
+pyarrow is only needed for FinancialPanel.to_arrow().
+"""
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "dart_client.panel requires numpy. Install it with: pip install 'dart-api-client[analysis]'"
+    ) from e
+
+from .columns import parse_amounts
+from .history import DEFAULT_SJ_DIVS, AccountKey, account_key
+
+Period = tuple[str, str]  # (bsns_year, reprt_code)
+
+
+@dataclass
+class FinancialPanel:
+    """
+    Aligned int64 cube of statement amounts.
+
+    `values[i, j, k]` is the amount of accounts[k] for corp_codes[i] in
+    periods[j]; `present[i, j, k]` is False where no amount was reported.
+    """
+    corp_codes: list[str]
+    periods: list[Period]
+    accounts: list[AccountKey]
+    values: "np.ndarray"
+    present: "np.ndarray"
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.values.shape  # type: ignore[no-any-return]
+
+    def masked(self) -> "np.ma.MaskedArray":
+        return np.ma.MaskedArray(self.values, mask=~self.present)
+
+    def get(self, corp_code: str, period: Period, account: AccountKey) -> Optional[int]:
+        i = self.corp_codes.index(corp_code)
+        j = self.periods.index(period)
+        k = self.accounts.index(account)
+        return int(self.values[i, j, k]) if self.present[i, j, k] else None
+
+    def account(self, account: AccountKey) -> "np.ma.MaskedArray":
+        """companies × periods matrix of one account."""
+        k = self.accounts.index(account)
+        return np.ma.MaskedArray(self.values[:, :, k], mask=~self.present[:, :, k])
+
+    def to_arrow(self) -> Any:
+        """
+        Long-format pyarrow Table of the present cells, with dictionary-encoded
+        key columns (corp_code, bsns_year, reprt_code, sj_div, account_id, amount).
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("FinancialPanel.to_arrow() requires pyarrow: pip install pyarrow") from e
+
+        i, j, k = np.nonzero(self.present)
+
+        def encoded(codes: "np.ndarray", labels: list[str]) -> Any:
+            return pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()), pa.array(labels))
+
+        return pa.table({
+            "corp_code": encoded(i, self.corp_codes),
+            "bsns_year": encoded(j, [p[0] for p in self.periods]),
+            "reprt_code": encoded(j, [p[1] for p in self.periods]),
+            "sj_div": encoded(k, [a[0] for a in self.accounts]),
+            "account_id": encoded(k, [a[1] for a in self.accounts]),
+            "amount": pa.array(self.values[i, j, k], type=pa.int64()),
+        })
+
+
+def build_panel(
+    responses: Iterable[dict[str, Any]],
+    column: str = "thstrm_amount",
+    fs_div: Optional[str] = None,
+    sj_divs: Optional[Iterable[str]] = DEFAULT_SJ_DIVS,
+) -> FinancialPanel:
+    """
+    Build a FinancialPanel from fnlttSinglAcntAll (or fnlttSinglAcnt/fnlttMultiAcnt) responses.
+
+    Rows are keyed by their own corp_code/bsns_year/reprt_code, so responses
+    for any mix of companies and periods can be passed at once. Accounts are
+    keyed by (sj_div, account_id), falling back to account_nm for
+    non-standard accounts. A key that repeats for one company and period
+    raises ValueError instead of silently keeping one of the rows: the
+    statement of changes in equity (SCE) repeats account_ids per equity
+    component, and a response holding both CFS and OFS repeats every account.
+
+    Args:
+        responses: API responses with a "list" of statement rows.
+        column: Amount column to load (thstrm_amount, frmtrm_amount, ...).
+        fs_div: Keep only rows of this fs_div (rows without fs_div are always kept).
+        sj_divs: Keep only these statement kinds (default: BS, IS, CIS, CF; None keeps all).
+    """
+    wanted_sj = set(sj_divs) if sj_divs is not None else None
+    companies: dict[str, int] = {}
+    periods: dict[Period, int] = {}
+    accounts: dict[AccountKey, int] = {}
+    company_codes: list[int] = []
+    period_codes: list[int] = []
+    account_codes: list[int] = []
+    amounts: list[Optional[str]] = []
+    last_corp = last_year = last_reprt = None
+    company = period = -1
+
+    # The only per-row Python work: map keys to axis positions and collect the amount strings
+    for response in responses:
+        for row in response.get("list", []):
+            if fs_div is not None and row.get("fs_div", fs_div) != fs_div:
+                continue
+            if wanted_sj is not None and row.get("sj_div") not in wanted_sj:
+                continue
+            # Rows of one response share company and period, so only look them up on change
+            if row["corp_code"] != last_corp:
+                last_corp = row["corp_code"]
+                company = companies.setdefault(last_corp, len(companies))
+            if row["bsns_year"] != last_year or row["reprt_code"] != last_reprt:
+                last_year, last_reprt = row["bsns_year"], row["reprt_code"]
+                period = periods.setdefault((last_year, last_reprt), len(periods))
+            account_id = row.get("account_id")
+            if account_id and account_id[0] != "-":
+                key = (row.get("sj_div", ""), account_id)
+            else:
+                key = account_key(row)
+            account = accounts.get(key)
+            if account is None:
+                account = accounts[key] = len(accounts)
+            company_codes.append(company)
+            period_codes.append(period)
+            account_codes.append(account)
+            amounts.append(row.get(column))
+
+    shape = (len(companies), len(periods), len(accounts))
+    index = (np.array(company_codes, dtype=np.intp), np.array(period_codes, dtype=np.intp),
+             np.array(account_codes, dtype=np.intp))
+    cells = np.ravel_multi_index(index, shape) if amounts else np.zeros(0, dtype=np.intp)
+    unique_cells, first, counts = np.unique(cells, return_index=True, return_counts=True)
+    if len(unique_cells) != len(cells):
+        duplicate = int(first[np.argmax(counts > 1)])
+        raise ValueError(
+            f"Duplicate account {list(accounts)[account_codes[duplicate]]} for "
+            f"{list(companies)[company_codes[duplicate]]} {list(periods)[period_codes[duplicate]]}: "
+            "pass fs_div, or sj_divs without SCE"
+        )
+    parsed, present = parse_amounts(amounts)
+    values = np.zeros(shape, dtype=np.int64)
+    mask = np.zeros(shape, dtype=bool)
+    values[index] = parsed
+    mask[index] = present
+    return FinancialPanel(
+        corp_codes=list(companies), periods=list(periods), accounts=list(accounts), values=values, present=mask
+    )
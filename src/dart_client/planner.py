@@ -0,0 +1,229 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from .coverage import CoverageIndex
+from .dispatch import DS005_TITLE_ROUTES, ReportClassifier
+from .endpoints import find_endpoints
+from .errors import DartAPIError, DartAuthError, DartLimitError, DartNoDataError
+from .feed import fetch_disclosures
+from .utils import PERIODIC_DETAIL_TYPES, parse_periodic_report, shift_date
+
+if TYPE_CHECKING:
+    from .models.disclosure import Disclosure
+
+DS002_ENDPOINTS: dict[str, str] = {e.method: e.path for e in find_endpoints(group="DS002")}
+DS002_METHODS: tuple[str, ...] = tuple(DS002_ENDPOINTS)
+
+# DS003 endpoints keyed only by (corp_code, bsns_year, reprt_code)
+DS003_PERIODIC_ENDPOINTS: dict[str, str] = {e.method: e.path for e in find_endpoints(group="DS003", periodic=True)}
+DS003_PERIODIC_METHODS: tuple[str, ...] = tuple(DS003_PERIODIC_ENDPOINTS)
+PERIODIC_ENDPOINTS: dict[str, str] = {**DS002_ENDPOINTS, **DS003_PERIODIC_ENDPOINTS}
+
+MAJOR_EVENT_DETAIL_TYPE = "B001"  # 주요사항보고서
+
+
+@dataclass(frozen=True)
+class PlannedCall:
+    """One scheduled API call. `params` is a sorted tuple so plans can be deduplicated."""
+    method: str
+    params: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def of(cls, method: str, **params: str) -> "PlannedCall":
+        return cls(method, tuple(sorted(params.items())))
+
+    @property
+    def kwargs(self) -> dict[str, str]:
+        return dict(self.params)
+
+
+@dataclass
+class QueryPlan:
+    """Calls scheduled for a refresh window, with the brute-force cost for comparison."""
+    bgn_de: str
+    end_de: str
+    calls: list[PlannedCall] = field(default_factory=list)
+    list_calls: int = 0
+    brute_force_calls: Optional[int] = None  # None: universe size unknown
+    skipped_known_empty: int = 0
+    filers: dict[str, set[str]] = field(default_factory=dict)
+
+    @property
+    def planned_calls(self) -> int:
+        """Calls needed to carry out the plan, including the list.json reads."""
+        return self.list_calls + len(self.calls)
+
+    def summary(self) -> str:
+        summary = (
+            f"{self.bgn_de}~{self.end_de}: {self.planned_calls:,} planned calls "
+            f"({self.list_calls:,} list.json + {len(self.calls):,} detail)"
+        )
+        if self.brute_force_calls is None:
+            return summary
+        saved = self.brute_force_calls - self.planned_calls
+        return f"{summary} vs {self.brute_force_calls:,} brute-force ({saved:,} saved)"
+
+
+@dataclass
+class PlanExecution:
+    """Outcome of RefreshPlanner.execute()."""
+    results: list[tuple[PlannedCall, Optional[dict[str, Any]]]] = field(default_factory=list)  # None: status 013
+    failed: dict[PlannedCall, str] = field(default_factory=dict)
+    pending: list[PlannedCall] = field(default_factory=list)  # not run because `error` stopped the execution
+    error: Optional[DartAPIError] = None  # DartAuthError or DartLimitError
+
+    def summary(self) -> str:
+        stopped = f", stopped by {self.error}" if self.error is not None else ""
+        return (
+            f"{len(self.results)} calls answered, {len(self.failed)} failed, "
+            f"{len(self.pending)} pending{stopped}"
+        )
+
+
+class RefreshPlanner:
+    """
+    Filing-driven planner for DS002/DS003/DS005 refreshes.
+
+    Instead of calling every endpoint for every company, the planner reads
+    list.json for the window once per disclosure type and only schedules
+    periodic-report calls for companies that filed a periodic report, and
+    major-event calls for the DS005 endpoint matching each 주요사항보고서.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        periodic_methods: Iterable[str] = DS002_METHODS + DS003_PERIODIC_METHODS,
+        classifier: Optional[ReportClassifier] = None,
+        window_days: int = 1,
+        coverage: Optional[CoverageIndex] = None,
+    ):
+        """
+        Initialize RefreshPlanner.
+
+        Args:
+            client: DartAPIClient used for list.json reads and plan execution.
+            periodic_methods: Methods called per (corp_code, bsns_year, reprt_code) of a periodic filing.
+            classifier: ReportClassifier routing major-event titles (default: DS005 routes).
+            window_days: Days added around rcept_dt for DS005 bgn_de/end_de.
+            coverage: CoverageIndex consulted to drop calls known to return no data
+                      (default: the client's index, if any).
+        """
+        self.client = client
+        self.periodic_methods = tuple(periodic_methods)
+        self.classifier = classifier or ReportClassifier()
+        self.window_days = window_days
+        self.coverage = coverage if coverage is not None else getattr(client, "coverage", None)
+
+    async def plan(
+        self,
+        bgn_de: str,
+        end_de: str,
+        corp_codes: Optional[Iterable[str]] = None,
+        universe_size: Optional[int] = None,
+        acc_mt: Optional[dict[str, int]] = None,
+    ) -> QueryPlan:
+        """
+        Build the call plan for filings received between bgn_de and end_de.
+
+        Args:
+            bgn_de: Window start (YYYYMMDD).
+            end_de: Window end (YYYYMMDD).
+            corp_codes: Restrict the plan to these companies (default: every filer).
+            universe_size: Number of companies a brute-force refresh would cover,
+                           used for brute_force_calls (default: len(corp_codes); without
+                           either, brute_force_calls is left as None).
+            acc_mt: Fiscal year-end month per corp_code for non-December companies.
+        """
+        wanted = set(corp_codes) if corp_codes is not None else None
+        acc_mt = acc_mt or {}
+        plan = QueryPlan(bgn_de=bgn_de, end_de=end_de)
+        calls: dict[PlannedCall, None] = {}
+
+        for detail_ty in (*PERIODIC_DETAIL_TYPES, MAJOR_EVENT_DETAIL_TYPE):
+            disclosures, list_calls = await fetch_disclosures(
+                self.client, bgn_de, end_de, pblntf_detail_ty=detail_ty
+            )
+            plan.list_calls += list_calls
+            for disclosure in disclosures:
+                if wanted is not None and disclosure.corp_code not in wanted:
+                    continue
+                planned = self._plan_disclosure(disclosure, detail_ty, acc_mt.get(disclosure.corp_code, 12))
+                if planned:
+                    plan.filers.setdefault(detail_ty, set()).add(disclosure.corp_code)
+                calls.update(dict.fromkeys(planned))
+
+        plan.calls = [call for call in calls if not self._known_empty(call)]
+        plan.skipped_known_empty = len(calls) - len(plan.calls)
+        if universe_size is None and wanted is not None:
+            universe_size = len(wanted)
+        if universe_size is not None:
+            per_company = len(self.periodic_methods) + len(set(DS005_TITLE_ROUTES.values()))
+            plan.brute_force_calls = universe_size * per_company
+        return plan
+
+    def _known_empty(self, call: PlannedCall) -> bool:
+        endpoint = PERIODIC_ENDPOINTS.get(call.method)
+        if self.coverage is None or endpoint is None:
+            return False
+        return self.coverage.is_known_empty(endpoint, call.kwargs)
+
+    def _plan_disclosure(self, disclosure: "Disclosure", detail_ty: str, acc_mt: int) -> list[PlannedCall]:
+        if detail_ty == MAJOR_EVENT_DETAIL_TYPE:
+            method = self.classifier.classify(disclosure.report_nm)
+            if method is None:
+                return []
+            return [PlannedCall.of(
+                method,
+                corp_code=disclosure.corp_code,
+                bgn_de=shift_date(disclosure.rcept_dt, -self.window_days),
+                end_de=shift_date(disclosure.rcept_dt, self.window_days),
+            )]
+
+        period = parse_periodic_report(disclosure.report_nm, detail_ty, acc_mt)
+        if period is None:
+            return []
+        bsns_year, reprt_code = period
+        return [
+            PlannedCall.of(method, corp_code=disclosure.corp_code, bsns_year=bsns_year, reprt_code=reprt_code)
+            for method in self.periodic_methods
+        ]
+
+    async def execute(self, plan: QueryPlan, concurrency: int = 8) -> PlanExecution:
+        """
+        Run the planned calls, `concurrency` at a time; the client's limiter still bounds the rate.
+
+        Calls answered with status 013 (no data) yield None, and a failing
+        call is recorded in `failed` without affecting the others. A
+        DartAuthError or DartLimitError stops the execution, since every
+        further call would fail the same way: the calls not run are returned
+        in `pending`, next to the results already fetched.
+
+        Args:
+            plan: Plan from plan().
+            concurrency: Number of calls in flight.
+        """
+        execution = PlanExecution()
+        calls = iter(plan.calls)
+
+        async def worker() -> None:
+            for call in calls:
+                try:
+                    data = await getattr(self.client, call.method)(**call.kwargs)
+                except DartNoDataError:
+                    data = None
+                except (DartAuthError, DartLimitError) as e:
+                    execution.error = e
+                    execution.pending.append(call)
+                    execution.pending.extend(calls)  # the other workers stop after their current call
+                    return
+                except Exception as e:
+                    execution.failed[call] = str(e) or repr(e)
+                    continue
+                execution.results.append((call, data))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        order = {call: i for i, call in enumerate(plan.calls)}
+        execution.results.sort(key=lambda item: order[item[0]])
+        return execution
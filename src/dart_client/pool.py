@@ -0,0 +1,158 @@
+import asyncio
+import threading
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Optional
+
+from .client import DEFAULT_OFFLOAD_THRESHOLD, DartAPIClient
+from .coverage import CoverageIndex
+from .fs_div import FsDivResolver
+from .interning import StringPool
+from .limiter import ThreadSafeLimiter
+
+
+class ClientPool:
+    """
+    Hands out one DartAPIClient per event loop, all sharing one rate limit and one set of caches.
+
+    An httpx.AsyncClient (and aiolimiter.AsyncLimiter) only works on the loop
+    that created it, so services running several loops (e.g. a loop per
+    worker thread) need a client per loop. The clients made here share a
+    ThreadSafeLimiter, so the API key's request budget holds across all of
+    them, as well as the FsDivResolver, CoverageIndex and StringPool.
+
+    A loop's client is closed on that loop when the loop shuts down through
+    asyncio.run() (or loop.shutdown_asyncgens()), or earlier with aclose().
+    close() closes whatever is left, from any thread outside those loops.
+
+    Example:
+        pool = ClientPool(requests_per_minute=600)
+
+        def worker(corp_codes):
+            async def main():
+                client = pool.get()
+                return [await client.get_company(corp_code=c) for c in corp_codes]
+            return asyncio.run(main())
+
+        with ThreadPoolExecutor(4) as threads:
+            results = list(threads.map(worker, chunks))
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_minute: int = 100,
+        limiter: Optional[ThreadSafeLimiter] = None,
+        fs_div_resolver: Optional[FsDivResolver] = None,
+        coverage: Optional[CoverageIndex] = None,
+        string_pool: Optional[StringPool] = None,
+        executor: Optional[Executor] = None,
+        offload_threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+        base_url: Optional[str] = None,
+    ):
+        """
+        Initialize ClientPool.
+
+        Args:
+            api_key: DART API Key. If None, tries to read from DART_API_KEY env var.
+            requests_per_minute: Max requests per minute across all clients (default: 100).
+            limiter: Optional external ThreadSafeLimiter, e.g. also used by a SyncDartAPIClient.
+                     If provided, requests_per_minute is ignored.
+            fs_div_resolver: Shared FsDivResolver (default: a new in-memory one).
+            coverage: Optional shared CoverageIndex.
+            string_pool: Optional shared StringPool.
+            executor: Optional shared executor for decoding large responses, see DartAPIClient.
+            offload_threshold: See DartAPIClient.
+            base_url: See DartAPIClient.
+        """
+        self.client_kwargs: dict[str, Any] = {
+            "api_key": api_key,
+            "limiter": limiter or ThreadSafeLimiter(max_rate=requests_per_minute, time_period=60),
+            "fs_div_resolver": fs_div_resolver or FsDivResolver(),
+            "coverage": coverage,
+            "string_pool": string_pool,
+            "executor": executor,
+            "offload_threshold": offload_threshold,
+            "base_url": base_url,
+        }
+        self.limiter: ThreadSafeLimiter = self.client_kwargs["limiter"]
+        self._clients: dict[asyncio.AbstractEventLoop, DartAPIClient] = {}
+        self._guards: dict[asyncio.AbstractEventLoop, AsyncIterator[None]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self) -> DartAPIClient:
+        """The client of the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ClientPool is closed")
+            client = self._clients.get(loop)
+            if client is not None:
+                return client
+            client = self._clients[loop] = DartAPIClient(**self.client_kwargs)
+
+        # An async generator started on the loop is finalized by the loop's
+        # shutdown_asyncgens(), which asyncio.run() calls while the loop can
+        # still run the client's aclose()
+        guard = self._close_on_shutdown(loop, client)
+        try:
+            guard.asend(None).send(None)
+        except StopIteration:
+            pass
+        self._guards[loop] = guard
+        return client
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop, client: DartAPIClient) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await self._discard(loop, client)
+
+    async def _discard(self, loop: asyncio.AbstractEventLoop, client: DartAPIClient) -> None:
+        with self._lock:
+            if self._clients.get(loop) is client:
+                del self._clients[loop]
+                self._guards.pop(loop, None)
+        await client.close()
+
+    async def aclose(self) -> None:
+        """Close the running loop's client. The next get() on this loop creates a new one."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is not None:
+            await self._discard(loop, client)
+
+    def close(self, timeout: float = 30.0) -> None:
+        """
+        Close every remaining client and refuse new ones. Call it from a thread
+        that is not running one of the pool's loops.
+
+        Clients whose loop is running in another thread are closed on that
+        loop. Clients of loops that were closed without shutting down their
+        async generators can no longer close their connections cleanly; they
+        are marked closed and their sockets are left to the garbage collector.
+        """
+        with self._lock:
+            self._closed = True
+            clients = list(self._clients.items())
+
+        for loop, client in clients:
+            if loop.is_closed():
+                try:
+                    asyncio.run(self._discard(loop, client))
+                except RuntimeError:
+                    pass  # the transports belong to the dead loop; the client is marked closed regardless
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._discard(loop, client), loop).result(timeout)
+            else:
+                loop.run_until_complete(self._discard(loop, client))
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
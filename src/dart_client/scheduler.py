@@ -0,0 +1,294 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import IntEnum
+from typing import Any, Iterator, Optional
+
+from .errors import DartQuotaError
+from .utils import KST
+
+
+class Priority(IntEnum):
+    """Request classes, most urgent first."""
+    INTERACTIVE = 0   # a user is waiting, e.g. a company page being opened
+    DEFAULT = 1
+    BACKGROUND = 2    # backfills and other bulk work
+
+
+DEFAULT_WEIGHTS: dict[Priority, int] = {Priority.INTERACTIVE: 16, Priority.DEFAULT: 4, Priority.BACKGROUND: 1}
+DEFAULT_TAG = "default"
+
+_priority: ContextVar[Priority] = ContextVar("dart_client_priority", default=Priority.DEFAULT)
+_tag: ContextVar[str] = ContextVar("dart_client_tag", default=DEFAULT_TAG)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+def current_tag() -> str:
+    return _tag.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """
+    Run the requests made inside the block (and in tasks created inside it) with this priority.
+
+    Example:
+        with request_priority(Priority.INTERACTIVE):
+            company = await client.get_company(corp_code=corp_code)
+    """
+    token = _priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@contextmanager
+def request_tag(tag: str) -> Iterator[None]:
+    """
+    Attribute the requests made inside the block (and in tasks created inside it) to `tag`,
+    e.g. a team or a notebook, for fair sharing, quotas and per-tag statistics.
+
+    Example:
+        with request_tag("research-notebook"):
+            await job.run()
+    """
+    token = _tag.set(tag)
+    try:
+        yield
+    finally:
+        _tag.reset(token)
+
+
+@dataclass
+class ClassStats:
+    """Queue metrics of one priority class."""
+    depth: int = 0            # requests waiting now
+    max_depth: int = 0
+    submitted: int = 0
+    granted: int = 0
+    wait_total: float = 0.0   # seconds waited by the granted requests
+    wait_max: float = 0.0
+
+    @property
+    def wait_avg(self) -> float:
+        return self.wait_total / self.granted if self.granted else 0.0
+
+
+@dataclass
+class TagStats:
+    """Usage of one tag."""
+    calls: int = 0              # requests granted (quota used)
+    rejected: int = 0           # refused with DartQuotaError
+    responses: int = 0
+    bytes: int = 0              # response body bytes
+    latency_total: float = 0.0  # seconds from sending a request to its complete response
+    latency_max: float = 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        return self.latency_total / self.responses if self.responses else 0.0
+
+
+# Queue entry: (virtual finish time, sequence, future, enqueue time, tag)
+_Entry = tuple[float, int, "asyncio.Future[None]", float, str]
+
+
+class PriorityScheduler:
+    """
+    Orders requests by priority class, and by tag within a class, in front of a rate limiter.
+
+    Requests wait in one queue per Priority instead of inside the limiter. A
+    single dispatcher task takes capacity from the limiter one request at a
+    time and hands it to the queue chosen by `mode`:
+
+    - "strict": the most urgent non-empty class always goes first.
+    - "weighted": non-empty classes share the capacity by `weights`
+      (smooth weighted round robin), so background work keeps moving.
+
+    Queued low-priority requests are overtaken by every more urgent request
+    that arrives, so an interactive lookup waits for at most one limiter
+    slot, not for the backlog of a saturating backfill. Requests already
+    sent are not interrupted.
+
+    Within a class, requests are served by weighted fair queuing across
+    their tags (request_tag()): a tag with thousands of queued calls gets its
+    `tag_weights` share (default 1) of the class, not all of it, and a tag
+    that has used its daily `quotas` entry (calls per KST day, in this
+    process) is refused with DartQuotaError. Calls, response bytes and
+    latency are counted per tag.
+
+    The priority and tag of a request come from request_priority() and
+    request_tag() (context variables), Priority.DEFAULT and "default"
+    otherwise. A scheduler serves the event loop it is first used on.
+    """
+
+    def __init__(
+        self,
+        limiter: Any,
+        mode: str = "strict",
+        weights: Optional[dict[Priority, int]] = None,
+        tag_weights: Optional[dict[str, float]] = None,
+        quotas: Optional[dict[str, int]] = None,
+    ):
+        """
+        Initialize PriorityScheduler.
+
+        Args:
+            limiter: AsyncLimiter or ThreadSafeLimiter that paces the granted requests.
+            mode: "strict" or "weighted".
+            weights: Shares per class in weighted mode (default: DEFAULT_WEIGHTS).
+            tag_weights: Fair-queuing weight per tag within a class; unlisted tags weigh 1.
+            quotas: Maximum calls per KST day per tag; unlisted tags are not capped.
+        """
+        if mode not in ("strict", "weighted"):
+            raise ValueError(f"Unknown mode {mode!r}, expected 'strict' or 'weighted'")
+        self.limiter = limiter
+        self.mode = mode
+        self.weights = {p: (weights or DEFAULT_WEIGHTS).get(p, 1) for p in Priority}
+        self.tag_weights = dict(tag_weights or {})
+        self.quotas = dict(quotas or {})
+        self._queues: dict[Priority, list[_Entry]] = {p: [] for p in Priority}
+        self._credit: dict[Priority, int] = {p: 0 for p in Priority}
+        self._stats: dict[Priority, ClassStats] = {p: ClassStats() for p in Priority}
+        self._tag_stats: dict[str, TagStats] = {}
+        # Weighted fair queuing state per class: virtual time, and the last finish time of each tag
+        self._virtual_time: dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._last_finish: dict[Priority, dict[str, float]] = {p: {} for p in Priority}
+        self._sequence = itertools.count()
+        self._quota_day: date = datetime.now(KST).date()
+        self._used: dict[str, int] = {}  # calls per tag on _quota_day
+        self._dispatcher: Optional[asyncio.Task[None]] = None
+
+    def stats(self) -> dict[str, ClassStats]:
+        """Per-class queue metrics, keyed by class name."""
+        return {p.name.lower(): self._stats[p] for p in Priority}
+
+    def tag_stats(self) -> dict[str, TagStats]:
+        """Per-tag usage since the scheduler was created."""
+        return dict(self._tag_stats)
+
+    def quota_remaining(self, tag: str) -> Optional[int]:
+        """Calls `tag` may still make today, None without a quota."""
+        quota = self.quotas.get(tag)
+        if quota is None:
+            return None
+        self._roll_quota_day()
+        return max(quota - self._used.get(tag, 0), 0)
+
+    def _roll_quota_day(self) -> None:
+        today = datetime.now(KST).date()
+        if today != self._quota_day:
+            self._quota_day = today
+            self._used.clear()
+
+    def _check_quota(self, tag: str) -> None:
+        if self.quota_remaining(tag) == 0:
+            self._tag(tag).rejected += 1
+            raise DartQuotaError("QUOTA", f"Tag {tag!r} has used its quota of {self.quotas[tag]} calls today")
+
+    def _tag(self, tag: str) -> TagStats:
+        stats = self._tag_stats.get(tag)
+        if stats is None:
+            stats = self._tag_stats[tag] = TagStats()
+        return stats
+
+    def record(self, nbytes: int, latency: float, tag: Optional[str] = None) -> None:
+        """Count a response of `nbytes` that took `latency` seconds (called by the client)."""
+        stats = self._tag(current_tag() if tag is None else tag)
+        stats.responses += 1
+        stats.bytes += nbytes
+        stats.latency_total += latency
+        stats.latency_max = max(stats.latency_max, latency)
+
+    async def acquire(self, priority: Optional[Priority] = None, tag: Optional[str] = None) -> None:
+        """
+        Wait until the dispatcher grants this request a limiter slot.
+
+        Raises:
+            DartQuotaError: The tag has used its daily quota.
+        """
+        priority = current_priority() if priority is None else Priority(priority)
+        tag = current_tag() if tag is None else tag
+        self._check_quota(tag)
+        stats = self._stats[priority]
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        enqueued = time.perf_counter()
+
+        # Each queued call of a tag finishes 1/weight later in virtual time than its previous one
+        last_finish = self._last_finish[priority]
+        finish = max(self._virtual_time[priority], last_finish.get(tag, 0.0)) + 1 / self.tag_weights.get(tag, 1)
+        last_finish[tag] = finish
+        heapq.heappush(self._queues[priority], (finish, next(self._sequence), future, enqueued, tag))
+
+        stats.submitted += 1
+        stats.depth += 1
+        stats.max_depth = max(stats.max_depth, stats.depth)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                stats.depth -= 1  # still queued; the dispatcher skips it
+            raise
+        waited = time.perf_counter() - enqueued
+        stats.granted += 1
+        stats.wait_total += waited
+        stats.wait_max = max(stats.wait_max, waited)
+
+    async def _dispatch(self) -> None:
+        while self._has_waiters():
+            async with self.limiter:
+                pass
+            # Chosen after the wait, so that requests which arrived meanwhile compete too
+            while (priority := self._choose()) is not None:
+                finish, _, future, _, tag = heapq.heappop(self._queues[priority])
+                if future.cancelled():
+                    continue
+                self._stats[priority].depth -= 1
+                self._virtual_time[priority] = finish
+                try:
+                    self._check_quota(tag)
+                except DartQuotaError as e:
+                    future.set_exception(e)  # the slot goes to the next request
+                    continue
+                self._used[tag] = self._used.get(tag, 0) + 1
+                self._tag(tag).calls += 1
+                future.set_result(None)
+                break
+
+    def _has_waiters(self) -> bool:
+        for queue in self._queues.values():
+            while queue and queue[0][2].cancelled():
+                heapq.heappop(queue)
+            if queue:
+                return True
+        return False
+
+    def _choose(self) -> Optional[Priority]:
+        ready = [p for p in Priority if self._queues[p]]
+        if not ready:
+            return None
+        if self.mode == "strict":
+            return ready[0]
+        # Smooth weighted round robin over the non-empty classes
+        for p in ready:
+            self._credit[p] += self.weights[p]
+        chosen = max(ready, key=lambda p: self._credit[p])
+        self._credit[chosen] -= sum(self.weights[p] for p in ready)
+        return chosen
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
@@ -0,0 +1,124 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .utils import cache_dir
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ContentStore:
+    """
+    Content-addressed file store for filing archives, keyed by rcept_no.
+
+    Layout under `root`:
+
+        objects/ab/cdef...   file contents, named by their sha256
+        refs/20240312/20240312000736   sha256 of the archive of a receipt
+        partial/20240312000736.part    download in progress
+
+    Identical archives are stored once. A ref is only written after its
+    object is complete, so a crash leaves at most a .part file behind, which
+    the next download resumes or replaces.
+    """
+
+    def __init__(self, root: Optional[str | Path] = None):
+        """
+        Initialize ContentStore.
+
+        Args:
+            root: Store directory (default: "documents" in the user cache directory).
+        """
+        self.root = Path(root) if root else cache_dir() / "documents"
+        self.objects_dir = self.root / "objects"
+        self.refs_dir = self.root / "refs"
+        self.partial_dir = self.root / "partial"
+        for directory in (self.objects_dir, self.refs_dir, self.partial_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def _ref_path(self, rcept_no: str) -> Path:
+        return self.refs_dir / rcept_no[:8] / rcept_no
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def part_path(self, rcept_no: str) -> Path:
+        return self.partial_dir / f"{rcept_no}.part"
+
+    def digest(self, rcept_no: str) -> Optional[str]:
+        try:
+            return self._ref_path(rcept_no).read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def has(self, rcept_no: str) -> bool:
+        digest = self.digest(rcept_no)
+        return digest is not None and self._object_path(digest).exists()
+
+    __contains__ = has
+
+    def path(self, rcept_no: str) -> Optional[Path]:
+        """Path of the stored archive, or None if it is not stored."""
+        digest = self.digest(rcept_no)
+        if digest is None:
+            return None
+        path = self._object_path(digest)
+        return path if path.exists() else None
+
+    def read(self, rcept_no: str) -> bytes:
+        path = self.path(rcept_no)
+        if path is None:
+            raise KeyError(rcept_no)
+        return path.read_bytes()
+
+    def commit(self, rcept_no: str) -> tuple[str, bool]:
+        """
+        Move the finished .part file of a receipt into the store.
+
+        Returns:
+            (sha256, whether the content was already stored under another receipt)
+        """
+        part = self.part_path(rcept_no)
+        digest = file_digest(part)
+        target = self._object_path(digest)
+        duplicate = target.exists()
+        if duplicate:
+            part.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(part, target)
+
+        ref = self._ref_path(rcept_no)
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        tmp_ref = ref.with_name(ref.name + ".tmp")
+        tmp_ref.write_text(digest)
+        os.replace(tmp_ref, ref)
+        return digest, duplicate
+
+    def partials(self) -> list[str]:
+        """Receipts with an unfinished download."""
+        return sorted(p.name[: -len(".part")] for p in self.partial_dir.glob("*.part"))
+
+    def refs(self) -> Iterator[str]:
+        for ref in self.refs_dir.glob("*/*"):
+            if not ref.name.endswith(".tmp"):
+                yield ref.name
+
+    def disk_usage(self) -> dict[str, int]:
+        """Number of receipts and objects, and bytes used by objects and partial files."""
+        objects = [p for p in self.objects_dir.glob("*/*") if p.is_file()]
+        return {
+            "refs": sum(1 for _ in self.refs()),
+            "objects": len(objects),
+            "object_bytes": sum(p.stat().st_size for p in objects),
+            "partial_bytes": sum(p.stat().st_size for p in self.partial_dir.glob("*.part")),
+        }
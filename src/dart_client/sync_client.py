@@ -0,0 +1,233 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+import httpx
+
+from .client import DartClientBase, _parse_corp_codes, _parse_status_document
+from .errors import DartAPIError
+from .fs_div import FsDivResolver
+from .generated.sync_api import GeneratedSyncDartAPIMixin
+from .interning import StringPool
+from .limiter import ThreadSafeLimiter
+
+if TYPE_CHECKING:
+    from .coverage import CoverageIndex
+    from .models.corp_code import CorpCode
+    from .models.disclosure import DisclosureList
+
+logger = logging.getLogger("dart_client")
+
+
+def fan_out(
+    func: Callable[..., Any],
+    calls: Iterable[dict[str, Any]],
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Call func(**kwargs) for every kwargs in `calls` on a thread pool and
+    return the results in input order.
+
+    Args:
+        func: Blocking callable, e.g. a SyncDartAPIClient method.
+        calls: Keyword arguments of each call.
+        max_workers: Calls in flight. The client's limiter still bounds the request rate.
+        return_exceptions: Put exceptions in the result list instead of raising the first one.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(func, **kwargs) for kwargs in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(e)
+        return results
+
+
+class SyncDartAPIClient(DartClientBase, GeneratedSyncDartAPIMixin):
+    """
+    Blocking client for the DART API, for Django views, scripts and notebooks.
+
+    Has the same methods as DartAPIClient without `await`. One instance keeps
+    its connection pool and rate limiter for its whole life and can be shared
+    by any number of threads.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_minute: int = 100,
+        limiter: Optional[ThreadSafeLimiter] = None,
+        fs_div_resolver: Optional[FsDivResolver] = None,
+        coverage: Optional["CoverageIndex"] = None,
+        string_pool: Optional[StringPool] = None,
+        base_url: Optional[str] = None,
+    ):
+        """
+        Initialize SyncDartAPIClient.
+
+        Args:
+            api_key: DART API Key. If None, tries to read from DART_API_KEY env var.
+            requests_per_minute: Max requests per minute (default: 100).
+            limiter: Optional external ThreadSafeLimiter instance (e.g. shared with other clients).
+                     If provided, requests_per_minute is ignored.
+            fs_div_resolver: Optional FsDivResolver used by get_fnltt_singl_acnt_all(fs_div="AUTO").
+            coverage: Optional CoverageIndex, see DartAPIClient.
+            string_pool: Optional StringPool, see DartAPIClient.
+            base_url: API base URL, see DartAPIClient.
+        """
+        self._init_base(api_key, fs_div_resolver, coverage, string_pool, base_url)
+        self.client = httpx.Client(timeout=30.0)
+        self.limiter = limiter or ThreadSafeLimiter(max_rate=requests_per_minute, time_period=60)
+
+    def __del__(self):
+        if hasattr(self, "client") and not self.client.is_closed:
+            logger.warning(
+                "SyncDartAPIClient was not closed. Use 'with SyncDartAPIClient(...)', or call 'client.close()'."
+            )
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | bytes:
+        """
+        Make a request to the DART API.
+        """
+        url, params = self._prepare(endpoint, params)
+
+        with self.limiter:
+            response = self.client.get(url, params=params)
+
+        response.raise_for_status()
+
+        # DART returns JSON for most endpoints, but ZIP/XML for some
+        if self._is_file_response(response):
+            return response.content
+
+        try:
+            data = self._decode(response.content)
+        except ValueError:  # JSONDecodeError, UnicodeDecodeError
+            # Fallback for non-JSON responses (e.g. XML string if not zipped)
+            return response.content
+
+        return self._check_response(endpoint, params, data)
+
+    def download(self, endpoint: str, params: dict[str, Any], path: str | Path, offset: int = 0) -> int:
+        """
+        Stream a file endpoint (e.g. document.xml) to disk. See DartAPIClient.download().
+
+        Returns:
+            Number of bytes written by this call.
+        """
+        url, params = self._prepare(endpoint, dict(params))
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        with self.limiter:
+            with self.client.stream("GET", url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "")
+                if "zip" not in content_type and "octet-stream" not in content_type:
+                    # Errors come back as a small JSON or XML status document instead of the file
+                    self._check_status(endpoint, params, *_parse_status_document(response.read()))
+                    raise DartAPIError("INVALID_RESPONSE", f"Unexpected {content_type or 'untyped'} response")
+
+                resumed = offset and response.status_code == 206
+                written = 0
+                with open(path, "ab" if resumed else "wb") as f:
+                    for chunk in response.iter_bytes():
+                        f.write(chunk)
+                        written += len(chunk)
+
+        if self.coverage is not None:
+            self.coverage.record(endpoint, params, has_data=True)
+        return written
+
+    def map(
+        self,
+        method: str | Callable[..., Any],
+        calls: Iterable[dict[str, Any]],
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Run many calls of one method concurrently on a thread pool, results in input order.
+
+        Example:
+            client.map("get_company", [{"corp_code": c} for c in corp_codes])
+
+        Args:
+            method: Method name or bound method of this client.
+            calls: Keyword arguments of each call.
+            max_workers: Calls in flight. The limiter still bounds the request rate.
+            return_exceptions: Put exceptions in the result list instead of raising the first one.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        return fan_out(func, calls, max_workers=max_workers, return_exceptions=return_exceptions)
+
+    def get_corp_code(self) -> "list[CorpCode]":
+        """
+        Fetch the list of unique corporation codes.
+        Returns a list of CorpCode models.
+        """
+        content = self.request("corpCode.xml")
+        if not isinstance(content, bytes):
+            raise DartAPIError("INVALID_RESPONSE", "Expected bytes response for corpCode.xml")
+        return _parse_corp_codes(content)
+
+    def get_fnltt_singl_acnt_all(
+        self, corp_code: str, bsns_year: str, reprt_code: str, fs_div: str = "AUTO"
+    ) -> dict[str, Any]:
+        """
+        단일회사 전체 재무제표
+
+        Same as the generated method, plus fs_div="AUTO" (the default), see DartAPIClient.
+        """
+        if fs_div == "AUTO":
+            return self.fs_div_resolver.fetch_sync(self, corp_code, bsns_year, reprt_code)
+        return super().get_fnltt_singl_acnt_all(
+            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code, fs_div=fs_div
+        )
+
+    def search_disclosure(
+        self,
+        corp_code: Optional[str] = None,
+        bgn_de: Optional[str] = None,
+        end_de: Optional[str] = None,
+        pblntf_ty: Optional[str] = None,
+        last_reprt_at: Optional[str] = None,
+        page_no: int = 1,
+        page_count: int = 10
+    ) -> "DisclosureList":
+        """
+        Search for disclosures.
+        """
+        params = {
+            "corp_code": corp_code,
+            "bgn_de": bgn_de,
+            "end_de": end_de,
+            "pblntf_ty": pblntf_ty,
+            "last_reprt_at": last_reprt_at,
+            "page_no": page_no,
+            "page_count": page_count
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+
+        data = self.request("list.json", params)
+        if isinstance(data, bytes):
+            raise DartAPIError("INVALID_RESPONSE", "Expected JSON response for list.json")
+
+        from .models.disclosure import DisclosureList
+        return DisclosureList(**data)
@@ -0,0 +1,188 @@
+"""
+Local snapshot of the XBRL standard account taxonomy (xbrlTaxonomy.json).
+
+The taxonomy changes at most once a year, so it is fetched once with
+
+    python -m dart_client.taxonomy refresh
+
+and afterwards loaded from the user cache directory, without API calls.
+"""
+import argparse
+import asyncio
+import json
+import time
+from functools import cache
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .errors import DartAPIError, DartNoDataError
+from .utils import cache_dir, write_json_atomic
+
+# sj_div values accepted by xbrlTaxonomy.json
+TAXONOMY_SJ_DIVS = (
+    "BS1", "BS2", "BS3", "BS4",          # 재무상태표 (유동/비유동법, 유동성배열법 × 연결/별도)
+    "IS1", "IS2", "IS3", "IS4",          # 손익계산서 (기능별, 성격별 × 연결/별도)
+    "CIS1", "CIS2", "CIS3", "CIS4",      # 포괄손익계산서 (세후, 세전 × 연결/별도)
+    "DCIS1", "DCIS2", "DCIS3", "DCIS4",  # 단일 포괄손익계산서
+    "DCIS5", "DCIS6", "DCIS7", "DCIS8",
+    "CF1", "CF2", "CF3", "CF4",          # 현금흐름표 (직접법, 간접법 × 연결/별도)
+    "SCE1", "SCE2",                      # 자본변동표 (연결/별도)
+)
+
+SNAPSHOT_FILENAME = "xbrl_taxonomy.json"
+
+
+def default_snapshot_path() -> Path:
+    return cache_dir() / SNAPSHOT_FILENAME
+
+
+class Taxonomy:
+    """
+    Indexed taxonomy rows (sj_div, account_id, account_nm, label_kor, label_eng, ...).
+
+    Lookups are plain dict accesses on indexes built once at load time.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]], fetched_at: Optional[float] = None):
+        self.fetched_at = fetched_at
+        self.by_sj_div: dict[str, list[dict[str, Any]]] = {}
+        self.by_account_id: dict[str, list[dict[str, Any]]] = {}
+        self._by_key: dict[tuple[str, str], dict[str, Any]] = {}
+        for row in rows:
+            sj_div, account_id = row.get("sj_div", ""), row.get("account_id", "")
+            self.by_sj_div.setdefault(sj_div, []).append(row)
+            self.by_account_id.setdefault(account_id, []).append(row)
+            self._by_key.setdefault((sj_div, account_id), row)
+
+    @classmethod
+    def load(cls, path: Optional[str | Path] = None) -> "Taxonomy":
+        path = Path(path) if path else default_snapshot_path()
+        if not path.exists():
+            raise FileNotFoundError(
+                f"No XBRL taxonomy snapshot at {path}. Create it with: python -m dart_client.taxonomy refresh"
+            )
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        rows = [row for sj_rows in snapshot["sj_divs"].values() for row in sj_rows]
+        return cls(rows, fetched_at=snapshot.get("fetched_at"))
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __contains__(self, account_id: object) -> bool:
+        return account_id in self.by_account_id
+
+    @property
+    def sj_divs(self) -> list[str]:
+        return list(self.by_sj_div)
+
+    def get(self, account_id: str, sj_div: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """
+        Taxonomy row of an account. Without sj_div, the first statement form listing it is used.
+        """
+        if sj_div is not None:
+            return self._by_key.get((sj_div, account_id))
+        rows = self.by_account_id.get(account_id)
+        return rows[0] if rows else None
+
+    def label(self, account_id: str, sj_div: Optional[str] = None, lang: str = "kor") -> Optional[str]:
+        """Standard label (label_kor or label_eng) of an account_id."""
+        row = self.get(account_id, sj_div)
+        return row.get(f"label_{lang}") if row else None
+
+    def accounts(self, sj_div: str) -> list[dict[str, Any]]:
+        """All rows of one statement form, in taxonomy order."""
+        return self.by_sj_div.get(sj_div, [])
+
+
+@cache
+def _load_default() -> Taxonomy:
+    return Taxonomy.load()
+
+
+def get_taxonomy() -> Taxonomy:
+    """
+    The snapshot in the user cache directory, loaded on first use and shared afterwards.
+    """
+    return _load_default()
+
+
+async def refresh_taxonomy(
+    client: Any,
+    path: Optional[str | Path] = None,
+    sj_divs: Iterable[str] = TAXONOMY_SJ_DIVS,
+) -> Taxonomy:
+    """
+    Re-fetch the taxonomy for the given statement forms and update the snapshot.
+
+    Forms not fetched are kept from the existing snapshot. The snapshot is
+    only replaced when the refresh returned rows, and rows again for every
+    fetched form the snapshot already had, so a failed or partial refresh
+    never destroys a good snapshot.
+
+    Args:
+        client: DartAPIClient used for the xbrlTaxonomy.json calls.
+        path: Snapshot file (default: xbrl_taxonomy.json in the user cache directory).
+        sj_divs: Statement forms to fetch.
+
+    Raises:
+        DartAPIError: The refresh came back empty or incomplete; the snapshot is unchanged.
+    """
+    path = Path(path) if path else default_snapshot_path()
+    requested = list(sj_divs)
+    fetched: dict[str, list[dict[str, Any]]] = {}
+    for sj_div in requested:
+        try:
+            response = await client.get_xbrl_taxonomy(sj_div=sj_div)
+        except DartNoDataError:
+            continue
+        rows = response.get("list", [])
+        if rows:
+            fetched[sj_div] = rows
+
+    previous = _read_sj_divs(path)
+    lost = [sj_div for sj_div in previous if sj_div in requested and sj_div not in fetched]
+    if not fetched or lost:
+        missing = ", ".join(lost) or "every statement form"
+        raise DartAPIError("INVALID_RESPONSE", f"Taxonomy refresh returned no rows for {missing}; kept {path}")
+
+    snapshot = {"fetched_at": time.time(), "sj_divs": {**previous, **fetched}}
+    write_json_atomic(path, snapshot)  # temp file + os.replace
+    _load_default.cache_clear()
+    rows = [row for sj_rows in snapshot["sj_divs"].values() for row in sj_rows]
+    return Taxonomy(rows, fetched_at=snapshot["fetched_at"])
+
+
+def _read_sj_divs(path: Path) -> dict[str, list[dict[str, Any]]]:
+    """Rows per statement form of an existing snapshot, empty without a readable one."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {sj_div: rows for sj_div, rows in json.load(f)["sj_divs"].items() if rows}
+    except (OSError, ValueError, KeyError, AttributeError):
+        return {}
+
+
+async def _refresh_command(args: argparse.Namespace) -> None:
+    from .client import DartAPIClient
+
+    async with DartAPIClient(api_key=args.api_key) as client:
+        taxonomy = await refresh_taxonomy(client, args.path, args.sj_div or TAXONOMY_SJ_DIVS)
+    path = args.path or default_snapshot_path()
+    print(f"Saved {len(taxonomy)} accounts in {len(taxonomy.sj_divs)} statement forms to {path}")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dart_client.taxonomy", description="XBRL taxonomy snapshot")
+    commands = parser.add_subparsers(dest="command", required=True)
+    refresh = commands.add_parser("refresh", help="Re-fetch the taxonomy through the API")
+    refresh.add_argument("--path", type=Path, help="Snapshot file (default: user cache directory)")
+    refresh.add_argument("--sj-div", action="append", help="Statement form to fetch (repeatable, default: all)")
+    refresh.add_argument("--api-key", help="DART API key (default: DART_API_KEY env var)")
+    args = parser.parse_args(argv)
+
+    if args.command == "refresh":
+        asyncio.run(_refresh_command(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+KST = timezone(timedelta(hours=9))
+
+
+def today_kst() -> str:
+    """Return today's date in DART's YYYYMMDD format (Korea Standard Time)."""
+    return datetime.now(KST).strftime("%Y%m%d")
+
+
+def shift_date(date: str, days: int) -> str:
+    """Add `days` to a YYYYMMDD date string."""
+    return (datetime.strptime(date, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+
+def cache_dir() -> Path:
+    """
+    Per-user cache directory for snapshots and downloads:
+    $DART_CLIENT_CACHE_DIR, else $XDG_CACHE_HOME/dart_client, else ~/.cache/dart_client.
+    """
+    explicit = os.getenv("DART_CLIENT_CACHE_DIR")
+    if explicit:
+        return Path(explicit)
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "dart_client"
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON through a temp file so a crash never leaves a truncated file behind."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def parse_amount(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a DART amount string such as "195,936,557,000,000" or "-11,526,297,000,000".
+    Empty strings and placeholders ("-") become None.
+    """
+    if value is None:
+        return None
+    value = value.replace(",", "").strip()
+    if value in ("", "-"):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+# pblntf_detail_ty of periodic reports -> reprt_code (분기보고서 is resolved by period month)
+PERIODIC_DETAIL_TYPES: dict[str, Optional[str]] = {
+    "A001": "11011",  # 사업보고서
+    "A002": "11012",  # 반기보고서
+    "A003": None,     # 분기보고서
+}
+
+_PERIOD_RE = re.compile(r"\((\d{4})\.(\d{2})\)")
+_PERIODIC_TITLES = {"사업보고서": "A001", "반기보고서": "A002", "분기보고서": "A003"}
+
+
+def periodic_detail_type(report_nm: str) -> Optional[str]:
+    """Guess the pblntf_detail_ty of a periodic report from its title (list.json rows do not carry it)."""
+    for title, detail_ty in _PERIODIC_TITLES.items():
+        if title in report_nm:
+            return detail_ty
+    return None
+
+
+def parse_periodic_report(report_nm: str, detail_ty: str, acc_mt: int = 12) -> Optional[tuple[str, str]]:
+    """
+    Extract (bsns_year, reprt_code) from a periodic report title such as "사업보고서 (2023.12)".
+
+    Args:
+        report_nm: Report title from list.json.
+        detail_ty: pblntf_detail_ty the title was listed under (A001/A002/A003).
+        acc_mt: Fiscal year-end month of the company, used to tell Q1 from Q3 reports.
+    """
+    match = _PERIOD_RE.search(report_nm)
+    if match is None or detail_ty not in PERIODIC_DETAIL_TYPES:
+        return None
+    year, month = match.group(1), int(match.group(2))
+    reprt_code = PERIODIC_DETAIL_TYPES[detail_ty]
+    if reprt_code is None:
+        reprt_code = "11013" if (month - acc_mt) % 12 == 3 else "11014"
+    return year, reprt_code
@@ -0,0 +1,260 @@
+"""
+Streaming parser for XBRL instance documents, such as the archives returned by get_api_2019019.
+
+Facts are read with ElementTree.iterparse and each top-level element is
+cleared once handled, so memory stays bounded by the batch size and the
+contexts/units of the filing rather than the document size.
+"""
+import io
+import os
+import pickle
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
+from xml.etree.ElementTree import iterparse
+
+XBRLI_NS = "http://www.xbrl.org/2003/instance"
+XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+XBRLDI_EXPLICIT = "{http://xbrl.org/2006/xbrldi}explicitMember"
+XBRLDI_TYPED = "{http://xbrl.org/2006/xbrldi}typedMember"
+
+# Top-level elements of an instance that are not facts
+_NON_FACT_NAMESPACES = {
+    XBRLI_NS,
+    "http://www.xbrl.org/2003/linkbase",
+    "http://www.w3.org/1999/xlink",
+}
+
+ArchiveSource = str | Path | bytes
+
+
+@dataclass(frozen=True)
+class XbrlContext:
+    id: str
+    entity: str
+    start_date: Optional[str]
+    end_date: Optional[str]  # instant contexts have end_date only
+    # (dimension, member) pairs, both as prefix_LocalName
+    dimensions: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def is_instant(self) -> bool:
+        return self.start_date is None
+
+
+@dataclass
+class FactBatch:
+    """
+    A batch of facts in columnar form: the i-th fact is
+    (concept[i], context_ref[i], unit_ref[i], decimals[i], value[i]).
+
+    Concepts use DART's account_id notation (prefix_LocalName, e.g.
+    "ifrs-full_Revenue"). Nil facts have value None.
+    """
+    concept: list[str] = field(default_factory=list)
+    context_ref: list[str] = field(default_factory=list)
+    unit_ref: list[Optional[str]] = field(default_factory=list)
+    decimals: list[Optional[str]] = field(default_factory=list)
+    value: list[Optional[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.concept)
+
+    def append(
+        self, concept: str, context_ref: str, unit_ref: Optional[str], decimals: Optional[str], value: Optional[str]
+    ) -> None:
+        self.concept.append(concept)
+        self.context_ref.append(context_ref)
+        self.unit_ref.append(unit_ref)
+        self.decimals.append(decimals)
+        self.value.append(value)
+
+    def rows(self) -> Iterator[tuple[str, str, Optional[str], Optional[str], Optional[str]]]:
+        return zip(self.concept, self.context_ref, self.unit_ref, self.decimals, self.value, strict=True)
+
+
+def _split(tag: str) -> tuple[str, str]:
+    if tag.startswith("{"):
+        uri, _, local = tag[1:].partition("}")
+        return uri, local
+    return "", tag
+
+
+class XbrlInstanceParser:
+    """
+    Iterates the facts of one XBRL instance as FactBatch objects.
+
+    Contexts and units are collected into `contexts` and `units` while
+    parsing; since they usually precede the facts, they are complete for
+    every fact by the time its batch is yielded.
+    """
+
+    def __init__(self, batch_size: int = 10_000):
+        """
+        Initialize XbrlInstanceParser.
+
+        Args:
+            batch_size: Facts per yielded batch.
+        """
+        self.batch_size = batch_size
+        self.contexts: dict[str, XbrlContext] = {}
+        self.units: dict[str, str] = {}
+        self._prefixes: dict[str, str] = {}
+
+    def _name(self, tag: str) -> str:
+        uri, local = _split(tag)
+        prefix = self._prefixes.get(uri)
+        return f"{prefix}_{local}" if prefix else local
+
+    def _qname(self, text: str) -> str:
+        # Dimension and member QNames in attributes/text are written prefix:LocalName
+        return text.strip().replace(":", "_", 1)
+
+    def _read_context(self, element) -> XbrlContext:
+        entity = element.findtext(f"{{{XBRLI_NS}}}entity/{{{XBRLI_NS}}}identifier", "").strip()
+        period = element.find(f"{{{XBRLI_NS}}}period")
+        start = end = None
+        if period is not None:
+            instant = period.findtext(f"{{{XBRLI_NS}}}instant")
+            if instant is not None:
+                end = instant.strip()
+            else:
+                start = (period.findtext(f"{{{XBRLI_NS}}}startDate") or "").strip() or None
+                end = (period.findtext(f"{{{XBRLI_NS}}}endDate") or "").strip() or None
+        dimensions = []
+        for member in element.iter(XBRLDI_EXPLICIT):
+            dimensions.append((self._qname(member.get("dimension", "")), self._qname(member.text or "")))
+        for member in element.iter(XBRLDI_TYPED):
+            value = "".join(member.itertext()).strip()
+            dimensions.append((self._qname(member.get("dimension", "")), value))
+        return XbrlContext(element.get("id", ""), entity, start, end, tuple(dimensions))
+
+    def _read_unit(self, element) -> str:
+        measures = [m.text.strip() for m in element.iter(f"{{{XBRLI_NS}}}measure") if m.text]
+        if element.find(f"{{{XBRLI_NS}}}divide") is not None and len(measures) == 2:
+            return f"{measures[0]}/{measures[1]}"
+        return "*".join(measures)
+
+    def iter_batches(self, source: str | Path | IO[bytes]) -> Iterator[FactBatch]:
+        """
+        Parse an instance document (path or binary file object) and yield its facts in batches.
+        """
+        batch = FactBatch()
+        depth = 0
+        root = None
+        for event, item in iterparse(source, events=("start-ns", "start", "end")):
+            if event == "start-ns":
+                prefix, uri = item
+                self._prefixes.setdefault(uri, prefix)
+                continue
+            if event == "start":
+                if root is None:
+                    root = item
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1:
+                continue
+            uri, local = _split(item.tag)
+            if uri == XBRLI_NS and local == "context":
+                context = self._read_context(item)
+                self.contexts[context.id] = context
+            elif uri == XBRLI_NS and local == "unit":
+                self.units[item.get("id", "")] = self._read_unit(item)
+            elif uri not in _NON_FACT_NAMESPACES and item.get("contextRef") is not None:
+                value = None if item.get(XSI_NIL) == "true" else (item.text or "").strip()
+                batch.append(
+                    self._name(item.tag), item.get("contextRef"), item.get("unitRef"), item.get("decimals"), value
+                )
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = FactBatch()
+            # Drop every handled top-level element so the tree never grows
+            root.clear()
+
+        if batch:
+            yield batch
+
+
+def _open_archive(archive: ArchiveSource) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(archive) if isinstance(archive, bytes) else archive)
+
+
+def instance_members(archive: zipfile.ZipFile) -> list[str]:
+    """Names of the XBRL instance documents (*.xbrl) in an archive."""
+    return [name for name in archive.namelist() if name.lower().endswith(".xbrl")]
+
+
+def iter_archive_facts(archive: ArchiveSource, batch_size: int = 10_000) -> Iterator[tuple[str, FactBatch]]:
+    """
+    Yield (member name, batch) for every instance document in a ZIP archive
+    (bytes from get_api_2019019, or a path). Members are decompressed as
+    they are parsed, never fully loaded into memory.
+    """
+    with _open_archive(archive) as zf:
+        for name in instance_members(zf):
+            with zf.open(name) as member:
+                for batch in XbrlInstanceParser(batch_size).iter_batches(member):
+                    yield name, batch
+
+
+def _spool_archive(archive: ArchiveSource, batch_size: int, path: str) -> str:
+    """Worker side of parse_archives(): write the batches to `path` one pickle at a time."""
+    with open(path, "wb") as f:
+        for name, batch in iter_archive_facts(archive, batch_size):
+            pickle.dump((name, batch), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_spool(path: str) -> Iterator[tuple[str, FactBatch]]:
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def parse_archives(
+    archives: Iterable[ArchiveSource],
+    max_workers: Optional[int] = None,
+    batch_size: int = 10_000,
+    spool_dir: Optional[str | Path] = None,
+) -> Iterator[tuple[ArchiveSource, str, FactBatch]]:
+    """
+    Parse many archives in a process pool, yielding (archive, member, batch).
+
+    The batches of one archive are yielded together, archives in the order
+    they finish. Workers spool their batches to a temporary file instead of
+    returning them, and the file is read back one batch at a time, so
+    memory stays bounded by the batch size on both sides, whatever the
+    archive size.
+
+    Pass paths rather than bytes where possible, so workers read the files
+    themselves instead of receiving the archives through pickling.
+
+    Args:
+        archives: ZIP paths or bytes.
+        max_workers: Worker processes (default: CPU count).
+        batch_size: Facts per batch.
+        spool_dir: Directory for the spool files (default: the system temp directory).
+    """
+    with tempfile.TemporaryDirectory(prefix="dart_xbrl_", dir=spool_dir) as spool:
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                pool.submit(_spool_archive, archive, batch_size, os.path.join(spool, f"{i}.pickle")): archive
+                for i, archive in enumerate(archives)
+            }
+            for future in as_completed(futures):
+                path = future.result()
+                for name, batch in _read_spool(path):
+                    yield futures[future], name, batch
+                os.remove(path)
+        finally:
+            # Also reached when the caller stops early: archives not started yet are dropped
+            pool.shutdown(cancel_futures=True)
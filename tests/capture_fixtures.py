@@ -27,7 +27,7 @@ async def capture_fixtures():
     
     async with DartAPIClient(api_key=api_key) as client:
         # 1. Corp Code (first 100 only to keep fixture size reasonable)
-        print("\n[1/5] Capturing corp_code...")
+        print("\n[1/6] Capturing corp_code...")
         corp_codes = await client.get_corp_code()
         fixture_data = [code.model_dump() for code in corp_codes[:100]]
         with open(FIXTURES_DIR / "corp_code.json", "w", encoding="utf-8") as f:
@@ -35,14 +35,14 @@ async def capture_fixtures():
         print(f"  ✅ Saved {len(fixture_data)} corp codes")
         
         # 2. Company (Samsung Electronics)
-        print("\n[2/5] Capturing company...")
+        print("\n[2/6] Capturing company...")
         company = await client.get_company(corp_code="00126380")
         with open(FIXTURES_DIR / "company.json", "w", encoding="utf-8") as f:
             json.dump(company, f, ensure_ascii=False, indent=2)
         print(f"  ✅ Saved company info")
         
         # 3. Disclosure List
-        print("\n[3/5] Capturing disclosure list...")
+        print("\n[3/6] Capturing disclosure list...")
         disclosures = await client.get_list(
             corp_code="00126380",
             bgn_de="20240101",
@@ -54,7 +54,7 @@ async def capture_fixtures():
         print(f"  ✅ Saved disclosure list")
         
         # 4. Financial Statement
-        print("\n[4/5] Capturing financial statement...")
+        print("\n[4/6] Capturing financial statement...")
         financials = await client.get_fnltt_singl_acnt(
             corp_code="00126380",
             bsns_year="2023",
@@ -65,7 +65,7 @@ async def capture_fixtures():
         print(f"  ✅ Saved financial data")
         
         # 5. Stock ownership
-        print("\n[5/5] Capturing stock ownership...")
+        print("\n[5/6] Capturing stock ownership...")
         try:
             ownership = await client.get_hyslr_sttus(
                 corp_code="00126380",
@@ -77,6 +77,20 @@ async def capture_fixtures():
             print(f"  ✅ Saved ownership data")
         except Exception as e:
             print(f"  ⚠️  Skipped: {e}")
+        
+        # 6. Financial indicators (same report as financials.json)
+        print("\n[6/6] Capturing financial indicators...")
+        indicators = {}
+        for idx_cl_code in ("M210000", "M220000", "M230000"):
+            indicators[idx_cl_code] = await client.get_fnltt_singl_indx(
+                corp_code="00126380",
+                bsns_year="2023",
+                reprt_code="11011",
+                idx_cl_code=idx_cl_code
+            )
+        with open(FIXTURES_DIR / "indicators.json", "w", encoding="utf-8") as f:
+            json.dump(indicators, f, ensure_ascii=False, indent=2)
+        print(f"  ✅ Saved financial indicators")
     
     print(f"\n✅ Fixtures saved to {FIXTURES_DIR}")
 
@@ -0,0 +1,91 @@
+"""
+Tests for bulk typed-column conversion of DS002/DS004 responses.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dart_client.columns import (  # noqa: E402
+    field_types,
+    infer_field_type,
+    parse_dates,
+    parse_floats,
+    to_columns,
+)
+from dart_client.generated.fields import FIELD_TYPES  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(filename):
+    with open(FIXTURES_DIR / filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_ownership_fixture_columns():
+    response = load_fixture("ownership.json")
+    columns = to_columns(response, endpoint="hyslrSttus.json")
+
+    assert len(columns) == len(response["list"])
+    assert columns["bsis_posesn_stock_co"].dtype == np.int64
+    assert columns["bsis_posesn_stock_co"][0] == 508_157_148
+    assert columns["trmend_posesn_stock_qota_rt"].dtype == np.float64
+    assert columns["trmend_posesn_stock_qota_rt"][0] == pytest.approx(8.51)
+    assert columns["stlm_dt"][0] == np.datetime64("2023-12-31")
+    # "-" stays as text but is reported as missing
+    assert columns.types["rm"] == "str"
+    assert columns["rm"][0] == "-"
+    assert not columns.present["rm"][0]
+    assert columns.types["corp_code"] == "str"
+
+
+def test_missing_values_are_masked():
+    rows = [
+        {"stkqy": "1,000", "stkrt": "5.12", "rcept_dt": "2024-01-02"},
+        {"stkqy": "-", "stkrt": "", "rcept_dt": "-"},
+    ]
+    columns = to_columns(rows, endpoint="majorstock.json")
+    assert columns.masked("stkqy").tolist() == [1000, None]
+    assert np.isnan(columns["stkrt"][1])
+    assert np.isnat(columns["rcept_dt"][1])
+    assert columns.present["rcept_dt"].tolist() == [True, False]
+
+
+def test_generated_types_override_inference():
+    # change_qy_* does not match the name rules but is listed for tesstkAcqsDspsSttus.json
+    assert infer_field_type("change_qy_acqs") == "str"
+    assert field_types("tesstkAcqsDspsSttus.json", ["change_qy_acqs", "rm"]) == {
+        "change_qy_acqs": "int", "rm": "str",
+    }
+    # Unknown endpoints fall back to the name rules
+    assert field_types("unknown.json", ["posesn_stock_co", "qota_rt"]) == {
+        "posesn_stock_co": "int", "qota_rt": "float",
+    }
+
+
+def test_generated_types_agree_with_rules_where_they_overlap():
+    for endpoint, types in FIELD_TYPES.items():
+        for name, field_type in types.items():
+            inferred = infer_field_type(name)
+            assert inferred in ("str", field_type), (endpoint, name)
+
+
+def test_parse_dates_formats():
+    values, present = parse_dates(["20240102", "2023.12.31", "2023-02-29", "2024-02-29", "2023.12.31 현재", None])
+    assert present.tolist() == [True, True, False, True, False, False]
+    assert values[0] == np.datetime64("2024-01-02")
+    assert values[1] == np.datetime64("2023-12-31")
+
+
+def test_parse_floats():
+    values, present = parse_floats(["8.51", "-0.5", "1,234.5", "12.3%", "-", "1.2.3"])
+    assert present.tolist() == [True, True, True, True, False, False]
+    assert values[present].tolist() == pytest.approx([8.51, -0.5, 1234.5, 12.3])
+
+
+def test_explicit_types():
+    columns = to_columns({"list": [{"thstrm": "1,444"}]}, types={"thstrm": "int"})
+    assert columns["thstrm"][0] == 1444
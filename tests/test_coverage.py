@@ -0,0 +1,71 @@
+"""
+Tests for the status 013 coverage index.
+"""
+from datetime import datetime
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient, DartNoDataError
+from dart_client.coverage import CoverageIndex
+from dart_client.planner import PlannedCall, RefreshPlanner
+from dart_client.utils import KST
+
+NO_DATA = {"status": "013", "message": "조회된 데이타가 없습니다."}
+PARAMS = {"corp_code": "00000001", "bsns_year": "2019", "reprt_code": "11011"}
+
+
+def make_client(coverage, payload):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=payload)
+
+    client = DartAPIClient(api_key="test_key", coverage=coverage)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, calls
+
+
+@pytest.mark.asyncio
+async def test_known_empty_is_short_circuited(tmp_path):
+    path = tmp_path / "coverage.sqlite"
+    client, calls = make_client(CoverageIndex(path), NO_DATA)
+    async with client:
+        with pytest.raises(DartNoDataError):
+            await client.get_hyslr_sttus(**PARAMS)
+
+    restarted, calls_after_restart = make_client(CoverageIndex(path), NO_DATA)
+    async with restarted:
+        with pytest.raises(DartNoDataError):
+            await restarted.get_hyslr_sttus(**PARAMS)
+
+    assert len(calls) == 1
+    assert calls_after_restart == []
+    assert restarted.coverage.stats() == {"data": 0, "empty": 1}
+
+
+def test_open_years_expire():
+    index = CoverageIndex(recheck_after=0)
+    index.record("hyslrSttus.json", PARAMS, has_data=False)
+    current = dict(PARAMS, bsns_year=str(datetime.now(KST).year))
+    index.record("hyslrSttus.json", current, has_data=False)
+
+    assert index.lookup("hyslrSttus.json", PARAMS) is False
+    assert index.lookup("hyslrSttus.json", current) is None
+    assert index.purge_expired() == 1
+
+
+def test_key_includes_extra_params_only_for_periodic_endpoints():
+    cfs = CoverageIndex.key("fnlttSinglAcntAll.json", dict(PARAMS, fs_div="CFS", crtfc_key="x"))
+    assert cfs == ("fnlttSinglAcntAll.json", "00000001", "2019", "11011", "fs_div=CFS")
+    assert CoverageIndex.key("piicDecsn.json", {"corp_code": "1", "bgn_de": "20240101"}) is None
+
+
+def test_planner_skips_known_empty():
+    index = CoverageIndex()
+    index.record("hyslrSttus.json", PARAMS, has_data=False)
+    planner = RefreshPlanner(client=None, coverage=index)
+
+    assert planner._known_empty(PlannedCall.of("get_hyslr_sttus", **PARAMS))
+    assert not planner._known_empty(PlannedCall.of("get_mrhl_sttus", **PARAMS))
@@ -0,0 +1,71 @@
+"""
+Tests for routing disclosures to their DS005 detail endpoint.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dart_client import DartAPIClient
+from dart_client.dispatch import DS005_TITLE_ROUTES, DetailDispatcher, ReportClassifier
+from dart_client.models.disclosure import Disclosure
+
+
+def make_disclosure(report_nm, rcept_no="20240131000001", corp_code="00126380"):
+    return Disclosure(
+        corp_code=corp_code,
+        corp_name="삼성전자",
+        stock_code="005930",
+        corp_cls="Y",
+        report_nm=report_nm,
+        rcept_no=rcept_no,
+        flr_nm="삼성전자",
+        rcept_dt=rcept_no[:8],
+        rm="",
+    )
+
+
+def test_routes_cover_every_ds005_method():
+    client = DartAPIClient(api_key="test_key")
+    ds005 = [
+        name for name in dir(client)
+        if name.startswith("get_") and "Group: DS005" in (getattr(client, name).__doc__ or "")
+    ]
+    assert sorted(set(DS005_TITLE_ROUTES.values())) == sorted(ds005)
+
+
+@pytest.mark.parametrize("report_nm, method", [
+    ("주요사항보고서(유상증자결정)", "get_piic_decsn"),
+    ("주요사항보고서(유무상증자결정)", "get_pifric_decsn"),
+    ("주요사항보고서(무상증자결정)", "get_fric_decsn"),
+    ("[기재정정]주요사항보고서(자기주식취득결정)", "get_tsstk_aq_decsn"),
+    ("주요사항보고서(자기주식취득 신탁계약 체결 결정)", "get_tsstk_aq_trctr_cns_decsn"),
+    ("주요사항보고서(회사분할합병결정)", "get_cmp_dvmg_decsn"),
+    ("주요사항보고서(주식교환ㆍ이전결정)", "get_stk_extr_decsn"),
+    ("주요사항보고서(해외증권시장주권등상장폐지결정)", "get_ov_dlst_decsn"),
+    ("사업보고서 (2023.12)", None),
+])
+def test_classifier(report_nm, method):
+    assert ReportClassifier().classify(report_nm) == method
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_calls_only_matching_endpoint():
+    client = DartAPIClient(api_key="test_key")
+    client.get_piic_decsn = AsyncMock(return_value={
+        "status": "000",
+        "message": "정상",
+        "list": [
+            {"rcept_no": "20240131000001", "nstk_ostk_cnt": "1,000"},
+            {"rcept_no": "20240130000009", "nstk_ostk_cnt": "5"},
+        ],
+    })
+    dispatcher = DetailDispatcher(client, window_days=2)
+
+    results = await dispatcher.fetch_many([
+        make_disclosure("주요사항보고서(유상증자결정)", "20240131000001"),
+        make_disclosure("주요사항보고서(유상증자결정)", "20240130000009"),
+        make_disclosure("임원ㆍ주요주주특정증권등소유상황보고서"),
+    ])
+
+    client.get_piic_decsn.assert_awaited_once_with(corp_code="00126380", bgn_de="20240128", end_de="20240202")
+    assert [r.rows[0]["nstk_ostk_cnt"] for r in results] == ["1,000", "5"]
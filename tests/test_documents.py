@@ -0,0 +1,86 @@
+"""
+Tests for filing document text and table extraction.
+"""
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dart_client.documents import DocumentPipeline, iter_records, read_records
+
+REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<DOCUMENT>
+<DOCUMENT-NAME ACODE="11011">사업보고서</DOCUMENT-NAME>
+<BODY>
+<SECTION-1>
+<TITLE ATOC="Y">I. 회사의 개요</TITLE>
+<SECTION-2>
+<TITLE ATOC="Y">1. 회사의 개요</TITLE>
+<P>연결대상 종속회사는 232개입니다.</P>
+<P>당사는   1969년에 설립되었습니다.</P>
+<TABLE>
+<TBODY>
+<TR><TH>구분</TH><TH>회사수</TH></TR>
+<TR><TE>상장</TE><TE>1</TE></TR>
+<TR><TE>비상장</TE><TE>231 &amp; 기타</TE></TR>
+</TBODY>
+</TABLE>
+<P>이상입니다.<BR/>끝.</P>
+</SECTION-2>
+</SECTION-1>
+</BODY>
+</DOCUMENT>
+"""
+
+ATTACHMENT = "<html><body><h1>감사보고서</h1><p>적정 의견</p></body></html>"
+
+
+def make_archive(encoding="utf-8"):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("20240312000736.xml", REPORT.replace("utf-8", encoding).encode(encoding))
+        zf.writestr("20240312000736_00760.xml", ATTACHMENT.encode("utf-8"))
+        zf.writestr("image.jpg", b"\xff\xd8")
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "euc-kr"])
+def test_sections_and_tables(encoding):
+    records = list(iter_records(make_archive(encoding)))
+    sections = [r for kind, r in records if kind == "section"]
+    tables = [r for kind, r in records if kind == "table"]
+
+    # Text before the first section (the cover) is kept as a level-0 section
+    assert [(s["level"], s["title"]) for s in sections] == [
+        (0, ""), (1, "I. 회사의 개요"), (2, "1. 회사의 개요"), (1, "감사보고서"),
+    ]
+    assert sections[0]["text"] == "사업보고서"
+    assert sections[2]["text"] == "연결대상 종속회사는 232개입니다.\n당사는 1969년에 설립되었습니다.\n이상입니다.\n끝."
+    assert sections[3]["member"] == "20240312000736_00760.xml"
+    assert sections[3]["text"] == "적정 의견"
+    assert len(tables) == 1
+    assert tables[0]["section_index"] == 1
+    assert tables[0]["rows"] == [["구분", "회사수"], ["상장", "1"], ["비상장", "231 & 기타"]]
+
+
+def test_pipeline_writes_files(tmp_path):
+    archive_path = tmp_path / "20240312000736.zip"
+    archive_path.write_bytes(make_archive())
+    (tmp_path / "broken.zip").write_bytes(b"not a zip")
+
+    with DocumentPipeline(tmp_path / "out", max_workers=2) as pipeline:
+        results = list(pipeline.run([("20240312000736", archive_path), ("20240101000001", tmp_path / "broken.zip")]))
+
+    parsed, broken = results
+    assert (parsed.sections, parsed.tables, parsed.error) == (4, 1, None)
+    assert [r["title"] for r in read_records(parsed.sections_path)][1] == "I. 회사의 개요"
+    assert next(read_records(parsed.tables_path))["rcept_no"] == "20240312000736"
+    assert broken.error is not None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_async(tmp_path):
+    with DocumentPipeline(tmp_path, executor=ThreadPoolExecutor(2)) as pipeline:
+        results = await pipeline.run_async([("20240312000736", make_archive())])
+    assert results[0].sections == 4
@@ -0,0 +1,130 @@
+"""
+Tests for the document.xml download manager and content-addressed store.
+"""
+import io
+import zipfile
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient, DartLimitError
+from dart_client.downloads import DownloadManager
+from dart_client.store import ContentStore
+
+ARCHIVES = {
+    "20240312000001": b"PK\x03\x04first archive" * 100,
+    "20240312000002": b"PK\x03\x04second archive" * 100,
+    "20240312000003": b"PK\x03\x04first archive" * 100,  # same content as ...001
+}
+MISSING = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<result><status>014</status><message>파일이 존재하지 않습니다.</message></result>"
+).encode()
+
+
+def make_client(requests):
+    def handler(request):
+        rcept_no = request.url.params["rcept_no"]
+        requests.append((rcept_no, request.headers.get("range")))
+        body = ARCHIVES.get(rcept_no)
+        if body is None:
+            return httpx.Response(200, content=MISSING, headers={"content-type": "application/xml"})
+        headers = {"content-type": "application/zip"}
+        range_header = request.headers.get("range")
+        if range_header:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            if start >= len(body):
+                return httpx.Response(416)
+            return httpx.Response(206, content=body[start:], headers=headers)
+        return httpx.Response(200, content=body, headers=headers)
+
+    client = DartAPIClient(api_key="test_key", requests_per_minute=10_000)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_downloads_dedupes_and_skips_stored(tmp_path):
+    store = ContentStore(tmp_path)
+    requests = []
+    async with make_client(requests) as client:
+        manager = DownloadManager(client, store, concurrency=2)
+        manager.add([*ARCHIVES, "20240312999999"])
+        report = await manager.run()
+
+        assert report.downloaded == 3
+        assert report.deduplicated == 1
+        assert report.missing == ["20240312999999"]
+        assert report.failed == {}
+        assert report.bytes_downloaded == sum(map(len, ARCHIVES.values()))
+        assert report.disk_usage["refs"] == 3
+        assert report.disk_usage["objects"] == 2
+        assert store.read("20240312000003") == ARCHIVES["20240312000003"]
+        assert store.path("20240312000001") == store.path("20240312000003")
+
+        manager.add(ARCHIVES)
+        again = await manager.run()
+        assert again.skipped == 3 and again.downloaded == 0
+    assert len(requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_partial_download_is_resumed(tmp_path):
+    store = ContentStore(tmp_path)
+    rcept_no = "20240312000002"
+    store.part_path(rcept_no).write_bytes(ARCHIVES[rcept_no][:500])
+    requests = []
+    async with make_client(requests) as client:
+        report = await DownloadManager(client, store).run()
+
+    assert requests == [(rcept_no, "bytes=500-")]
+    assert report.resumed == 1
+    assert report.bytes_downloaded == len(ARCHIVES[rcept_no]) - 500
+    assert store.read(rcept_no) == ARCHIVES[rcept_no]
+    assert store.partials() == []
+
+
+def zip_archive(text):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("document.xml", text)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_complete_partial_is_committed_after_416(tmp_path, monkeypatch):
+    store = ContentStore(tmp_path)
+    complete, truncated = "20240312000004", "20240312000005"
+    monkeypatch.setitem(ARCHIVES, complete, zip_archive("complete"))
+    monkeypatch.setitem(ARCHIVES, truncated, zip_archive("truncated"))
+    store.part_path(complete).write_bytes(ARCHIVES[complete])
+    # A file of the full length that is not a valid archive is downloaded again
+    store.part_path(truncated).write_bytes(b"\0" * len(ARCHIVES[truncated]))
+    requests = []
+    async with make_client(requests) as client:
+        report = await DownloadManager(client, store).run()
+
+    assert report.failed == {} and report.downloaded == 2
+    assert store.read(complete) == ARCHIVES[complete]
+    assert store.read(truncated) == ARCHIVES[truncated]
+    assert requests[-1] == (truncated, None)
+
+
+@pytest.mark.asyncio
+async def test_limit_error_stops_the_run(tmp_path):
+    limit = '{"status": "020", "message": "요청 제한을 초과하였습니다."}'.encode()
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.params["rcept_no"])
+        return httpx.Response(200, content=limit, headers={"content-type": "application/json"})
+
+    client = DartAPIClient(api_key="test_key", requests_per_minute=10_000)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        manager = DownloadManager(client, ContentStore(tmp_path), concurrency=1)
+        manager.add(ARCHIVES)
+        with pytest.raises(DartLimitError):
+            await manager.run()
+    assert len(requests) == 1
+    assert sorted(manager.pending) == sorted(ARCHIVES)
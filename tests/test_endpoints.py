@@ -0,0 +1,78 @@
+"""
+Tests for the generated endpoint registry and the shared dispatcher behind the generated methods.
+"""
+import inspect
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient
+from dart_client.endpoints import PERIODIC_PARAMS, find_endpoints, get_endpoint
+from dart_client.generated import GeneratedDartAPIMixin
+from dart_client.generated.registry import ENDPOINTS
+from dart_client.models.company import Company
+from dart_client.models.disclosure import DisclosureList
+
+
+def test_every_generated_method_has_a_registry_entry():
+    methods = {
+        name for name, func in vars(GeneratedDartAPIMixin).items()
+        if inspect.iscoroutinefunction(func) and not name.startswith("_") and name not in ("request", "get_corp_codes")
+    }
+    assert methods == set(ENDPOINTS)
+
+    # Signatures and registry agree on the parameters
+    for method, endpoint in ENDPOINTS.items():
+        signature = inspect.signature(getattr(GeneratedDartAPIMixin, method))
+        assert tuple(signature.parameters)[1:] == endpoint.params, method
+
+
+def test_lookup_by_method_or_path():
+    assert get_endpoint("get_alot_matter") is get_endpoint("alotMatter.json")
+    assert get_endpoint("get_alot_matter").required == PERIODIC_PARAMS
+    with pytest.raises(KeyError):
+        get_endpoint("nope.json")
+
+
+def test_traits():
+    assert get_endpoint("get_list").paginated
+    assert get_endpoint("get_fnltt_multi_acnt").multi_corp
+    assert not get_endpoint("get_fnltt_multi_acnt").periodic
+    assert get_endpoint("get_api_2019003").returns_file
+    assert get_endpoint("get_fnltt_singl_acnt").periodic
+
+    ds002 = find_endpoints(group="DS002")
+    assert len(ds002) == 28 and all(e.periodic for e in ds002)
+    assert [e.method for e in find_endpoints(group="DS003", periodic=True)] == ["get_fnltt_singl_acnt"]
+    assert {e.method for e in find_endpoints(returns_file=True)} >= {"get_api_2019003", "get_api_2019018"}
+
+
+def test_build_params_keeps_declaration_order_and_drops_none():
+    endpoint = get_endpoint("get_list")
+    params = endpoint.build_params({"page_no": 2, "corp_code": "00126380", "bgn_de": None})
+    assert list(params) == ["corp_code", "page_no"]
+
+
+@pytest.mark.asyncio
+async def test_generated_methods_dispatch_through_registry():
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.path, dict(request.url.params)))
+        if request.url.path.endswith("list.json"):
+            return httpx.Response(200, json={
+                "status": "000", "message": "정상", "page_no": 1, "page_count": 10,
+                "total_count": 0, "total_page": 0, "list": [],
+            })
+        return httpx.Response(200, json={"status": "000", "message": "정상", "corp_code": "00126380"})
+
+    client = DartAPIClient(api_key="test_key")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        assert isinstance(await client.get_list(corp_code="00126380", page_count=10), DisclosureList)
+        assert isinstance(await client.get_company(corp_code="00126380"), Company)
+        data = await client.get_alot_matter(corp_code="00126380", bsns_year="2023", reprt_code="11011")
+        assert data["status"] == "000"
+
+    assert seen[0] == ("/api/list.json", {"corp_code": "00126380", "page_count": "10", "crtfc_key": "test_key"})
+    assert seen[2][0] == "/api/alotMatter.json"
@@ -0,0 +1,94 @@
+"""
+Tests for the market-wide disclosure feed.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dart_client import DartAPIClient, DisclosureFeed
+from dart_client.errors import DartNoDataError
+from dart_client.models.disclosure import DisclosureList
+
+
+def make_item(corp_code, rcept_no):
+    return {
+        "corp_code": corp_code,
+        "corp_name": f"corp-{corp_code}",
+        "stock_code": None,
+        "corp_cls": "Y",
+        "report_nm": "주요사항보고서(유상증자결정)",
+        "rcept_no": rcept_no,
+        "flr_nm": "filer",
+        "rcept_dt": rcept_no[:8],
+        "rm": "",
+    }
+
+
+def make_pages(items, page_count=2):
+    pages = [items[i:i + page_count] for i in range(0, len(items), page_count)]
+
+    async def get_list(page_no=1, **kwargs):
+        if not pages:
+            raise DartNoDataError("013", "조회된 데이타가 없습니다.")
+        return DisclosureList(
+            status="000",
+            message="정상",
+            page_no=page_no,
+            page_count=page_count,
+            total_count=len(items),
+            total_page=len(pages),
+            list=pages[page_no - 1],
+        )
+
+    return AsyncMock(side_effect=get_list)
+
+
+@pytest.fixture
+def client():
+    return DartAPIClient(api_key="test_key")
+
+
+@pytest.mark.asyncio
+async def test_poll_filters_watchlist_and_pages(client):
+    items = [
+        make_item("00000001", "20240131000001"),
+        make_item("00000002", "20240131000002"),
+        make_item("00000001", "20240131800001"),
+    ]
+    client.get_list = make_pages(items)
+    feed = DisclosureFeed(client, watchlist=["00000001"], start_date="20240131")
+
+    new = await feed.poll()
+
+    assert [d.rcept_no for d in new] == ["20240131000001", "20240131800001"]
+    assert feed.calls == 2  # independent of the watchlist size
+    assert feed.checkpoint.watermark == "20240131800001"
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resume_without_gaps_or_duplicates(client, tmp_path):
+    path = tmp_path / "feed.json"
+    first = [make_item("00000001", "20240131800001")]
+    client.get_list = make_pages(first)
+    feed = DisclosureFeed(client, watchlist=["00000001"], checkpoint_path=path, start_date="20240131")
+    assert len(await feed.poll()) == 1
+
+    # A lower receipt number of the same day arrives after the watermark
+    late = first + [make_item("00000001", "20240131000005")]
+    client.get_list = make_pages(late)
+    restarted = DisclosureFeed(client, watchlist=["00000001"], checkpoint_path=path)
+    new = await restarted.poll()
+
+    assert [d.rcept_no for d in new] == ["20240131000005"]
+    assert await restarted.poll() == []
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_poll_is_replayed(client, tmp_path):
+    path = tmp_path / "feed.json"
+    client.get_list = make_pages([make_item("00000001", "20240131000001")])
+    feed = DisclosureFeed(client, checkpoint_path=path, start_date="20240131")
+
+    assert len(await feed.poll(commit=False)) == 1
+    replay = DisclosureFeed(client, checkpoint_path=path, start_date="20240131")
+    assert len(await replay.poll()) == 1
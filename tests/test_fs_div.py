@@ -0,0 +1,77 @@
+"""
+Tests for the learned CFS/OFS resolution of fnlttSinglAcntAll.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dart_client import DartAPIClient
+from dart_client.errors import DartNoDataError
+from dart_client.fs_div import FsDivResolver
+from dart_client.models.disclosure import Disclosure
+
+
+def separate_only(endpoint, params=None):
+    if params["fs_div"] == "CFS":
+        raise DartNoDataError("013", "조회된 데이타가 없습니다.")
+    return {"status": "000", "message": "정상", "list": [{"rcept_no": "20240312000001", "fs_div": "OFS"}]}
+
+
+def consolidated_from_2023(endpoint, params=None):
+    if params["fs_div"] == "CFS" and params["bsns_year"] < "2023":
+        raise DartNoDataError("013", "조회된 데이타가 없습니다.")
+    return {"status": "000", "message": "정상", "list": [{"rcept_no": "20240312000001", "fs_div": params["fs_div"]}]}
+
+
+@pytest.mark.asyncio
+async def test_auto_learns_and_persists(tmp_path):
+    path = tmp_path / "fs_div.json"
+    client = DartAPIClient(api_key="test_key", fs_div_resolver=FsDivResolver(path))
+    client.request = AsyncMock(side_effect=separate_only)
+
+    await client.get_fnltt_singl_acnt_all("00000001", "2023", "11011")
+    assert client.request.await_count == 2
+
+    restarted = DartAPIClient(api_key="test_key", fs_div_resolver=FsDivResolver(path))
+    restarted.request = AsyncMock(side_effect=separate_only)
+    result = await restarted.get_fnltt_singl_acnt_all("00000001", "2023", "11011")
+
+    assert restarted.request.await_count == 1
+    assert result["list"][0]["fs_div"] == "OFS"
+
+
+@pytest.mark.asyncio
+async def test_learned_ofs_does_not_hide_cfs_of_other_years():
+    client = DartAPIClient(api_key="test_key")
+    client.request = AsyncMock(side_effect=consolidated_from_2023)
+
+    await client.get_fnltt_singl_acnt_all("00000001", "2022", "11011")
+    result = await client.get_fnltt_singl_acnt_all("00000001", "2023", "11011")
+
+    assert result["list"][0]["fs_div"] == "CFS"
+    assert client.fs_div_resolver.get("00000001", "2022", "11011") == "OFS"
+    assert client.fs_div_resolver.get("00000001", "2023", "11011") is None
+
+
+@pytest.mark.asyncio
+async def test_explicit_fs_div_bypasses_resolver():
+    client = DartAPIClient(api_key="test_key")
+    client.request = AsyncMock(side_effect=separate_only)
+
+    with pytest.raises(DartNoDataError):
+        await client.get_fnltt_singl_acnt_all("00000001", "2023", "11011", fs_div="CFS")
+    assert client.fs_div_resolver.get("00000001", "2023", "11011") is None
+
+
+def test_new_filing_for_period_invalidates_entry():
+    resolver = FsDivResolver()
+    resolver.learn("00000001", "2024", "11011", "OFS", "20250317000001")
+    resolver.learn("00000001", "2024", "11012", "OFS", "20240814000001")
+
+    resolver.observe(Disclosure(
+        corp_code="00000001", corp_name="corp", corp_cls="K", report_nm="[기재정정]사업보고서 (2024.12)",
+        rcept_no="20250402000001", flr_nm="corp", rcept_dt="20250402", rm="",
+    ))
+
+    assert resolver.get("00000001", "2024", "11011") is None
+    assert resolver.get("00000001", "2024", "11012") == "OFS"
@@ -0,0 +1,104 @@
+"""
+Tests for the local full-text filing index.
+"""
+import io
+import zipfile
+
+from dart_client.fulltext import FilingIndex, build_match_query, tails, tokenize
+from dart_client.models.disclosure import Disclosure
+from dart_client.store import ContentStore
+
+DOCUMENTS = {
+    "20240105000123": """<DOCUMENT><BODY><SECTION-1><TITLE>1. 발행 개요</TITLE>
+<P>제3회 무기명식 이권부 무보증 사모 전환사채를 발행합니다.</P>
+<TABLE><TR><TD>사채의 종류</TD><TD>전환사채</TD></TR><TR><TD>권면총액</TD><TD>10,000,000,000</TD></TR></TABLE>
+</SECTION-1></BODY></DOCUMENT>""",
+    "20240310000456": """<DOCUMENT><BODY><SECTION-1><TITLE>최대주주 변경</TITLE>
+<P>최대주주가 홍길동에서 (주)에이비씨로 변경되었습니다.</P>
+</SECTION-1></BODY></DOCUMENT>""",
+}
+
+
+def disclosure(rcept_no, corp_code, report_nm):
+    return Disclosure(
+        corp_code=corp_code, corp_name=f"회사{corp_code[-1]}", stock_code=None, corp_cls="K",
+        report_nm=report_nm, rcept_no=rcept_no, flr_nm="-", rcept_dt=rcept_no[:8], rm="",
+    )
+
+
+DISCLOSURES = [
+    disclosure("20240105000123", "00000001", "주요사항보고서(전환사채권발행결정)"),
+    disclosure("20240310000456", "00000002", "최대주주변경"),
+]
+
+
+def archive(text):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("document.xml", text.encode("utf-8"))
+    return buffer.getvalue()
+
+
+def build_index():
+    index = FilingIndex()
+    index.add_disclosures(DISCLOSURES)
+    for rcept_no, text in DOCUMENTS.items():
+        index.index_archive(rcept_no, archive(text))
+    return index
+
+
+def test_bigram_tokens_and_query():
+    assert tokenize("전환사채 CB발행") == "전환 환사 사채 cb 발행"
+    assert build_match_query("최대주주 변경") == '"최대 대주 주주" AND "변경"'
+    assert build_match_query("주") == '"주"*'
+    assert tails("전환사채 CB발행 및") == "채 행"
+
+
+def test_single_syllable_matches_at_any_position():
+    index = build_index()
+    # "액" only ends a word ("권면총액"), so no bigram starts with it
+    hits = index.search("액")
+    assert [(hit.rcept_no, hit.kind) for hit in hits] == [("20240105000123", "table")]
+
+
+def test_search_joins_disclosure_metadata():
+    index = build_index()
+
+    hits = index.search("전환사채")
+    assert {hit.rcept_no for hit in hits} == {"20240105000123"}
+    assert {hit.kind for hit in hits} == {"section", "table"}
+    section = next(hit for hit in hits if hit.kind == "section")
+    assert section.corp_code == "00000001"
+    assert section.rcept_dt == "20240105"
+    assert section.report_nm == "주요사항보고서(전환사채권발행결정)"
+    assert "전환사채" in section.snippet
+
+    # Compound terms match inside longer words, all terms must match
+    assert [hit.rcept_no for hit in index.search("최대주주 변경")] == ["20240310000456"]
+    assert index.search("최대주주 전환사채") == []
+    assert index.search("사채", bgn_de="20240201") == []
+    assert index.search("변경", corp_code="00000001") == []
+    assert len(index.search("주주", report_nm="최대주주")) == 1
+
+
+def test_reindexing_replaces_chunks():
+    index = build_index()
+    before = index.stats()
+    index.index_archive("20240310000456", archive(DOCUMENTS["20240310000456"]))
+    assert index.stats() == before == {"filings": 2, "chunks": 3}
+
+
+def test_update_from_store_is_incremental(tmp_path):
+    store = ContentStore(tmp_path / "store")
+    for rcept_no, text in DOCUMENTS.items():
+        store.part_path(rcept_no).write_bytes(archive(text))
+        store.commit(rcept_no)
+
+    index = FilingIndex(tmp_path / "index.sqlite")
+    assert index.update_from_store(store, DISCLOSURES) == 2
+    assert index.update_from_store(store) == 0
+    index.close()
+
+    reopened = FilingIndex(tmp_path / "index.sqlite")
+    assert reopened.search("전환사채")[0].corp_name == "회사1"
+
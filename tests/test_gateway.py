@@ -0,0 +1,112 @@
+"""
+Tests for the local DART gateway: key handling, caching, coalescing and pass-through of errors.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient, DartLimitError, DartNoDataError, SyncDartAPIClient
+from dart_client.gateway import DartGateway, GatewayResponse, ResponseCache
+
+NO_DATA = {"status": "013", "message": "조회된 데이타가 없습니다."}
+LIMIT = {"status": "020", "message": "요청 제한을 초과하였습니다."}
+
+
+def make_gateway(upstream, **kwargs) -> DartGateway:
+    gateway = DartGateway(api_key="gateway_key", requests_per_minute=10_000, **kwargs)
+    gateway.client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    return gateway
+
+
+def company_upstream(seen, delay=0.0):
+    async def handler(request):
+        seen.append(dict(request.url.params))
+        await asyncio.sleep(delay)
+        corp_code = request.url.params["corp_code"]
+        if corp_code == "99999999":
+            return httpx.Response(200, json=NO_DATA)
+        if corp_code == "00000020":
+            return httpx.Response(200, json=LIMIT)
+        return httpx.Response(200, json={"status": "000", "message": "정상", "corp_code": corp_code})
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_clients_behind_gateway_share_its_key_and_cache():
+    seen = []
+    async with make_gateway(company_upstream(seen)) as gateway:
+        await gateway.start(port=0)
+        # Callers need no key of their own, and a key they send is replaced
+        first = DartAPIClient(base_url=gateway.url)
+        second = DartAPIClient(api_key="other", base_url=gateway.url)
+        async with first, second:
+            assert (await first.get_company(corp_code="00126380")).corp_code == "00126380"
+            assert (await second.get_company(corp_code="00126380")).corp_code == "00126380"
+
+            # No data is cached too, rate-limit answers are not
+            for _ in range(2):
+                with pytest.raises(DartNoDataError):
+                    await first.get_company(corp_code="99999999")
+                with pytest.raises(DartLimitError):
+                    await second.get_company(corp_code="00000020")
+
+    assert [params["crtfc_key"] for params in seen] == ["gateway_key"] * 4
+    assert gateway.stats.requests == 6 and gateway.stats.cache_hits == 2 and gateway.stats.upstream_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_in_flight_are_coalesced():
+    seen = []
+    async with make_gateway(company_upstream(seen, delay=0.05), cache=ResponseCache(ttl=0)) as gateway:
+        await gateway.start(port=0)
+        async with httpx.AsyncClient(base_url=gateway.url) as http:
+            responses = await asyncio.gather(
+                *(http.get("/company.json", params={"corp_code": "00126380", "crtfc_key": f"k{i}"}) for i in range(10))
+            )
+    assert len(seen) == 1
+    assert {r.json()["corp_code"] for r in responses} == {"00126380"}
+    assert sorted(r.headers["x-gateway-cache"] for r in responses) == ["COALESCED"] * 9 + ["MISS"]
+    assert gateway.stats.coalesced == 9
+
+
+@pytest.mark.asyncio
+async def test_files_errors_and_stats():
+    def upstream(request):
+        if request.url.path.endswith("document.xml"):
+            return httpx.Response(200, content=b"PK\x03\x04", headers={"content-type": "application/zip"})
+        raise httpx.ConnectError("unreachable")
+
+    async with make_gateway(upstream) as gateway:
+        await gateway.start(port=0)
+        async with httpx.AsyncClient(base_url=gateway.url.removesuffix("/api")) as http:
+            document = await http.get("/api/document.xml", params={"rcept_no": "20240312000001"})
+            assert document.content == b"PK\x03\x04" and document.headers["content-type"] == "application/zip"
+            again = await http.get("/api/document.xml", params={"rcept_no": "20240312000001"})
+            assert again.headers["x-gateway-cache"] == "HIT"
+            assert (await http.get("/api/company.json", params={"corp_code": "1"})).status_code == 502
+            assert (await http.get("/other")).status_code == 404
+            assert (await http.post("/api/company.json")).status_code == 405
+            stats = (await http.get("/_gateway/stats")).json()
+    assert stats["upstream_calls"] == 2 and stats["upstream_errors"] == 1 and stats["cache_entries"] == 1
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_bytes=10)
+    for key in ("a", "b", "c"):
+        cache.put((key, ()), GatewayResponse(200, (), b"1234"))
+    assert cache.get(("a", ())) is None and cache.get(("c", ())) is not None and cache.size == 8
+
+
+@pytest.mark.asyncio
+async def test_sync_client_behind_gateway():
+    seen = []
+    async with make_gateway(company_upstream(seen)) as gateway:
+        await gateway.start(port=0)
+
+        def fetch():
+            with SyncDartAPIClient(base_url=gateway.url) as client:
+                return client.get_company(corp_code="00126380").corp_code
+
+        assert await asyncio.to_thread(fetch) == "00126380"
+    assert seen[0]["crtfc_key"] == "gateway_key"
@@ -0,0 +1,66 @@
+"""
+Tests for stride-planned historical financials.
+"""
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dart_client import DartAPIClient, DartNoDataError
+from dart_client.history import HistoricalFinancials, plan_years
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(filename):
+    with open(FIXTURES_DIR / filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_reports(available):
+    """Serve the 2023 fixture for every available year, shifting amounts so each year is recognizable."""
+    rows = load_fixture("financials.json")["list"]
+
+    async def get_fnltt_singl_acnt(corp_code, bsns_year, reprt_code):
+        if int(bsns_year) not in available:
+            raise DartNoDataError("013", "조회된 데이타가 없습니다.")
+        shifted = [dict(row, bsns_year=bsns_year) for row in rows]
+        return {"status": "000", "message": "정상", "list": shifted}
+
+    return AsyncMock(side_effect=get_fnltt_singl_acnt)
+
+
+def test_plan_years_covers_range_with_a_third_of_the_calls():
+    assert plan_years(2014, 2023) == [2023, 2020, 2017, 2014]
+
+
+@pytest.mark.asyncio
+async def test_ten_years_in_four_calls():
+    client = DartAPIClient(api_key="test_key")
+    client.get_fnltt_singl_acnt = make_reports(set(range(2010, 2024)))
+    fetcher = HistoricalFinancials(client, method="get_fnltt_singl_acnt", fs_div="CFS")
+
+    history = await fetcher.fetch("00126380", 2014, 2023)
+
+    assert history.calls == 4
+    assert history.naive_calls == 10
+    assert history.missing_years == []
+    revenue = history.account(("IS", "매출액"))
+    assert revenue[2023] == 258_935_494_000_000
+    assert revenue[2022] == 302_231_360_000_000
+    assert revenue[2021] == 279_604_799_000_000
+    assert history.sources[2022] == 2023
+
+
+@pytest.mark.asyncio
+async def test_missing_report_is_filled_from_newer_one():
+    client = DartAPIClient(api_key="test_key")
+    client.get_fnltt_singl_acnt = make_reports(set(range(2010, 2024)) - {2020})
+    fetcher = HistoricalFinancials(client, method="get_fnltt_singl_acnt", fs_div="OFS")
+
+    history = await fetcher.fetch("00126380", 2014, 2023)
+
+    assert history.missing_years == []
+    assert history.requested_years == [2023, 2020, 2017, 2014, 2021, 2018]
+    assert history.account(("IS", "영업이익"))[2023] == -11_526_297_000_000
@@ -0,0 +1,98 @@
+"""
+Tests for the local financial indicator engine, using the captured statements fixture.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dart_client.indicators import (  # noqa: E402
+    GROWTH,
+    compare_with_api,
+    compute_indicators,
+    extract_accounts,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Samsung Electronics FY2023, in millions of KRW, from tests/fixtures/financials.json
+CFS = {
+    "revenue": (258_935_494, 302_231_360),
+    "operating_income": (6_566_976, 43_376_630),
+    "net_income": (15_487_100, 55_654_077),
+    "total_assets": (455_905_980, 448_424_507),
+    "total_liabilities": (92_228_115, 93_674_903),
+    "current_assets": (195_936_557, 218_470_581),
+    "current_liabilities": (75_719_452, 78_344_852),
+    "total_equity": (363_677_865, 354_749_604),
+}
+
+
+def load_fixture(filename):
+    with open(FIXTURES_DIR / filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def second_company(response):
+    """Same statements under another corp_code with halved equity, to check per-company alignment."""
+    rows = []
+    for row in response["list"]:
+        row = dict(row, corp_code="00000002")
+        if row["account_nm"] == "자본총계":
+            row["thstrm_amount"] = "181,838,932,500,000"
+        rows.append(row)
+    return {"status": "000", "message": "정상", "list": rows}
+
+
+@pytest.fixture
+def table():
+    response = load_fixture("financials.json")
+    return compute_indicators(extract_accounts([response, second_company(response)], fs_div="CFS"))
+
+
+def test_matches_hand_computed_values(table):
+    cur = {k: v[0] for k, v in CFS.items()}
+    prev = {k: v[1] for k, v in CFS.items()}
+
+    expected = {
+        "영업이익률": cur["operating_income"] / cur["revenue"] * 100,
+        "순이익률": cur["net_income"] / cur["revenue"] * 100,
+        "부채비율": cur["total_liabilities"] / cur["total_equity"] * 100,
+        "유동비율": cur["current_assets"] / cur["current_liabilities"] * 100,
+        "자기자본비율": cur["total_equity"] / cur["total_assets"] * 100,
+        "ROE": cur["net_income"] / ((cur["total_equity"] + prev["total_equity"]) / 2) * 100,
+        "매출액증가율(YoY)": (cur["revenue"] / prev["revenue"] - 1) * 100,
+        "총자산회전율": cur["revenue"] / ((cur["total_assets"] + prev["total_assets"]) / 2),
+    }
+    for idx_nm, value in expected.items():
+        assert table.get("00126380", idx_nm) == pytest.approx(value), idx_nm
+
+
+def test_companies_are_computed_independently(table):
+    assert table.get("00000002", "부채비율") == pytest.approx(2 * table.get("00126380", "부채비율"))
+    # 매출총이익 and 재고자산 are not in the main-accounts fixture
+    assert table.get("00126380", "매출총이익률") is None
+
+
+def test_fs_div_selection():
+    response = load_fixture("financials.json")
+    ofs = compute_indicators(extract_accounts([response], fs_div="OFS"))
+    assert ofs.get("00126380", "영업이익률") == pytest.approx(-11_526_297 / 170_374_090 * 100)
+
+
+def test_group_filter():
+    growth = compute_indicators(extract_accounts([load_fixture("financials.json")]), idx_cl_codes=[GROWTH])
+    assert set(growth.idx_cl_codes.values()) == {GROWTH}
+
+
+def test_matches_fnltt_singl_indx(table):
+    """The same report's fnlttSinglIndx responses (tests/fixtures/indicators.json) agree within tolerance."""
+    api_rows = [row for response in load_fixture("indicators.json").values() for row in response["list"]]
+    computed = [row for row in api_rows if row["idx_val"] is not None and row["idx_nm"] in table.values]
+    assert len(computed) == 9
+
+    assert compare_with_api(table, api_rows) == []
+    wrong = [dict(computed[0], idx_val="999.99")]
+    assert compare_with_api(table, wrong)[0]["idx_nm"] == computed[0]["idx_nm"]
@@ -0,0 +1,56 @@
+"""
+Tests for pooled string decoding of JSON responses.
+"""
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient
+from dart_client.interning import StringPool
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture_bytes(filename):
+    return (FIXTURES_DIR / filename).read_bytes()
+
+
+def test_repeated_values_share_one_object():
+    pool = StringPool()
+    first = pool.loads(load_fixture_bytes("financials.json"))
+    second = pool.loads(load_fixture_bytes("financials.json"))
+
+    assert first == json.loads(load_fixture_bytes("financials.json"))
+    rows = first["list"] + second["list"]
+    assert len({id(row["corp_code"]) for row in rows}) == 1
+    assert len({id(row["sj_nm"]) for row in rows}) == len({row["sj_nm"] for row in rows})
+    # Amounts are not pooled
+    assert "195,936,557,000,000" not in pool.pool
+    assert pool.hits > 0
+
+
+def test_custom_fields_and_max_size():
+    pool = StringPool(fields=["nm"], max_size=1)
+    data = pool.loads(json.dumps({"list": [{"nm": "a", "rm": "-"}, {"nm": "b", "rm": "-"}, {"nm": "a", "rm": "-"}]}))
+    assert list(pool.pool) == ["a"]
+    assert data["list"][0]["nm"] is data["list"][2]["nm"]
+    pool.clear()
+    assert len(pool) == 0 and pool.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_client_decodes_through_pool():
+    payload = load_fixture_bytes("ownership.json")
+    pool = StringPool()
+    client = DartAPIClient(api_key="test_key", string_pool=pool)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=payload, headers={"content-type": "application/json"})
+    ))
+    async with client:
+        first = await client.get_hyslr_sttus(corp_code="00126380", bsns_year="2023", reprt_code="11011")
+        second = await client.get_hyslr_sttus(corp_code="00126380", bsns_year="2023", reprt_code="11011")
+
+    assert first["list"][0]["corp_name"] == "삼성전자"
+    assert first["list"][0]["corp_name"] is second["list"][5]["corp_name"]
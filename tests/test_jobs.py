@@ -0,0 +1,203 @@
+"""
+Tests for the sqlite-journaled backfill job engine.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient, DartLimitError
+from dart_client.jobs import BackfillJob
+from dart_client.limiter import SharedRateLimiter
+
+NO_DATA = {"status": "013", "message": "조회된 데이타가 없습니다."}
+LIMIT = {"status": "020", "message": "요청 제한을 초과하였습니다."}
+
+
+def make_client(handler):
+    client = DartAPIClient(api_key="test_key", requests_per_minute=10_000)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def dividend_handler(seen, fail=()):
+    def handler(request):
+        params = request.url.params
+        key = (params["corp_code"], params["bsns_year"], params["reprt_code"])
+        seen.append(key)
+        if key in fail:
+            return httpx.Response(500)
+        if params["reprt_code"] != "11011":
+            return httpx.Response(200, json=NO_DATA)
+        return httpx.Response(200, json={"status": "000", "message": "정상", "list": [{"stlm_dt": key[1]}]})
+    return handler
+
+
+def test_add_matrix_expands_and_deduplicates():
+    job = BackfillJob(client=None)
+    added = job.add_matrix(["00000001", "00000002"], [2022, 2023], methods=["get_alot_matter", "get_emp_sttus"])
+    assert added == 2 * 2 * 4 * 2
+    assert job.add_matrix(["00000001"], [2023], methods=["get_alot_matter"]) == 0
+    assert job.progress().pending == 32
+
+    # Extra parameters only go to the methods that take them
+    job.add_matrix(["00000001"], [2023], ["11011"], ["get_alot_matter", "get_fnltt_singl_indx"], idx_cl_code="M210000")
+    with pytest.raises(ValueError, match="idx_cl_code"):
+        job.add_matrix(["00000001"], [2023], methods=["get_fnltt_singl_indx"])
+
+
+@pytest.mark.asyncio
+async def test_run_records_outcomes_and_resumes(tmp_path):
+    path = tmp_path / "backfill.db"
+    corp_codes = ["00000001", "00000002", "00000003"]
+    failing = {("00000002", "2023", "11011")}
+    seen = []
+    async with make_client(dividend_handler(seen, failing)) as client:
+        job = BackfillJob(client, path, concurrency=3, max_attempts=2)
+        job.add_matrix(corp_codes, [2022, 2023], methods=["get_alot_matter"])
+
+        snapshots = []
+        progress = await job.run(on_progress=lambda p: snapshots.append(p.eta), limit=10)
+        assert progress.finished_this_run == 10
+        assert len(seen) == 10
+        job.close()
+
+    # A new process picks up where the first stopped
+    seen.clear()
+    async with make_client(dividend_handler(seen, failing)) as client:
+        job = BackfillJob(client, path, concurrency=3, max_attempts=2)
+        progress = await job.run()
+        assert len(seen) == 24 - 10
+        assert progress.data == 5 and progress.empty == 18
+        assert progress.pending == 1 and progress.errors == 0  # one attempt left
+
+        # The failed call is retried by the next run, and its error is final after max_attempts
+        seen.clear()
+        progress = await job.run()
+        assert seen == list(failing)
+        assert progress.pending == 0 and progress.errors == 1
+        assert list(job.failures().values())[0]
+
+        results = dict(job.results())
+        assert len(results) == 5
+        assert all(data["list"][0]["stlm_dt"] == call.kwargs["bsns_year"] for call, data in results.items())
+        job.close()
+    assert snapshots[-1] is not None
+
+
+@pytest.mark.asyncio
+async def test_quota_error_stops_run_and_keeps_items_pending():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json=LIMIT if calls > 3 else NO_DATA)
+
+    async with make_client(handler) as client:
+        job = BackfillJob(client, concurrency=1)
+        job.add_matrix(["00000001"], [2021, 2022, 2023], methods=["get_alot_matter"])
+        with pytest.raises(DartLimitError):
+            await job.run()
+        progress = job.progress()
+        assert progress.empty == 3 and progress.pending == 9
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    in_flight = peak = 0
+
+    async def get_alot_matter(**params):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return {"status": "000"}
+
+    class Client:
+        pass
+
+    client = Client()
+    client.get_alot_matter = get_alot_matter
+    job = BackfillJob(client, concurrency=3, store_results=False)
+    job.add_matrix([f"{i:08d}" for i in range(10)], [2023], methods=["get_alot_matter"])
+    progress = await job.run()
+    assert progress.data == 40 and peak == 3
+    assert all(data is None for _, data in job.results())
+
+
+class CountingClient:
+    """Stands in for DartAPIClient; records how often each call was made."""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def get_alot_matter(self, **params):
+        await asyncio.sleep(0.001)
+        key = (params["corp_code"], params["reprt_code"])
+        self.calls[key] = self.calls.get(key, 0) + 1
+        return {"status": "000"}
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_a_journal_run_each_call_once(tmp_path):
+    path = tmp_path / "shared.db"
+    BackfillJob(None, path).add_matrix([f"{i:08d}" for i in range(25)], [2023], methods=["get_alot_matter"])
+
+    calls = {}
+    workers = [BackfillJob(CountingClient(calls), path, concurrency=3, worker_id=f"w{i}") for i in range(3)]
+    await asyncio.gather(*(worker.run() for worker in workers))
+    assert len(calls) == 100 and set(calls.values()) == {1}
+    assert workers[0].progress().data == 100
+
+
+@pytest.mark.asyncio
+async def test_lease_of_dead_worker_is_taken_over(tmp_path):
+    path = tmp_path / "shared.db"
+    dead = BackfillJob(None, path, worker_id="dead", lease_seconds=0.2)
+    dead.add_matrix(["00000001"], [2023], methods=["get_alot_matter"])
+    # The dead worker leased two calls and never finished them
+    assert dead._lease(run_started=0) and dead._lease(run_started=0)
+
+    calls = {}
+    alive = BackfillJob(CountingClient(calls), path, worker_id="alive")
+    assert (await alive.run()).pending == 2
+    await asyncio.sleep(0.25)
+    assert (await alive.run()).pending == 0
+    assert len(calls) == 4 and set(calls.values()) == {1}
+
+
+def test_shared_rate_limiter_budget_spans_instances(tmp_path):
+    first = SharedRateLimiter(tmp_path / "budget.db", max_rate=5, time_period=60)
+    second = SharedRateLimiter(tmp_path / "budget.db", max_rate=5, time_period=60)
+    for _ in range(3):
+        first.acquire()
+    for _ in range(2):
+        second.acquire()
+    assert not first.has_capacity() and not second.has_capacity()
+    # The next acquisition, from either instance, waits for the bucket to drain
+    assert second._reserve(1) == pytest.approx(12, abs=0.1)
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_running_worker_renews_its_leases(tmp_path):
+    path = tmp_path / "shared.db"
+    calls = {}
+
+    class SlowClient(CountingClient):
+        async def get_alot_matter(self, **params):
+            await asyncio.sleep(0.5)
+            return await super().get_alot_matter(**params)
+
+    slow = BackfillJob(SlowClient(calls), path, concurrency=1, worker_id="slow", lease_seconds=0.2)
+    slow.add_matrix(["00000001"], [2023], ["11011"], methods=["get_alot_matter"])
+    running = asyncio.ensure_future(slow.run())
+    await asyncio.sleep(0.35)
+    # The call outlives its first lease, but the renewed lease keeps it away from other workers
+    other = BackfillJob(CountingClient(calls), path, worker_id="other", lease_seconds=0.2)
+    assert (await other.run()).pending == 1
+    assert (await running).pending == 0
+    assert calls == {("00000001", "11011"): 1}
@@ -0,0 +1,44 @@
+"""
+Tests that importing dart_client stays cheap: heavy dependencies load on first use.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import dart_client
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+
+def imported_modules(statement: str) -> set[str]:
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    env = {**os.environ, "PYTHONPATH": SRC + os.pathsep + os.environ.get("PYTHONPATH", "")}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return set(result.stdout.split())
+
+
+def test_import_does_not_load_http_or_models():
+    modules = imported_modules("import dart_client")
+    assert not {"httpx", "pydantic", "xmltodict", "aiolimiter", "dart_client.client"} & modules
+
+
+def test_client_import_does_not_load_models_or_xml():
+    modules = imported_modules("from dart_client import DartAPIClient, SyncDartAPIClient")
+    assert "httpx" in modules
+    assert not {"pydantic", "xmltodict", "dart_client.generated.models"} & modules
+
+
+def test_fulltext_import_does_not_load_models():
+    assert "pydantic" not in imported_modules("import dart_client.fulltext")
+
+
+def test_lazy_attributes():
+    from dart_client.client import DartAPIClient
+
+    assert dart_client.DartAPIClient is DartAPIClient
+    assert {"DartAPIClient", "SyncDartAPIClient", "DisclosureFeed"} <= set(dir(dart_client))
+    with pytest.raises(AttributeError):
+        _ = dart_client.NoSuchThing
@@ -0,0 +1,112 @@
+"""
+Tests for decoding large responses off the event loop.
+"""
+import io
+import pickle
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient, DartLimitError, DartNoDataError
+from dart_client.client import _parse_corp_codes
+from dart_client.interning import StringPool
+
+
+def corp_code_zip(companies: int) -> bytes:
+    rows = "".join(
+        f"<list><corp_code>{i:08d}</corp_code><corp_name>회사{i}</corp_name>"
+        f"<stock_code> </stock_code><modify_date>20240101</modify_date></list>"
+        for i in range(companies)
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("CORPCODE.xml", f'<?xml version="1.0" encoding="UTF-8"?><result>{rows}</result>'.encode())
+    return buffer.getvalue()
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.calls = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.calls += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def make_client(body: bytes, content_type: str, **kwargs) -> DartAPIClient:
+    def handler(request):
+        return httpx.Response(200, content=body, headers={"content-type": content_type})
+
+    client = DartAPIClient(api_key="test_key", **kwargs)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_parse_corp_codes_is_picklable():
+    assert pickle.loads(pickle.dumps(_parse_corp_codes)) is _parse_corp_codes
+    codes = _parse_corp_codes(corp_code_zip(2))
+    assert [c.corp_code for c in codes] == ["00000000", "00000001"]
+    assert codes[1].corp_name == "회사1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold, offloaded", [(None, False), (10**9, False), (0, True)])
+async def test_corp_code_offload_threshold(threshold, offloaded):
+    with CountingExecutor() as executor:
+        async with make_client(
+            corp_code_zip(50), "application/zip", executor=executor, offload_threshold=threshold
+        ) as client:
+            codes = await client.get_corp_code()
+    assert len(codes) == 50
+    assert executor.calls == (1 if offloaded else 0)
+
+
+@pytest.mark.asyncio
+async def test_offloaded_corp_code_error_raises():
+    body = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<result><status>020</status><message>요청 제한을 초과하였습니다.</message></result>"
+    ).encode()
+    with CountingExecutor() as executor:
+        async with make_client(body, "application/zip", executor=executor, offload_threshold=0) as client:
+            with pytest.raises(DartLimitError):
+                await client.get_corp_code()
+    assert executor.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_decoded_in_executor():
+    body = b'{"status": "000", "message": "OK", "list": [{"rcept_no": "20240312000001"}]}'
+    with CountingExecutor() as executor:
+        async with make_client(body, "application/json", executor=executor, offload_threshold=len(body)) as client:
+            data = await client.request("list.json", {})
+        assert data["list"][0]["rcept_no"] == "20240312000001"
+        assert executor.calls == 1
+
+        async with make_client(body, "application/json", executor=executor, offload_threshold=len(body) + 1) as client:
+            await client.request("list.json", {})
+        assert executor.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_decoding_keeps_status_checks_and_interning():
+    body = b'{"status": "000", "message": "OK", "list": [{"corp_name": "A"}, {"corp_name": "A"}]}'
+    no_data = '{"status": "013", "message": "조회된 데이타가 없습니다."}'.encode()
+    pool = StringPool()
+    with ProcessPoolExecutor(1) as executor:
+        async with make_client(body, "application/json", executor=executor, offload_threshold=0) as client:
+            data = await client.request("list.json", {})
+        assert isinstance(data, dict) and data["list"][0]["corp_name"] == "A"
+
+        async with make_client(
+            body, "application/json", executor=executor, offload_threshold=0, string_pool=pool
+        ) as client:
+            rows = (await client.request("list.json", {}))["list"]
+        assert rows[0]["corp_name"] is rows[1]["corp_name"] and pool.hits == 1
+
+        async with make_client(no_data, "application/json", executor=executor, offload_threshold=0) as client:
+            with pytest.raises(DartNoDataError):
+                await client.get_alot_matter(corp_code="00126380", bsns_year="2023", reprt_code="11011")
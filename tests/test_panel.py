@@ -0,0 +1,88 @@
+"""
+Tests for the columnar financial panel builder.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dart_client.panel import build_panel, parse_amounts  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(filename):
+    with open(FIXTURES_DIR / filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_parse_amounts():
+    values, present = parse_amounts(["195,936,557,000,000", "-1,234", "-", "", None, " 7 ", "1-2"])
+    assert present.tolist() == [True, True, False, False, False, True, False]
+    assert values.dtype == np.int64
+    assert values[present].tolist() == [195_936_557_000_000, -1234, 7]
+
+
+def test_parse_amounts_empty():
+    values, present = parse_amounts([])
+    assert values.shape == present.shape == (0,)
+
+
+def test_build_panel_aligns_companies_and_periods():
+    response = load_fixture("financials.json")
+    other = {"list": [dict(row, corp_code="00000002", bsns_year="2022") for row in response["list"][:3]]}
+
+    panel = build_panel([response, other], fs_div="CFS")
+
+    assert panel.corp_codes == ["00126380", "00000002"]
+    assert panel.periods == [("2023", "11011"), ("2022", "11011")]
+    assert panel.values.shape == panel.present.shape == panel.shape
+    current_assets = ("BS", "유동자산")
+    assert panel.get("00126380", ("2023", "11011"), current_assets) == 195_936_557_000_000
+    assert panel.get("00000002", ("2022", "11011"), current_assets) == 195_936_557_000_000
+    # Cells nobody reported stay missing rather than becoming 0
+    assert panel.get("00126380", ("2022", "11011"), current_assets) is None
+    assert panel.account(current_assets).count() == 2
+    # Other companies only cover 3 accounts
+    assert panel.present[1].sum() == 3
+
+
+def test_build_panel_filters():
+    response = load_fixture("financials.json")
+    panel = build_panel([response], column="frmtrm_amount", fs_div="OFS", sj_divs=["IS"])
+    assert {sj_div for sj_div, _ in panel.accounts} == {"IS"}
+    expected = [row for row in response["list"] if row["fs_div"] == "OFS" and row["sj_div"] == "IS"]
+    assert panel.shape == (1, 1, len(expected))
+    assert panel.present.all()
+
+
+def test_to_arrow_roundtrip():
+    pytest.importorskip("pyarrow")
+    panel = build_panel([load_fixture("financials.json")], fs_div="CFS")
+    table = panel.to_arrow()
+    assert table.num_rows == int(panel.present.sum())
+    assert table.column("amount").type.bit_width == 64
+
+
+def test_build_panel_rejects_duplicate_accounts():
+    def row(sj_div, account_id, amount):
+        return {"corp_code": "00000001", "bsns_year": "2023", "reprt_code": "11011", "fs_div": "CFS",
+                "sj_div": sj_div, "account_id": account_id, "account_nm": account_id, "thstrm_amount": amount}
+
+    # The statement of changes in equity repeats account_ids, one row per equity component
+    response = {"list": [
+        row("BS", "ifrs-full_Equity", "1,000"),
+        row("SCE", "ifrs-full_ProfitLoss", "300"),
+        row("SCE", "ifrs-full_ProfitLoss", "-"),
+    ]}
+
+    panel = build_panel([response])
+    assert panel.accounts == [("BS", "ifrs-full_Equity")]
+
+    with pytest.raises(ValueError, match="ifrs-full_ProfitLoss"):
+        build_panel([response], sj_divs=None)
+    # CFS and OFS rows of one response share their keys
+    with pytest.raises(ValueError, match="유동자산"):
+        build_panel([load_fixture("financials.json")])
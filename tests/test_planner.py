@@ -0,0 +1,137 @@
+"""
+Tests for the filing-driven refresh planner.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dart_client import DartAPIClient, DartAPIError, DartLimitError, DartNoDataError
+from dart_client.models.disclosure import DisclosureList
+from dart_client.planner import DS002_METHODS, PlannedCall, QueryPlan, RefreshPlanner, parse_periodic_report
+
+
+def make_item(corp_code, report_nm, rcept_no):
+    return {
+        "corp_code": corp_code,
+        "corp_name": f"corp-{corp_code}",
+        "stock_code": None,
+        "corp_cls": "Y",
+        "report_nm": report_nm,
+        "rcept_no": rcept_no,
+        "flr_nm": "filer",
+        "rcept_dt": rcept_no[:8],
+        "rm": "",
+    }
+
+
+FILINGS = {
+    "A001": [
+        make_item("00000001", "사업보고서 (2023.12)", "20240312000001"),
+        make_item("00000001", "[기재정정]사업보고서 (2023.12)", "20240315000001"),
+    ],
+    "A003": [make_item("00000002", "분기보고서 (2023.09)", "20240314000002")],
+    "B001": [make_item("00000003", "주요사항보고서(유상증자결정)", "20240313000003")],
+}
+
+
+async def get_list(pblntf_detail_ty=None, page_no=1, **kwargs):
+    items = FILINGS.get(pblntf_detail_ty, [])
+    return DisclosureList(
+        status="000", message="정상", page_no=1, page_count=100,
+        total_count=len(items), total_page=1, list=items,
+    )
+
+
+@pytest.mark.parametrize("report_nm, detail_ty, acc_mt, expected", [
+    ("사업보고서 (2023.12)", "A001", 12, ("2023", "11011")),
+    ("반기보고서 (2024.06)", "A002", 12, ("2024", "11012")),
+    ("분기보고서 (2024.03)", "A003", 12, ("2024", "11013")),
+    ("분기보고서 (2024.09)", "A003", 12, ("2024", "11014")),
+    ("분기보고서 (2024.09)", "A003", 6, ("2024", "11013")),
+    ("주요사항보고서(유상증자결정)", "B001", 12, None),
+])
+def test_parse_periodic_report(report_nm, detail_ty, acc_mt, expected):
+    assert parse_periodic_report(report_nm, detail_ty, acc_mt) == expected
+
+
+@pytest.mark.asyncio
+async def test_plan_only_schedules_filers():
+    client = DartAPIClient(api_key="test_key")
+    client.get_list = AsyncMock(side_effect=get_list)
+    planner = RefreshPlanner(client, periodic_methods=DS002_METHODS)
+
+    plan = await planner.plan("20240311", "20240315", universe_size=2000)
+
+    # The corrected annual report does not schedule a second round of calls
+    assert len(plan.calls) == 2 * len(DS002_METHODS) + 1
+    assert PlannedCall.of(
+        "get_piic_decsn", corp_code="00000003", bgn_de="20240312", end_de="20240314"
+    ) in plan.calls
+    assert PlannedCall.of(
+        "get_hyslr_sttus", corp_code="00000002", bsns_year="2023", reprt_code="11014"
+    ) in plan.calls
+    assert plan.list_calls == 4
+    assert plan.brute_force_calls == 2000 * (len(DS002_METHODS) + 36)
+    assert plan.planned_calls < plan.brute_force_calls
+
+
+@pytest.mark.asyncio
+async def test_summary_without_universe_has_no_comparison():
+    client = DartAPIClient(api_key="test_key")
+    client.get_list = AsyncMock(side_effect=get_list)
+    plan = await RefreshPlanner(client, periodic_methods=DS002_METHODS).plan("20240311", "20240315")
+
+    assert plan.brute_force_calls is None
+    assert "brute-force" not in plan.summary()
+
+
+@pytest.mark.asyncio
+async def test_execute_bounds_concurrency_and_collects_failures():
+    in_flight = peak = 0
+
+    async def get_alot_matter(corp_code, **params):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        if corp_code == "00000003":
+            raise DartNoDataError("013", "조회된 데이타가 없습니다.")
+        if corp_code == "00000005":
+            raise DartAPIError("800", "시스템 점검")
+        return {"corp_code": corp_code}
+
+    class Client:
+        pass
+
+    client = Client()
+    client.get_alot_matter = get_alot_matter
+    calls = [PlannedCall.of("get_alot_matter", corp_code=f"{i:08d}") for i in range(20)]
+    execution = await RefreshPlanner(client).execute(QueryPlan("20240311", "20240315", calls), concurrency=3)
+
+    assert peak == 3
+    assert [call for call, _ in execution.results] == [c for c in calls if c.kwargs["corp_code"] != "00000005"]
+    assert dict(execution.results)[calls[3]] is None
+    assert execution.failed == {calls[5]: "[800] 시스템 점검"}
+    assert execution.pending == [] and execution.error is None
+
+
+@pytest.mark.asyncio
+async def test_execute_stops_on_limit_error_and_keeps_results():
+    async def get_alot_matter(corp_code, **params):
+        if corp_code >= "00000004":
+            raise DartLimitError("020", "요청 제한을 초과하였습니다.")
+        return {"corp_code": corp_code}
+
+    class Client:
+        pass
+
+    client = Client()
+    client.get_alot_matter = get_alot_matter
+    calls = [PlannedCall.of("get_alot_matter", corp_code=f"{i:08d}") for i in range(10)]
+    execution = await RefreshPlanner(client).execute(QueryPlan("20240311", "20240315", calls), concurrency=1)
+
+    assert [call for call, _ in execution.results] == calls[:4]
+    assert execution.pending == calls[4:]
+    assert isinstance(execution.error, DartLimitError)
@@ -0,0 +1,98 @@
+"""
+Tests for ClientPool: one client per event loop, shared limiter and caches, clean shutdown.
+"""
+import asyncio
+import gc
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from dart_client import DartNoDataError
+from dart_client.coverage import CoverageIndex
+from dart_client.pool import ClientPool
+
+NO_DATA = {"status": "013", "message": "조회된 데이타가 없습니다."}
+
+
+def handler(request):
+    if request.url.params["bsns_year"] == "2000":
+        return httpx.Response(200, json=NO_DATA)
+    return httpx.Response(200, json={"status": "000", "message": "정상", "list": []})
+
+
+def get_client(pool):
+    client = pool.get()
+    if not isinstance(client.client._transport, httpx.MockTransport):
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_one_client_per_loop_with_shared_state(tmp_path, caplog):
+    coverage = CoverageIndex(tmp_path / "coverage.sqlite")
+    pool = ClientPool(api_key="test_key", requests_per_minute=10_000, coverage=coverage)
+    clients = []
+    lock = threading.Lock()
+
+    def worker(i):
+        async def main():
+            client = get_client(pool)
+            assert pool.get() is client
+            with lock:
+                clients.append(client)
+            params = {"corp_code": f"{i:08d}", "bsns_year": "2000", "reprt_code": "11011"}
+            with pytest.raises(DartNoDataError):
+                await client.get_fnltt_singl_acnt(**params)
+            return client.limiter, client.coverage
+        return asyncio.run(main())
+
+    with caplog.at_level(logging.WARNING, logger="dart_client"):
+        with ThreadPoolExecutor(4) as threads:
+            shared = list(threads.map(worker, range(8)))
+        pool.close()
+        del clients[:]
+        gc.collect()
+
+    assert {id(limiter) for limiter, _ in shared} == {id(pool.limiter)}
+    assert all(c is coverage for _, c in shared)
+    assert coverage.stats() == {"data": 0, "empty": 8}
+    # Every loop's client was closed as its asyncio.run() shut down
+    assert len(pool) == 0
+    assert "was not closed" not in caplog.text
+
+
+def test_aclose_and_close_from_another_thread():
+    pool = ClientPool(api_key="test_key")
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    try:
+        async def get():
+            return pool.get()
+
+        client = asyncio.run_coroutine_threadsafe(get(), loop).result()
+        assert len(pool) == 1
+        pool.close()
+        assert client.client.is_closed
+        assert len(pool) == 0
+
+        with pytest.raises(RuntimeError):
+            asyncio.run_coroutine_threadsafe(get(), loop).result()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_aclose_replaces_client_on_next_get():
+    pool = ClientPool(api_key="test_key")
+    first = pool.get()
+    await pool.aclose()
+    assert first.client.is_closed
+    second = pool.get()
+    assert second is not first
+    await pool.aclose()
+    assert len(pool) == 0
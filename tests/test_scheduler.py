@@ -0,0 +1,187 @@
+"""
+Tests for the priority and per-tag fair-share scheduler in front of the rate limiter.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from dart_client import DartAPIClient, DartLimitError, DartQuotaError
+from dart_client.jobs import BackfillJob
+from dart_client.scheduler import Priority, PriorityScheduler, current_priority, request_priority, request_tag
+
+
+class TokenLimiter:
+    """Limiter that lets one request through per token released by the test."""
+
+    def __init__(self):
+        self.tokens = asyncio.Semaphore(0)
+
+    def release(self, n: int) -> None:
+        for _ in range(n):
+            self.tokens.release()
+
+    async def __aenter__(self):
+        await self.tokens.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+async def queue_requests(scheduler, priorities, granted):
+    async def request(i, priority):
+        await scheduler.acquire(priority)
+        granted.append((priority, i))
+
+    tasks = [asyncio.ensure_future(request(i, p)) for i, p in enumerate(priorities)]
+    await asyncio.sleep(0)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_strict_serves_urgent_classes_first():
+    limiter = TokenLimiter()
+    scheduler = PriorityScheduler(limiter)
+    granted = []
+    tasks = await queue_requests(scheduler, [Priority.BACKGROUND] * 3 + [Priority.INTERACTIVE] * 2, granted)
+    assert scheduler.stats()["background"].depth == 3
+
+    limiter.release(2)
+    await asyncio.sleep(0.01)
+    assert granted == [(Priority.INTERACTIVE, 3), (Priority.INTERACTIVE, 4)]
+
+    # A late interactive request still overtakes the queued background ones
+    tasks += await queue_requests(scheduler, [Priority.INTERACTIVE], granted)
+    limiter.release(4)
+    await asyncio.gather(*tasks)
+    assert [p for p, _ in granted] == [Priority.INTERACTIVE] * 3 + [Priority.BACKGROUND] * 3
+    stats = scheduler.stats()
+    assert stats["interactive"].granted == 3 and stats["background"].max_depth == 3 and stats["background"].depth == 0
+
+
+@pytest.mark.asyncio
+async def test_weighted_shares_capacity():
+    limiter = TokenLimiter()
+    scheduler = PriorityScheduler(limiter, mode="weighted", weights={Priority.INTERACTIVE: 3, Priority.BACKGROUND: 1})
+    granted = []
+    tasks = await queue_requests(scheduler, [Priority.BACKGROUND] * 8 + [Priority.INTERACTIVE] * 8, granted)
+    limiter.release(8)
+    await asyncio.sleep(0.01)
+    assert [p for p, _ in granted].count(Priority.INTERACTIVE) == 6
+    limiter.release(8)
+    await asyncio.gather(*tasks)
+
+    with pytest.raises(ValueError):
+        PriorityScheduler(limiter, mode="fifo")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_are_skipped():
+    limiter = TokenLimiter()
+    scheduler = PriorityScheduler(limiter)
+    granted = []
+    tasks = await queue_requests(scheduler, [Priority.INTERACTIVE, Priority.DEFAULT], granted)
+    tasks[0].cancel()
+    limiter.release(1)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert granted == [(Priority.DEFAULT, 1)]
+    assert scheduler.stats()["interactive"].depth == 0
+
+
+@pytest.mark.asyncio
+async def test_client_requests_use_context_priority():
+    def handler(request):
+        return httpx.Response(200, json={"status": "000", "message": "정상", "corp_code": "00126380"})
+
+    scheduler = PriorityScheduler(TokenLimiter())
+    scheduler.limiter.release(100)
+    client = DartAPIClient(api_key="test_key", scheduler=scheduler)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        assert current_priority() is Priority.DEFAULT
+        with request_priority(Priority.INTERACTIVE):
+            await client.get_company(corp_code="00126380")
+        await client.get_company(corp_code="00126380")
+
+        job = BackfillJob(client)
+        job.add_matrix(["00126380"], [2023], methods=["get_alot_matter"])
+        await job.run()
+
+    stats = scheduler.stats()
+    assert (stats["interactive"].granted, stats["default"].granted, stats["background"].granted) == (1, 1, 4)
+    assert client.limiter is scheduler.limiter
+
+
+@pytest.mark.asyncio
+async def test_tags_share_a_class_fairly():
+    limiter = TokenLimiter()
+    scheduler = PriorityScheduler(limiter, tag_weights={"team": 3})
+    granted = []
+
+    async def request(tag):
+        with request_tag(tag):
+            await scheduler.acquire()
+        granted.append(tag)
+
+    # A runaway notebook queues first, the team's calls still get their share
+    tasks = [asyncio.ensure_future(request("notebook")) for _ in range(20)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.ensure_future(request("team")) for _ in range(6)]
+    await asyncio.sleep(0)
+    limiter.release(8)
+    await asyncio.sleep(0.01)
+    assert granted.count("team") == 6
+    limiter.release(18)
+    await asyncio.gather(*tasks)
+    assert scheduler.tag_stats()["notebook"].calls == 20
+
+
+@pytest.mark.asyncio
+async def test_tag_quota():
+    limiter = TokenLimiter()
+    limiter.release(100)
+    scheduler = PriorityScheduler(limiter, quotas={"notebook": 3})
+
+    async def request(tag):
+        with request_tag(tag):
+            await scheduler.acquire()
+
+    results = await asyncio.gather(*(request("notebook") for _ in range(5)), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    assert len(errors) == 2 and all(isinstance(e, DartQuotaError) and isinstance(e, DartLimitError) for e in errors)
+    with pytest.raises(DartQuotaError):
+        await request("notebook")
+    await request("team")  # other tags are not affected
+
+    assert scheduler.quota_remaining("notebook") == 0 and scheduler.quota_remaining("team") is None
+    stats = scheduler.tag_stats()
+    assert (stats["notebook"].calls, stats["notebook"].rejected, stats["team"].calls) == (3, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_client_counts_usage_per_tag_and_quota_stops_backfill():
+    body = {"status": "000", "message": "정상", "corp_code": "00126380"}
+
+    def handler(request):
+        return httpx.Response(200, json=body)
+
+    scheduler = PriorityScheduler(TokenLimiter(), quotas={"notebook": 5})
+    scheduler.limiter.release(100)
+    client = DartAPIClient(api_key="test_key", scheduler=scheduler)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        with request_tag("team"):
+            await client.get_company(corp_code="00126380")
+            await client.get_company(corp_code="00126380")
+
+        job = BackfillJob(client, concurrency=2, tag="notebook")
+        job.add_matrix(["00126380"], [2022, 2023], methods=["get_alot_matter"])
+        with pytest.raises(DartQuotaError):
+            await job.run()
+        assert job.progress().data == 5 and job.progress().pending == 3
+
+    stats = scheduler.tag_stats()
+    assert stats["team"].calls == stats["team"].responses == 2
+    assert stats["team"].bytes == 2 * len(httpx.Response(200, json=body).content)
+    assert stats["team"].latency_avg > 0
+    assert stats["notebook"].calls == 5
@@ -0,0 +1,93 @@
+"""
+Tests for the blocking client, its thread-safe limiter and thread-pool fan-out.
+"""
+import threading
+import time
+
+import httpx
+import pytest
+
+from dart_client import DartNoDataError, SyncDartAPIClient
+from dart_client.generated import GeneratedDartAPIMixin, GeneratedSyncDartAPIMixin
+from dart_client.limiter import ThreadSafeLimiter
+
+NO_DATA = {"status": "013", "message": "조회된 데이타가 없습니다."}
+
+
+def make_client(handler, **kwargs) -> SyncDartAPIClient:
+    client = SyncDartAPIClient(api_key="test_key", requests_per_minute=10_000, **kwargs)
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def company_handler(request):
+    corp_code = request.url.params["corp_code"]
+    if corp_code == "99999999":
+        return httpx.Response(200, json=NO_DATA)
+    return httpx.Response(200, json={"status": "000", "message": "정상", "corp_code": corp_code, "corp_name": "X"})
+
+
+def test_sync_mixin_mirrors_async_methods():
+    def methods(cls):
+        return {name for name in vars(cls) if not name.startswith("_")}
+
+    assert methods(GeneratedSyncDartAPIMixin) == methods(GeneratedDartAPIMixin)
+
+
+def test_generated_method_and_errors():
+    with make_client(company_handler) as client:
+        company = client.get_company(corp_code="00126380")
+        assert company.corp_code == "00126380"
+        with pytest.raises(DartNoDataError):
+            client.get_company(corp_code="99999999")
+
+
+def test_fs_div_auto_falls_back_and_learns():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["fs_div"])
+        if request.url.params["fs_div"] == "CFS":
+            return httpx.Response(200, json=NO_DATA)
+        return httpx.Response(200, json={"status": "000", "message": "정상", "list": [{"rcept_no": "1"}]})
+
+    with make_client(handler) as client:
+        client.get_fnltt_singl_acnt_all("00000001", "2023", "11011")
+        client.get_fnltt_singl_acnt_all("00000001", "2023", "11011")
+    assert calls == ["CFS", "OFS", "OFS"]
+
+
+def test_map_keeps_order_and_collects_exceptions():
+    corp_codes = [f"{i:08d}" for i in range(20)] + ["99999999"]
+    with make_client(company_handler) as client:
+        results = client.map(
+            "get_company", [{"corp_code": c} for c in corp_codes], max_workers=4, return_exceptions=True
+        )
+        assert [r.corp_code for r in results[:-1]] == corp_codes[:-1]
+        assert isinstance(results[-1], DartNoDataError)
+
+        with pytest.raises(DartNoDataError):
+            client.map(client.get_company, [{"corp_code": c} for c in corp_codes])
+
+
+def test_limiter_bounds_rate_across_threads():
+    limiter = ThreadSafeLimiter(max_rate=10, time_period=0.5)
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)]) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 30 acquisitions: a burst of 10, then 20 more at 20/s
+    assert time.monotonic() - start >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_limiter_async_context_manager():
+    limiter = ThreadSafeLimiter(max_rate=2, time_period=0.2)
+    start = time.monotonic()
+    for _ in range(4):
+        async with limiter:
+            pass
+    assert time.monotonic() - start >= 0.18
+    assert not limiter.has_capacity(2)
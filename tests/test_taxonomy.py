@@ -0,0 +1,101 @@
+"""
+Tests for the XBRL taxonomy snapshot.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dart_client import DartAPIClient
+from dart_client.errors import DartAPIError, DartNoDataError
+from dart_client.taxonomy import Taxonomy, get_taxonomy, refresh_taxonomy
+
+ROWS = {
+    "BS1": [
+        {"sj_div": "BS1", "account_id": "ifrs-full_CurrentAssets", "account_nm": "유동자산",
+         "label_kor": "유동자산", "label_eng": "Current assets"},
+        {"sj_div": "BS1", "account_id": "ifrs-full_Assets", "account_nm": "자산총계",
+         "label_kor": "자산총계", "label_eng": "Total assets"},
+    ],
+    "BS2": [
+        {"sj_div": "BS2", "account_id": "ifrs-full_Assets", "account_nm": "자산총계",
+         "label_kor": "자산총계", "label_eng": "Total assets"},
+    ],
+}
+
+
+def taxonomy_response(sj_div):
+    if sj_div not in ROWS:
+        raise DartNoDataError("013", "조회된 데이타가 없습니다.")
+    return {"status": "000", "message": "정상", "list": ROWS[sj_div]}
+
+
+@pytest.fixture
+def client():
+    client = DartAPIClient(api_key="test_key")
+    client.get_xbrl_taxonomy = AsyncMock(side_effect=taxonomy_response)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_refresh_writes_snapshot_and_indexes(client, tmp_path):
+    path = tmp_path / "taxonomy.json"
+    refreshed = await refresh_taxonomy(client, path, sj_divs=["BS1", "BS2", "BS3"])
+
+    assert client.get_xbrl_taxonomy.await_count == 3
+    loaded = Taxonomy.load(path)
+    for taxonomy in (refreshed, loaded):
+        assert taxonomy.sj_divs == ["BS1", "BS2"]
+        assert len(taxonomy) == 3
+        assert "ifrs-full_Assets" in taxonomy
+        assert taxonomy.label("ifrs-full_CurrentAssets", lang="eng") == "Current assets"
+        assert taxonomy.get("ifrs-full_Assets", sj_div="BS2")["sj_div"] == "BS2"
+        assert len(taxonomy.by_account_id["ifrs-full_Assets"]) == 2
+        assert taxonomy.get("unknown") is None
+        assert [row["account_id"] for row in taxonomy.accounts("BS1")] == [
+            "ifrs-full_CurrentAssets", "ifrs-full_Assets",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_default_snapshot_is_loaded_once(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("DART_CLIENT_CACHE_DIR", str(tmp_path))
+    await refresh_taxonomy(client, sj_divs=["BS1"])
+
+    first = get_taxonomy()
+    assert first is get_taxonomy()
+    assert first.label("ifrs-full_Assets") == "자산총계"
+
+    # A refresh replaces the shared instance
+    await refresh_taxonomy(client, sj_divs=["BS1", "BS2"])
+    assert get_taxonomy() is not first
+    assert get_taxonomy().sj_divs == ["BS1", "BS2"]
+
+
+def test_missing_snapshot_explains_refresh(tmp_path):
+    with pytest.raises(FileNotFoundError, match="dart_client.taxonomy refresh"):
+        Taxonomy.load(tmp_path / "missing.json")
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_snapshot(client, tmp_path, monkeypatch):
+    path = tmp_path / "taxonomy.json"
+    await refresh_taxonomy(client, path, sj_divs=["BS1", "BS2"])
+    before = path.read_bytes()
+
+    # BS2 comes back without rows: the refresh is incomplete
+    monkeypatch.delitem(ROWS, "BS2")
+    with pytest.raises(DartAPIError, match="BS2"):
+        await refresh_taxonomy(client, path, sj_divs=["BS1", "BS2"])
+    monkeypatch.delitem(ROWS, "BS1")
+    with pytest.raises(DartAPIError, match="every statement form"):
+        await refresh_taxonomy(client, tmp_path / "new.json", sj_divs=["BS1", "BS2"])
+    assert path.read_bytes() == before
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.asyncio
+async def test_refreshing_some_forms_keeps_the_others(client, tmp_path):
+    path = tmp_path / "taxonomy.json"
+    await refresh_taxonomy(client, path, sj_divs=["BS1", "BS2"])
+    refreshed = await refresh_taxonomy(client, path, sj_divs=["BS1"])
+    assert refreshed.sj_divs == Taxonomy.load(path).sj_divs == ["BS1", "BS2"]
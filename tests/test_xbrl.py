@@ -0,0 +1,98 @@
+"""
+Tests for the streaming XBRL instance parser.
+"""
+import io
+import zipfile
+
+from dart_client.xbrl import XbrlInstanceParser, iter_archive_facts, parse_archives
+
+INSTANCE = """<?xml version="1.0" encoding="UTF-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"
+            xmlns:link="http://www.xbrl.org/2003/linkbase"
+            xmlns:xlink="http://www.w3.org/1999/xlink"
+            xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+            xmlns:xbrldi="http://xbrl.org/2006/xbrldi"
+            xmlns:iso4217="http://www.xbrl.org/2003/iso4217"
+            xmlns:ifrs-full="http://xbrl.ifrs.org/taxonomy/2021-03-24/ifrs-full"
+            xmlns:dart="http://dart.fss.or.kr/taxonomy/2021-06-30/dart">
+  <link:schemaRef xlink:type="simple" xlink:href="entity00126380_2023-12-31.xsd"/>
+  <xbrli:context id="CFY2023eFY_ifrs-full_ConsolidatedMember">
+    <xbrli:entity>
+      <xbrli:identifier scheme="http://dart.fss.or.kr">00126380</xbrli:identifier>
+      <xbrli:segment>
+        <xbrldi:explicitMember dimension="ifrs-full:ConsolidatedAndSeparateFinancialStatementsAxis"
+          >ifrs-full:ConsolidatedMember</xbrldi:explicitMember>
+      </xbrli:segment>
+    </xbrli:entity>
+    <xbrli:period><xbrli:instant>2023-12-31</xbrli:instant></xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="CFY2023dFY">
+    <xbrli:entity><xbrli:identifier scheme="http://dart.fss.or.kr">00126380</xbrli:identifier></xbrli:entity>
+    <xbrli:period><xbrli:startDate>2023-01-01</xbrli:startDate><xbrli:endDate>2023-12-31</xbrli:endDate></xbrli:period>
+  </xbrli:context>
+  <xbrli:unit id="KRW"><xbrli:measure>iso4217:KRW</xbrli:measure></xbrli:unit>
+  <xbrli:unit id="KRWPerShare">
+    <xbrli:divide>
+      <xbrli:unitNumerator><xbrli:measure>iso4217:KRW</xbrli:measure></xbrli:unitNumerator>
+      <xbrli:unitDenominator><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unitDenominator>
+    </xbrli:divide>
+  </xbrli:unit>
+  <ifrs-full:CurrentAssets contextRef="CFY2023eFY_ifrs-full_ConsolidatedMember" unitRef="KRW"
+    decimals="-6">195936557000000</ifrs-full:CurrentAssets>
+  <ifrs-full:Revenue contextRef="CFY2023dFY" unitRef="KRW" decimals="-6">258935494000000</ifrs-full:Revenue>
+  <ifrs-full:BasicEarningsLossPerShare contextRef="CFY2023dFY" unitRef="KRWPerShare"
+    decimals="0">2131</ifrs-full:BasicEarningsLossPerShare>
+  <dart:OtherExpenses contextRef="CFY2023dFY" unitRef="KRW" xsi:nil="true"/>
+  <dart:DocumentTitle contextRef="CFY2023dFY">사업보고서</dart:DocumentTitle>
+</xbrli:xbrl>
+""".encode()
+
+
+def make_archive(path=None):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("entity00126380_2023-12-31.xbrl", INSTANCE)
+        zf.writestr("entity00126380_2023-12-31.xsd", b"<schema/>")
+    if path is None:
+        return buffer.getvalue()
+    path.write_bytes(buffer.getvalue())
+    return path
+
+
+def test_facts_contexts_and_units():
+    parser = XbrlInstanceParser(batch_size=2)
+    batches = list(parser.iter_batches(io.BytesIO(INSTANCE)))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    rows = [row for batch in batches for row in batch.rows()]
+    assert rows[0] == (
+        "ifrs-full_CurrentAssets", "CFY2023eFY_ifrs-full_ConsolidatedMember", "KRW", "-6", "195936557000000",
+    )
+    assert rows[3] == ("dart_OtherExpenses", "CFY2023dFY", "KRW", None, None)
+    assert rows[4][0] == "dart_DocumentTitle" and rows[4][4] == "사업보고서"
+
+    consolidated = parser.contexts["CFY2023eFY_ifrs-full_ConsolidatedMember"]
+    assert consolidated.is_instant and consolidated.end_date == "2023-12-31"
+    assert consolidated.entity == "00126380"
+    assert consolidated.dimensions == (
+        ("ifrs-full_ConsolidatedAndSeparateFinancialStatementsAxis", "ifrs-full_ConsolidatedMember"),
+    )
+    duration = parser.contexts["CFY2023dFY"]
+    assert (duration.start_date, duration.end_date) == ("2023-01-01", "2023-12-31")
+    assert parser.units == {"KRW": "iso4217:KRW", "KRWPerShare": "iso4217:KRW/xbrli:shares"}
+
+
+def test_archive_bytes_only_reads_instances():
+    results = list(iter_archive_facts(make_archive()))
+    assert {name for name, _ in results} == {"entity00126380_2023-12-31.xbrl"}
+    assert sum(len(batch) for _, batch in results) == 5
+
+
+def test_parse_archives_in_process_pool(tmp_path):
+    paths = [make_archive(tmp_path / f"{i}.zip") for i in range(3)]
+    facts = {}
+    for path, member, batch in parse_archives(paths, max_workers=2, batch_size=2, spool_dir=tmp_path):
+        assert member == "entity00126380_2023-12-31.xbrl" and len(batch) <= 2
+        facts[path] = facts.get(path, 0) + len(batch)
+    assert facts == dict.fromkeys(paths, 5)
+    assert sorted(tmp_path.iterdir()) == sorted(paths)  # spool files removed